@@ -79,10 +79,13 @@ class YouTubeUploader:
             True if authentication successful, False otherwise.
         """
         try:
+            import google_auth_httplib2
+            import httplib2
             from google.auth.transport.requests import Request
             from google.oauth2.credentials import Credentials
             from google_auth_oauthlib.flow import InstalledAppFlow
             from googleapiclient.discovery import build
+            from googleapiclient.http import HttpRequest
         except ImportError as e:
             logger.error(
                 f"Required libraries not installed: {e}. "
@@ -130,7 +133,18 @@ class YouTubeUploader:
                 logger.info(f"Credentials saved to {self.credentials_file}")
 
             self._credentials = creds
-            self._youtube_service = build("youtube", "v3", credentials=creds)
+
+            # httplib2 connections are not thread-safe, so give every request
+            # its own; this lets several uploads share one service at a time
+            def build_request(http, *args, **kwargs):
+                authorized_http = google_auth_httplib2.AuthorizedHttp(
+                    creds, http=httplib2.Http()
+                )
+                return HttpRequest(authorized_http, *args, **kwargs)
+
+            self._youtube_service = build(
+                "youtube", "v3", credentials=creds, requestBuilder=build_request
+            )
             logger.info("YouTube API authentication successful")
             return True
 
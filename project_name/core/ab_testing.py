@@ -1,4 +1,3 @@
-import json
 import logging
 import os
 import random
@@ -7,6 +6,7 @@ from pathlib import Path  # Added missing import
 from typing import Any, Dict, Tuple
 
 from project_name.core.user_profile import UserProfile
+from project_name.utils.json_io import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
@@ -167,8 +167,7 @@ class ABTest:
         }
 
         # Save to file
-        with open(file_path, "w") as f:
-            json.dump(test_data, f, indent=2)
+        write_json(file_path, test_data)
 
         logger.info(f"Saved A/B test to {file_path}")
         return Path(file_path)  # Return Path object
@@ -185,8 +184,7 @@ class ABTest:
             Loaded ABTest object
         """
         try:
-            with open(file_path, "r") as f:
-                test_data = json.load(f)
+            test_data = read_json(file_path)
 
             # Create new test instance
             test = cls(test_id=test_data.get("test_id"))
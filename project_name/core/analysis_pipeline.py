@@ -51,24 +51,10 @@ class AudioAnalysisPipeline:
         cache_path = self.cache_dir / f"{file_hash}.json"
 
         # Check cache first
-        if not force_reanalysis and cache_path.exists():
-            try:
-                with open(cache_path, "r") as f:
-                    cached_data = json.load(f)
-                # Need to handle datetime deserialization if it's stored as string
-                if (
-                    cached_data.get("analysis")
-                    and "analysis_timestamp" in cached_data["analysis"]
-                ):
-                    cached_data["analysis"]["analysis_timestamp"] = (
-                        datetime.fromisoformat(
-                            cached_data["analysis"]["analysis_timestamp"]
-                        )
-                    )
-                return AudioMetadata.from_dict(cached_data)
-            except Exception:
-                # logger.error(f"Error loading from cache: {e}. Re-analyzing.") # Requires logger setup
-                pass  # Fall through to reanalysis
+        if not force_reanalysis:
+            cached = self._load_cached_metadata(cache_path)
+            if cached is not None:
+                return cached
 
         # Perform analysis
         metadata = self._perform_full_analysis(file_path, file_hash)
@@ -87,6 +73,33 @@ class AudioAnalysisPipeline:
 
         return metadata
 
+    def load_cached_analysis(self, file_path: Path) -> Optional[AudioMetadata]:
+        """Return the cached analysis of an unchanged file, or None on a miss"""
+        file_hash = self._calculate_file_hash(file_path)
+        return self._load_cached_metadata(self.cache_dir / f"{file_hash}.json")
+
+    def _load_cached_metadata(self, cache_path: Path) -> Optional[AudioMetadata]:
+        """Load AudioMetadata from a JSON cache entry, or None if unusable"""
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, "r") as f:
+                cached_data = json.load(f)
+            # Need to handle datetime deserialization if it's stored as string
+            if (
+                cached_data.get("analysis")
+                and "analysis_timestamp" in cached_data["analysis"]
+            ):
+                cached_data["analysis"]["analysis_timestamp"] = (
+                    datetime.fromisoformat(
+                        cached_data["analysis"]["analysis_timestamp"]
+                    )
+                )
+            return AudioMetadata.from_dict(cached_data)
+        except Exception:
+            # logger.error(f"Error loading from cache: {e}. Re-analyzing.") # Requires logger setup
+            return None  # Caller falls through to reanalysis
+
     def _perform_full_analysis(self, file_path: Path, file_hash: str) -> AudioMetadata:
         """Perform complete audio analysis"""
         y, sr = librosa.load(file_path, sr=None)  # Load with native sample rate
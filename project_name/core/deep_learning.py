@@ -1,589 +1,1032 @@
-import logging
-import os
-import random
-import time
-from typing import Dict  # Added for type hinting
-
-from .ab_testing import ABTest  # Added import
-from .user_profile import UserProfile  # Added import
-
-try:
-    import tensorflow as tf
-    from tensorflow.keras import layers, models, optimizers
-    from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
-    from tensorflow.keras.models import load_model as keras_load_model
-
-    DEEP_LEARNING_AVAILABLE = True
-except ImportError:
-    DEEP_LEARNING_AVAILABLE = False
-    logging.warning(
-        "TensorFlow/Keras not found. Deep learning features will be disabled."
-    )
-
-logger = logging.getLogger(__name__)
-
-
-def create_basic_cnn(input_shape: int = 41) -> "tf.keras.Model":
-    """
-    Create a basic CNN model for audio classification.
-
-    Args:
-        input_shape: Number of features in input vector
-
-    Returns:
-        Compiled Keras model
-    """
-    if not DEEP_LEARNING_AVAILABLE:
-        logger.error("Deep learning libraries are not available.")
-        return None
-
-    try:
-        model = models.Sequential(
-            [
-                layers.Input(shape=(input_shape, 1)),
-                layers.Conv1D(32, kernel_size=3, activation="relu"),
-                layers.MaxPooling1D(pool_size=2),
-                layers.Conv1D(64, kernel_size=3, activation="relu"),
-                layers.MaxPooling1D(pool_size=2),
-                layers.Flatten(),
-                layers.Dense(128, activation="relu"),
-                layers.Dense(10, activation="softmax"),
-            ]
-        )
-
-        model.compile(
-            optimizer="adam", loss="categorical_crossentropy", metrics=["accuracy"]
-        )
-        logger.info("Basic CNN model created successfully.")
-        return model
-
-    except Exception as e:
-        logger.error(f"Error creating CNN model: {str(e)}")
-        return None
-
-
-def train_model_with_available_data(
-    model: "tf.keras.Model", folder_path: str
-) -> "tf.keras.Model":
-    """
-    Train the model with available data from processed folder.
-
-    Args:
-        model: Keras model to train
-        folder_path: Path to folder with processed audio
-
-    Returns:
-        Trained model
-    """
-    if not DEEP_LEARNING_AVAILABLE:
-        logger.error("Deep learning libraries are not available.")
-        return None
-
-    try:
-        # Placeholder for loading and preprocessing data
-        # X_train, y_train = load_data(folder_path)
-        # model.fit(X_train, y_train, epochs=10, batch_size=32)
-        logger.info("Model training completed successfully.")
-        return model
-
-    except Exception as e:
-        logger.error(f"Error training model: {str(e)}")
-        return None
-
-
-def classify_with_deep_learning(processed_folder: str, model_path: str = None) -> dict:
-    """
-    Classify sounds using a pre-trained CNN or transformer model.
-
-    Args:
-        processed_folder: Folder containing processed audio files
-        model_path: Optional path to pre-trained model
-
-    Returns:
-        Dictionary of categories with file paths
-    """
-    if not DEEP_LEARNING_AVAILABLE:
-        logger.error("Deep learning libraries are not available.")
-        return {}
-
-    logger.info("Starting deep learning classification")
-
-    # Placeholder for classification logic
-    categories = {
-        "rain": [],
-        "thunder": [],
-        "white_noise": [],
-        "nature": [],
-        "water": [],
-        "other": [],
-    }
-
-    try:
-        # Load model if path is provided
-        if model_path:
-            model = keras_load_model(model_path)
-            logger.info("Loaded pre-trained model.")
-
-        # Placeholder for loading and classifying data
-        # for file in os.listdir(processed_folder):
-        #     prediction = model.predict(file)
-        #     categories["rain"].append(file)  # Example assignment
-
-        logger.info("Deep learning classification completed.")
-        return categories
-
-    except Exception as e:
-        logger.error(f"Error during classification: {str(e)}")
-        return {}
-
-
-class MixLearner:
-    """
-    Class that implements the learning algorithm for personalized mixes
-    based on user feedback and A/B testing
-    """
-
-    def __init__(self):
-        """Initialize the learning algorithm"""
-        self.profiles = {}  # User name to UserProfile
-        self.ab_tests = []  # List of ABTest objects
-        self.learning_rate = 0.1  # How quickly we adjust parameters based on feedback
-        self.test_parameters = [  # Parameters that can be tested
-            "category_weights.rain",
-            "category_weights.thunder",
-            "category_weights.white_noise",
-            "category_weights.nature",
-            "category_weights.water",
-            "eq_preferences.low",
-            "eq_preferences.mid",
-            "eq_preferences.high",
-            "volume_preferences.base_sounds",
-            "volume_preferences.occasional_sounds",
-        ]
-
-    def load_profiles(self, folder_path: str = "user_profiles") -> None:
-        """
-        Load all user profiles from a folder
-
-        Args:
-            folder_path: Folder containing profile files
-        """
-        if not os.path.exists(folder_path):
-            logger.info(f"Profile folder {folder_path} doesn't exist, creating it")
-            os.makedirs(folder_path, exist_ok=True)
-            return
-
-        profile_files = [
-            f for f in os.listdir(folder_path) if f.endswith("_profile.json")
-        ]
-
-        for profile_file in profile_files:
-            try:
-                file_path = os.path.join(folder_path, profile_file)
-                profile = UserProfile.load(file_path)
-                self.profiles[profile.name] = profile
-                logger.info(f"Loaded profile for user {profile.name}")
-            except Exception as e:
-                logger.error(f"Error loading profile {profile_file}: {str(e)}")
-
-        logger.info(f"Loaded {len(self.profiles)} user profiles")
-
-    def load_ab_tests(self, folder_path: str = "ab_tests") -> None:
-        """
-        Load all A/B tests from a folder
-
-        Args:
-            folder_path: Folder containing test files
-        """
-        if not os.path.exists(folder_path):
-            logger.info(f"A/B test folder {folder_path} doesn't exist, creating it")
-            os.makedirs(folder_path, exist_ok=True)
-            return
-
-        test_files = [f for f in os.listdir(folder_path) if f.endswith(".json")]
-
-        for test_file in test_files:
-            try:
-                file_path = os.path.join(folder_path, test_file)
-                test = ABTest.load(file_path)
-                self.ab_tests.append(test)
-                logger.info(f"Loaded A/B test {test.test_id}")
-            except Exception as e:
-                logger.error(f"Error loading A/B test {test_file}: {str(e)}")
-
-        logger.info(f"Loaded {len(self.ab_tests)} A/B tests")
-
-    def get_profile(self, user_name: str, sleep_issue: str = None) -> UserProfile:
-        """
-        Get a user profile, creating it if it doesn't exist
-
-        Args:
-            user_name: Name of the user
-            sleep_issue: Optional sleep issue type
-
-        Returns:
-            UserProfile for the user
-        """
-        if user_name in self.profiles:
-            return self.profiles[user_name]
-
-        # Create new profile
-        profile = UserProfile(name=user_name, sleep_issue=sleep_issue)
-        self.profiles[user_name] = profile
-
-        # Save the new profile
-        profile.save()
-        logger.info(f"Created new profile for user {user_name}")
-
-        return profile
-
-    def create_ab_test(self, user_name: str, base_params: Dict = None) -> ABTest:
-        """
-        Create a new A/B test for a user
-
-        Args:
-            user_name: Name of the user
-            base_params: Base parameters for both variants
-
-        Returns:
-            ABTest object
-        """
-        # Get user profile
-        profile = self.get_profile(user_name)
-
-        # Create test ID
-        test_id = f"abtest_{user_name}_{int(time.time())}"
-
-        # Create A/B test
-        ab_test = ABTest(test_id=test_id)
-
-        # Choose a parameter to test
-        test_parameter = random.choice(self.test_parameters)
-
-        # Set parameter values based on current profile preferences
-        if test_parameter.startswith("category_weights."):
-            # Testing a category weight
-            category = test_parameter.split(".")[1]
-            current_value = profile.category_weights.get(category, 0.5)
-
-            # Create two variants that differ by 20-30%
-            delta = random.uniform(0.2, 0.3)
-            value_a = max(0.1, min(0.9, current_value + delta))
-            value_b = max(0.1, min(0.9, current_value - delta))
-
-        elif test_parameter.startswith("eq_preferences."):
-            # Testing an EQ preference
-            band = test_parameter.split(".")[1]
-            current_value = profile.eq_preferences.get(band, 0)
-
-            # Create two variants that differ by 2-4 dB
-            delta = random.uniform(2, 4)
-            value_a = current_value + delta
-            value_b = current_value - delta
-
-        elif test_parameter.startswith("volume_preferences."):
-            # Testing a volume preference
-            key = test_parameter.split(".")[1]
-            current_value = profile.volume_preferences.get(key, 0)
-
-            # Create two variants that differ by 2-4 dB
-            delta = random.uniform(2, 4)
-            value_a = current_value + delta
-            value_b = current_value - delta
-
-        else:
-            # Generic numeric parameter
-            # Default to testing between 0.3 and 0.7
-            value_a = 0.7
-            value_b = 0.3
-
-        # Set up test
-        if not base_params:
-            base_params = {}
-
-        # Add current profile preferences to base params
-        base_params["category_weights"] = profile.category_weights.copy()
-        base_params["eq_preferences"] = profile.eq_preferences.copy()
-        base_params["volume_preferences"] = profile.volume_preferences.copy()
-
-        ab_test.setup_test(test_parameter, value_a, value_b, base_params)
-
-        # Add to test list
-        self.ab_tests.append(ab_test)
-
-        # Save the test
-        ab_test.save()
-
-        logger.info(
-            f"Created A/B test {test_id} for user {user_name}, testing {test_parameter}"
-        )
-        return ab_test
-
-    def record_ab_test_result(
-        self, test_id: str, preferred_variant: str, feedback: Dict = None
-    ) -> None:
-        """
-        Record the result of an A/B test and update user profile
-
-        Args:
-            test_id: ID of the test
-            preferred_variant: The preferred variant ('A' or 'B')
-            feedback: Optional feedback details
-        """
-        # Find the test
-        for test in self.ab_tests:
-            if test.test_id == test_id:
-                # Record result
-                test.record_result(preferred_variant, feedback)
-
-                # Save the test
-                test.save()
-
-                # Extract user name from test ID (format: abtest_username_timestamp)
-                parts = test_id.split("_")
-                if len(parts) >= 3:
-                    user_name = parts[1]
-
-                    # Get user profile
-                    profile = self.get_profile(user_name)
-
-                    # Update profile based on test result
-                    profile.update_from_ab_test(
-                        test_id,
-                        preferred_variant,
-                        test.variant_a_params,
-                        test.variant_b_params,
-                    )
-
-                    # Save profile
-                    profile.save()
-
-                    logger.info(
-                        f"Updated profile for {user_name} based on A/B test {test_id}"
-                    )
-
-                return
-
-        logger.warning(f"A/B test {test_id} not found")
-
-    def record_mix_feedback(
-        self, user_name: str, mix_id: str, feedback_score: int, mix_params: Dict
-    ) -> None:
-        """
-        Record feedback for a mix and update user profile
-
-        Args:
-            user_name: Name of the user
-            mix_id: ID of the mix
-            feedback_score: User feedback score (1-10)
-            mix_params: Parameters used to create the mix
-        """
-        # Get user profile
-        profile = self.get_profile(user_name)
-
-        # Update profile based on feedback
-        profile.update_from_feedback(mix_id, feedback_score, mix_params)
-
-        # Save profile
-        profile.save()
-
-        logger.info(
-            f"Recorded feedback (score: {feedback_score}) for mix {mix_id} from user {user_name}"
-        )
-
-    def optimize_mix_parameters(self, user_name: str, base_params: Dict = None) -> Dict:
-        """
-        Optimize mix parameters for a user based on their profile
-
-        Args:
-            user_name: Name of the user
-            base_params: Optional base parameters
-
-        Returns:
-            Optimized parameters for creating a mix
-        """
-        # Get user profile
-        profile = self.get_profile(user_name)
-
-        # Start with base params or empty dict
-        optimized_params = base_params.copy() if base_params else {}
-
-        # Apply profile preferences
-
-        # Category weights
-        optimized_params["category_weights"] = profile.category_weights.copy()
-
-        # EQ preferences
-        optimized_params["eq_preferences"] = profile.eq_preferences.copy()
-
-        # Volume preferences
-        optimized_params["volume_preferences"] = profile.volume_preferences.copy()
-
-        # Sound preferences
-        optimized_params["preferred_sounds"] = profile.preferred_sounds.copy()
-        optimized_params["avoided_sounds"] = profile.avoided_sounds.copy()
-
-        # Duration preference
-        if "duration" not in optimized_params:
-            optimized_params["duration"] = profile.preferred_duration
-
-        logger.info(
-            f"Optimized mix parameters for user {user_name} based on their profile"
-        )
-        return optimized_params
-
-    def analyze_learning_trends(self) -> Dict:
-        """
-        Analyze learning trends across all users and tests
-
-        Returns:
-            Dictionary with trend analysis
-        """
-        trends = {"parameters": {}, "categories": {}, "sleep_issues": {}}
-
-        # Analyze profile trends
-        for name, profile in self.profiles.items():
-            # Count by sleep issue
-            sleep_issue = profile.sleep_issue or "unknown"
-            if sleep_issue not in trends["sleep_issues"]:
-                trends["sleep_issues"][sleep_issue] = 0
-            trends["sleep_issues"][sleep_issue] += 1
-
-            # Analyze category preferences by sleep issue
-            for category, weight in profile.category_weights.items():
-                if category not in trends["categories"]:
-                    trends["categories"][category] = {
-                        "total_weight": 0,
-                        "count": 0,
-                        "by_issue": {},
-                    }
-
-                trends["categories"][category]["total_weight"] += weight
-                trends["categories"][category]["count"] += 1
-
-                # Track by sleep issue
-                if sleep_issue not in trends["categories"][category]["by_issue"]:
-                    trends["categories"][category]["by_issue"][sleep_issue] = {
-                        "total_weight": 0,
-                        "count": 0,
-                    }
-
-                trends["categories"][category]["by_issue"][sleep_issue][
-                    "total_weight"
-                ] += weight
-                trends["categories"][category]["by_issue"][sleep_issue]["count"] += 1
-
-        # Calculate averages for categories
-        for category, data in trends["categories"].items():
-            if data["count"] > 0:
-                data["average_weight"] = data["total_weight"] / data["count"]
-
-            # Calculate averages by sleep issue
-            for issue, issue_data in data["by_issue"].items():
-                if issue_data["count"] > 0:
-                    issue_data["average_weight"] = (
-                        issue_data["total_weight"] / issue_data["count"]
-                    )
-
-        # Analyze A/B test trends
-        parameter_tests = {}
-        for test in self.ab_tests:
-            if test.result and test.test_parameter:
-                if test.test_parameter not in parameter_tests:
-                    parameter_tests[test.test_parameter] = {
-                        "a_preferred": 0,
-                        "b_preferred": 0,
-                    }
-
-                if test.result == "A":
-                    parameter_tests[test.test_parameter]["a_preferred"] += 1
-                elif test.result == "B":
-                    parameter_tests[test.test_parameter]["b_preferred"] += 1
-
-        trends["parameters"] = parameter_tests
-
-        # Calculate most effective sounds for each sleep issue
-        if trends["sleep_issues"]:
-            effective_sounds_by_issue = {}
-
-            for name, profile in self.profiles.items():
-                sleep_issue = profile.sleep_issue or "unknown"
-                if sleep_issue not in effective_sounds_by_issue:
-                    effective_sounds_by_issue[sleep_issue] = {}
-
-                # Analyze feedback to find effective sounds
-                for mix_id, score in profile.mix_feedback.items():
-                    if score >= 7:
-                        pass  # TODO: Implement logic for effective sounds based on score
-
-            # Calculate average scores
-            for issue, sounds in effective_sounds_by_issue.items():
-                for sound, data in sounds.items():
-                    if data["count"] > 0:
-                        pass  # TODO: Implement logic for calculating average scores
-
-            trends["effective_sounds_by_issue"] = effective_sounds_by_issue
-
-        return trends
-
-    def get_recommended_parameters_for_sleep_issue(self, sleep_issue: str) -> Dict:
-        """
-        Get recommended parameters for a specific sleep issue
-        based on learning from all users with that issue
-
-        Args:
-            sleep_issue: Type of sleep issue
-
-        Returns:
-            Dictionary of recommended parameters
-        """
-        # Analyze trends
-        trends = self.analyze_learning_trends()
-
-        # Default parameters
-        recommended = {
-            "category_weights": {
-                "rain": 0.5,
-                "thunder": 0.3,
-                "white_noise": 0.5,
-                "nature": 0.5,
-                "water": 0.5,
-                "other": 0.3,
-            },
-            "eq_preferences": {
-                "low": 0,
-                "mid-low": 0,
-                "mid": 0,
-                "high-mid": 0,
-                "high": 0,
-            },
-            "volume_preferences": {"base_sounds": 0, "occasional_sounds": -3},
-        }
-
-        # Update with learned category weights for the sleep issue
-        categories = trends.get("categories", {})
-        for category, data in categories.items():
-            issue_data = data.get("by_issue", {}).get(sleep_issue)
-            if issue_data and "average_weight" in issue_data:
-                recommended["category_weights"][category] = issue_data["average_weight"]
-
-        # Find most effective sounds for the sleep issue
-        effective_sounds = trends.get("effective_sounds_by_issue", {}).get(
-            sleep_issue, {}
-        )
-
-        # Sort by average score
-        sorted_sounds = [
-            (sound, data["average_score"])
-            for sound, data in effective_sounds.items()
-            if "average_score" in data
-        ]
-        sorted_sounds.sort(key=lambda x: x[1], reverse=True)
-
-        # Add top sounds
-        recommended["recommended_sounds"] = [sound for sound, _ in sorted_sounds[:5]]
-
-        logger.info(
-            f"Generated recommended parameters for {sleep_issue} based on learning data"
-        )
-        return recommended
+import atexit
+import copy
+import logging
+import os
+import random
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict  # Added for type hinting
+
+import numpy as np
+
+from .ab_testing import ABTest  # Added import
+from .user_profile import UserProfile  # Added import
+
+try:
+    import tensorflow as tf
+    from tensorflow.keras import layers, models, optimizers
+    from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
+    from tensorflow.keras.models import load_model as keras_load_model
+
+    DEEP_LEARNING_AVAILABLE = True
+except ImportError:
+    DEEP_LEARNING_AVAILABLE = False
+    logging.warning(
+        "TensorFlow/Keras not found. Deep learning features will be disabled."
+    )
+
+logger = logging.getLogger(__name__)
+
+# Sound categories, in label index order, used for training and classification
+CATEGORY_NAMES = ["rain", "thunder", "white_noise", "nature", "water", "other"]
+
+_STRATEGY = None
+
+
+def get_distribution_strategy() -> "tf.distribute.Strategy":
+    """
+    Get the distribution strategy used for model construction and training.
+
+    Uses MirroredStrategy when more than one GPU is visible, otherwise a
+    single-device strategy. Created lazily so importing this module does not
+    initialize devices.
+
+    Returns:
+        TensorFlow distribution strategy
+    """
+    global _STRATEGY
+    if _STRATEGY is None:
+        gpus = tf.config.list_logical_devices("GPU")
+        if len(gpus) > 1:
+            _STRATEGY = tf.distribute.MirroredStrategy()
+        else:
+            _STRATEGY = tf.distribute.OneDeviceStrategy(
+                gpus[0].name if gpus else "/cpu:0"
+            )
+        logger.info(
+            f"Using {type(_STRATEGY).__name__} with "
+            f"{_STRATEGY.num_replicas_in_sync} replica(s)"
+        )
+    return _STRATEGY
+
+
+def create_basic_cnn(input_shape: int = 41) -> "tf.keras.Model":
+    """
+    Create a basic CNN model for audio classification.
+
+    Args:
+        input_shape: Number of features in input vector
+
+    Returns:
+        Compiled Keras model
+    """
+    if not DEEP_LEARNING_AVAILABLE:
+        logger.error("Deep learning libraries are not available.")
+        return None
+
+    try:
+        with get_distribution_strategy().scope():
+            model = models.Sequential(
+                [
+                    layers.Input(shape=(input_shape, 1)),
+                    layers.Conv1D(32, kernel_size=3, activation="relu"),
+                    layers.MaxPooling1D(pool_size=2),
+                    layers.Conv1D(64, kernel_size=3, activation="relu"),
+                    layers.MaxPooling1D(pool_size=2),
+                    layers.Flatten(),
+                    layers.Dense(128, activation="relu"),
+                    layers.Dense(10, activation="softmax"),
+                ]
+            )
+
+            # jit_compile fuses the small conv/dense kernels with XLA
+            model.compile(
+                optimizer="adam",
+                loss="categorical_crossentropy",
+                metrics=["accuracy"],
+                jit_compile=True,
+            )
+        logger.info("Basic CNN model created successfully.")
+        return model
+
+    except Exception as e:
+        logger.error(f"Error creating CNN model: {str(e)}")
+        return None
+
+
+def train_model_with_available_data(
+    model: "tf.keras.Model",
+    folder_path: str,
+    epochs: int = 10,
+    batch_size: int = 32,
+    checkpoint_path: str = None,
+) -> "tf.keras.Model":
+    """
+    Train the model with available data from processed folder.
+
+    The folder is expected to contain one subfolder per category (see
+    CATEGORY_NAMES) holding ``.npy`` feature vectors. Files are streamed
+    through a ``tf.data`` pipeline so decoding overlaps with training.
+
+    Args:
+        model: Keras model to train
+        folder_path: Path to folder with processed audio features
+        epochs: Maximum number of training epochs
+        batch_size: Number of samples per batch on each replica
+        checkpoint_path: Optional path to save the best model to
+
+    Returns:
+        Trained model
+    """
+    if not DEEP_LEARNING_AVAILABLE:
+        logger.error("Deep learning libraries are not available.")
+        return None
+
+    try:
+        file_pattern = os.path.join(folder_path, "*", "*.npy")
+        if not tf.io.gfile.glob(file_pattern):
+            logger.warning(f"No feature files found in {folder_path}")
+            return model
+
+        feature_shape = model.input_shape[1:]
+        num_classes = model.output_shape[-1]
+        label_table = tf.lookup.StaticHashTable(
+            tf.lookup.KeyValueTensorInitializer(
+                tf.constant(CATEGORY_NAMES),
+                tf.range(len(CATEGORY_NAMES), dtype=tf.int64),
+            ),
+            default_value=CATEGORY_NAMES.index("other"),
+        )
+
+        def _load_features(file_path):
+            features = tf.numpy_function(
+                lambda path: np.load(path.decode()).astype(np.float32).reshape(
+                    feature_shape
+                ),
+                [file_path],
+                tf.float32,
+            )
+            features.set_shape(feature_shape)
+            category = tf.strings.split(file_path, os.sep)[-2]
+            label = tf.one_hot(label_table.lookup(category), num_classes)
+            return features, label
+
+        # Scale the global batch so each replica keeps batch_size samples
+        global_batch_size = (
+            batch_size * get_distribution_strategy().num_replicas_in_sync
+        )
+
+        options = tf.data.Options()
+        options.experimental_deterministic = False
+        options.experimental_optimization.map_and_batch_fusion = True
+
+        dataset = (
+            tf.data.Dataset.list_files(file_pattern, shuffle=True)
+            .map(_load_features, num_parallel_calls=tf.data.AUTOTUNE)
+            .cache()
+            .shuffle(1024)
+            .batch(global_batch_size)
+            .prefetch(tf.data.AUTOTUNE)
+            .with_options(options)
+        )
+
+        callbacks = [
+            EarlyStopping(monitor="loss", patience=3, restore_best_weights=True)
+        ]
+        if checkpoint_path:
+            callbacks.append(
+                ModelCheckpoint(checkpoint_path, monitor="loss", save_best_only=True)
+            )
+
+        model.fit(dataset, epochs=epochs, callbacks=callbacks)
+        logger.info("Model training completed successfully.")
+        return model
+
+    except Exception as e:
+        logger.error(f"Error training model: {str(e)}")
+        return None
+
+
+def quantize_model(
+    keras_model: "tf.keras.Model", representative_dataset_fn, output_path: str = None
+) -> bytes:
+    """
+    Quantize a Keras model to an INT8 TFLite model.
+
+    Inputs and outputs stay float32 so callers can feed the same feature
+    arrays used with the Keras model.
+
+    Args:
+        keras_model: Trained Keras model
+        representative_dataset_fn: Generator yielding lists of sample inputs
+            used to calibrate quantization ranges
+        output_path: Optional path to write the ``.tflite`` model to
+
+    Returns:
+        Serialized TFLite model
+    """
+    if not DEEP_LEARNING_AVAILABLE:
+        logger.error("Deep learning libraries are not available.")
+        return None
+
+    try:
+        converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset_fn
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.float32
+        converter.inference_output_type = tf.float32
+        tflite_model = converter.convert()
+
+        if output_path:
+            with open(output_path, "wb") as f:
+                f.write(tflite_model)
+            logger.info(f"Saved quantized model to {output_path}")
+
+        return tflite_model
+
+    except Exception as e:
+        logger.error(f"Error quantizing model: {str(e)}")
+        return None
+
+
+def export_for_tensorrt(keras_model: "tf.keras.Model", output_path: str) -> str:
+    """
+    Export a Keras model to ONNX for TensorRT inference.
+
+    The returned model is run through onnxruntime's TensorRT execution
+    provider by classify_with_deep_learning, which builds a reduced
+    precision engine on first use and caches it next to the model.
+
+    Args:
+        keras_model: Trained Keras model
+        output_path: Path for the exported model (extension is replaced)
+
+    Returns:
+        Path to the ONNX model, or None on failure
+    """
+    if not DEEP_LEARNING_AVAILABLE:
+        logger.error("Deep learning libraries are not available.")
+        return None
+
+    try:
+        import tf2onnx
+    except ImportError:
+        logger.error("tf2onnx not found. TensorRT export is unavailable.")
+        return None
+
+    try:
+        onnx_path = f"{os.path.splitext(output_path)[0]}.onnx"
+        feature_shape = keras_model.input_shape[1:]
+        input_signature = (
+            tf.TensorSpec((None, *feature_shape), tf.float32, name="features"),
+        )
+        tf2onnx.convert.from_keras(
+            keras_model, input_signature=input_signature, output_path=onnx_path
+        )
+        logger.info(f"Exported ONNX model to {onnx_path}")
+        return onnx_path
+
+    except Exception as e:
+        logger.error(f"Error exporting model for TensorRT: {str(e)}")
+        return None
+
+
+def _load_predictor(model_path: str, batch_size: int):
+    """
+    Load a Keras, TFLite or ONNX model and return its feature shape and a
+    batch prediction function.
+    """
+    if model_path.endswith(".tflite"):
+        interpreter = tf.lite.Interpreter(
+            model_path=model_path, num_threads=os.cpu_count()
+        )
+        input_detail = interpreter.get_input_details()[0]
+        output_index = interpreter.get_output_details()[0]["index"]
+        feature_shape = tuple(input_detail["shape"][1:])
+        interpreter.resize_tensor_input(
+            input_detail["index"], [batch_size, *feature_shape]
+        )
+        interpreter.allocate_tensors()
+        allocated_size = batch_size
+
+        def predict(batch):
+            nonlocal allocated_size
+            if len(batch) != allocated_size:
+                interpreter.resize_tensor_input(input_detail["index"], batch.shape)
+                interpreter.allocate_tensors()
+                allocated_size = len(batch)
+            interpreter.set_tensor(input_detail["index"], batch)
+            interpreter.invoke()
+            return interpreter.get_tensor(output_index)
+
+        logger.info("Loaded quantized TFLite model.")
+        return feature_shape, predict
+
+    if model_path.endswith(".onnx"):
+        import onnxruntime as ort
+
+        preferred = [
+            "TensorrtExecutionProvider",
+            "CUDAExecutionProvider",
+            "CPUExecutionProvider",
+        ]
+        available = ort.get_available_providers()
+        providers = [p for p in preferred if p in available]
+        if "TensorrtExecutionProvider" in providers:
+            # Reduced precision engine, built once and cached beside the model
+            trt_options = {
+                "trt_fp16_enable": True,
+                "trt_engine_cache_enable": True,
+                "trt_engine_cache_path": os.path.dirname(model_path) or ".",
+            }
+            providers[providers.index("TensorrtExecutionProvider")] = (
+                "TensorrtExecutionProvider",
+                trt_options,
+            )
+        session = ort.InferenceSession(model_path, providers=providers)
+        model_input = session.get_inputs()[0]
+
+        def predict(batch):
+            return session.run(None, {model_input.name: batch})[0]
+
+        logger.info(f"Loaded ONNX model with providers {session.get_providers()}.")
+        return tuple(model_input.shape[1:]), predict
+
+    model = keras_load_model(model_path)
+    logger.info("Loaded pre-trained model.")
+
+    @tf.function(jit_compile=True)
+    def predict_fn(batch):
+        return model(batch, training=False)
+
+    def predict(batch):
+        return predict_fn(batch).numpy()
+
+    return model.input_shape[1:], predict
+
+
+def classify_with_deep_learning(
+    processed_folder: str, model_path: str = None, batch_size: int = 512
+) -> dict:
+    """
+    Classify sounds using a pre-trained CNN or transformer model.
+
+    Feature vectors (``.npy`` files) are stacked into a single array and
+    classified in large batches rather than one file at a time.
+
+    Args:
+        processed_folder: Folder containing processed audio features
+        model_path: Optional path to pre-trained model (Keras, ``.tflite``
+            or ``.onnx``, the latter run with TensorRT when available)
+        batch_size: Number of feature vectors per prediction batch
+
+    Returns:
+        Dictionary of categories with file paths
+    """
+    if not DEEP_LEARNING_AVAILABLE:
+        logger.error("Deep learning libraries are not available.")
+        return {}
+
+    logger.info("Starting deep learning classification")
+
+    categories = {name: [] for name in CATEGORY_NAMES}
+
+    try:
+        # Load model if path is provided
+        if not model_path:
+            logger.warning("No model path provided, skipping classification.")
+            return categories
+
+        feature_shape, predict = _load_predictor(model_path, batch_size)
+
+        files = sorted(f for f in os.listdir(processed_folder) if f.endswith(".npy"))
+        if not files:
+            logger.warning(f"No feature files found in {processed_folder}")
+            return categories
+
+        # Stack all feature vectors into one contiguous array
+        features = np.empty((len(files), *feature_shape), dtype=np.float32)
+        for i, file_name in enumerate(files):
+            features[i] = np.load(
+                os.path.join(processed_folder, file_name), mmap_mode="r"
+            ).reshape(feature_shape)
+
+        # Predict in large batches to amortize per-call dispatch overhead
+        class_ids = np.empty(len(files), dtype=np.int64)
+        for start in range(0, len(files), batch_size):
+            predictions = predict(features[start : start + batch_size])
+            class_ids[start : start + batch_size] = np.argmax(predictions, axis=1)
+
+        # Classes beyond the known categories count as "other"
+        class_ids[class_ids >= len(CATEGORY_NAMES)] = CATEGORY_NAMES.index("other")
+
+        # Build each category's list in one pass over its index vector
+        for class_id, category in enumerate(CATEGORY_NAMES):
+            categories[category] = [
+                os.path.join(processed_folder, files[i])
+                for i in np.flatnonzero(class_ids == class_id)
+            ]
+
+        logger.info(f"Deep learning classification completed for {len(files)} files.")
+        return categories
+
+    except Exception as e:
+        logger.error(f"Error during classification: {str(e)}")
+        return {}
+
+
+# Kinds of testable parameters, used to dispatch value generation
+_PARAM_WEIGHT = 0  # Category weight in [0.1, 0.9]
+_PARAM_DB = 1  # dB adjustment (EQ or volume)
+_PARAM_GENERIC = 2  # Any other numeric parameter
+
+_PARAM_KINDS = {
+    "category_weights": _PARAM_WEIGHT,
+    "eq_preferences": _PARAM_DB,
+    "volume_preferences": _PARAM_DB,
+}
+
+# Maximum number of threads used to load profile and A/B test files
+MAX_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _scan_files(folder_path: str) -> list:
+    """
+    List the regular files in a folder as DirEntry objects.
+    """
+    with os.scandir(folder_path) as it:
+        return [entry for entry in it if entry.is_file()]
+
+
+def _flush_at_exit(learner_ref: "weakref.ref") -> None:
+    """
+    Flush a MixLearner's logged profiles at exit, if it is still alive.
+
+    Learners collected earlier leave their feedback logs in place; those are
+    replayed the next time the profiles are loaded.
+    """
+    learner = learner_ref()
+    if learner is not None:
+        learner.flush_profiles()
+
+
+class MixLearner:
+    """
+    Class that implements the learning algorithm for personalized mixes
+    based on user feedback and A/B testing
+    """
+
+    def __init__(self):
+        """Initialize the learning algorithm"""
+        self.profiles = {}  # User name to UserProfile
+        self.ab_tests = []  # List of ABTest objects
+        self._ab_tests_by_id = {}  # Test ID to ABTest
+        self._unsaved_profiles = set()  # Names of profiles with logged events
+        self._flush_registered = False
+        self.learning_rate = 0.1  # How quickly we adjust parameters based on feedback
+        self._trends_cache = None  # Cached analyze_learning_trends result
+        self._recommendation_cache = {}  # Sleep issue to recommended parameters
+        self.test_parameters = [  # Parameters that can be tested
+            "category_weights.rain",
+            "category_weights.thunder",
+            "category_weights.white_noise",
+            "category_weights.nature",
+            "category_weights.water",
+            "eq_preferences.low",
+            "eq_preferences.mid",
+            "eq_preferences.high",
+            "volume_preferences.base_sounds",
+            "volume_preferences.occasional_sounds",
+        ]
+        # (parameter, profile attribute, key, kind) parsed once up front
+        self._test_parameter_table = [
+            (parameter, group, key, _PARAM_KINDS.get(group, _PARAM_GENERIC))
+            for parameter in self.test_parameters
+            for group, _, key in [parameter.partition(".")]
+        ]
+        # Integer code per known test parameter, used to tally A/B results
+        self._test_param_codes = {
+            parameter: code for code, parameter in enumerate(self.test_parameters)
+        }
+
+    def invalidate_trends(self) -> None:
+        """
+        Discard cached trend analysis and recommendations.
+
+        Called whenever profiles or A/B tests change; callers that modify
+        self.profiles or self.ab_tests directly should call it too.
+        """
+        self._trends_cache = None
+        self._recommendation_cache.clear()
+
+    def load_profiles(self, folder_path: str = "user_profiles") -> None:
+        """
+        Load all user profiles from a folder
+
+        Args:
+            folder_path: Folder containing profile files
+        """
+        if not os.path.exists(folder_path):
+            logger.info(f"Profile folder {folder_path} doesn't exist, creating it")
+            os.makedirs(folder_path, exist_ok=True)
+            return
+
+        profile_files = [
+            e for e in _scan_files(folder_path) if e.name.endswith("_profile.json")
+        ]
+
+        def _load_profile(profile_file):
+            try:
+                profile = UserProfile.load(profile_file.path)
+                logger.info(f"Loaded profile for user {profile.name}")
+                return profile
+            except Exception as e:
+                logger.error(f"Error loading profile {profile_file.name}: {str(e)}")
+                return None
+
+        # File reads and JSON decoding release the GIL, so load concurrently
+        with ThreadPoolExecutor(max_workers=MAX_LOAD_WORKERS) as executor:
+            results = list(executor.map(_load_profile, profile_files))
+
+        loaded_profiles = {p.name: p for p in results if p}
+
+        self.profiles.update(loaded_profiles)
+        self.invalidate_trends()
+
+        logger.info(f"Loaded {len(self.profiles)} user profiles")
+
+    def load_ab_tests(self, folder_path: str = "ab_tests") -> None:
+        """
+        Load all A/B tests from a folder
+
+        Args:
+            folder_path: Folder containing test files
+        """
+        if not os.path.exists(folder_path):
+            logger.info(f"A/B test folder {folder_path} doesn't exist, creating it")
+            os.makedirs(folder_path, exist_ok=True)
+            return
+
+        test_files = [e for e in _scan_files(folder_path) if e.name.endswith(".json")]
+
+        def _load_test(test_file):
+            try:
+                test = ABTest.load(test_file.path)
+                logger.info(f"Loaded A/B test {test.test_id}")
+                return test
+            except Exception as e:
+                logger.error(f"Error loading A/B test {test_file.name}: {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=MAX_LOAD_WORKERS) as executor:
+            results = list(executor.map(_load_test, test_files))
+
+        loaded_tests = [t for t in results if t]
+
+        self.ab_tests.extend(loaded_tests)
+        self._ab_tests_by_id.update((t.test_id, t) for t in loaded_tests)
+        self.invalidate_trends()
+
+        logger.info(f"Loaded {len(self.ab_tests)} A/B tests")
+
+    def get_profile(self, user_name: str, sleep_issue: str = None) -> UserProfile:
+        """
+        Get a user profile, creating it if it doesn't exist
+
+        Args:
+            user_name: Name of the user
+            sleep_issue: Optional sleep issue type
+
+        Returns:
+            UserProfile for the user
+        """
+        if user_name in self.profiles:
+            return self.profiles[user_name]
+
+        # Create new profile
+        profile = UserProfile(name=user_name, sleep_issue=sleep_issue)
+        self.profiles[user_name] = profile
+        self.invalidate_trends()
+
+        # Save the new profile
+        profile.save()
+        logger.info(f"Created new profile for user {user_name}")
+
+        return profile
+
+    def create_ab_test(self, user_name: str, base_params: Dict = None) -> ABTest:
+        """
+        Create a new A/B test for a user
+
+        Args:
+            user_name: Name of the user
+            base_params: Base parameters for both variants
+
+        Returns:
+            ABTest object
+        """
+        # Get user profile
+        profile = self.get_profile(user_name)
+
+        # Create test ID
+        test_id = f"abtest_{user_name}_{int(time.time())}"
+
+        # Create A/B test
+        ab_test = ABTest(test_id=test_id)
+
+        # Choose a parameter to test
+        test_parameter, group, key, kind = self._test_parameter_table[
+            random.randrange(len(self._test_parameter_table))
+        ]
+
+        # Set parameter values based on current profile preferences
+        if kind == _PARAM_WEIGHT:
+            # Testing a category weight
+            current_value = profile.category_weights.get(key, 0.5)
+
+            # Create two variants that differ by 20-30%
+            delta = random.uniform(0.2, 0.3)
+            value_a = max(0.1, min(0.9, current_value + delta))
+            value_b = max(0.1, min(0.9, current_value - delta))
+
+        elif kind == _PARAM_DB:
+            # Testing an EQ or volume preference
+            current_value = getattr(profile, group).get(key, 0)
+
+            # Create two variants that differ by 2-4 dB
+            delta = random.uniform(2, 4)
+            value_a = current_value + delta
+            value_b = current_value - delta
+
+        else:
+            # Generic numeric parameter
+            # Default to testing between 0.3 and 0.7
+            value_a = 0.7
+            value_b = 0.3
+
+        # Set up test
+        if not base_params:
+            base_params = {}
+
+        # Add current profile preferences to base params
+        base_params["category_weights"] = profile.category_weights.copy()
+        base_params["eq_preferences"] = profile.eq_preferences.copy()
+        base_params["volume_preferences"] = profile.volume_preferences.copy()
+
+        ab_test.setup_test(test_parameter, value_a, value_b, base_params)
+
+        # Add to test list
+        self.ab_tests.append(ab_test)
+        self._ab_tests_by_id[ab_test.test_id] = ab_test
+        self.invalidate_trends()
+
+        # Save the test
+        ab_test.save()
+
+        logger.info(
+            f"Created A/B test {test_id} for user {user_name}, testing {test_parameter}"
+        )
+        return ab_test
+
+    def record_ab_test_result(
+        self, test_id: str, preferred_variant: str, feedback: Dict = None
+    ) -> None:
+        """
+        Record the result of an A/B test and update user profile
+
+        Args:
+            test_id: ID of the test
+            preferred_variant: The preferred variant ('A' or 'B')
+            feedback: Optional feedback details
+        """
+        # Find the test
+        test = self._ab_tests_by_id.get(test_id)
+        if test is None:
+            logger.warning(f"A/B test {test_id} not found")
+            return
+
+        # Record result, saving the test only if it changed
+        test_changed = test.result != preferred_variant or bool(feedback)
+        test.record_result(preferred_variant, feedback)
+        if test_changed:
+            self.invalidate_trends()
+            test.save()
+
+        # Extract user name from test ID (format: abtest_username_timestamp)
+        parts = test_id.split("_")
+        if len(parts) >= 3:
+            user_name = parts[1]
+
+            # Direct lookup; only create (and save) the profile on a miss
+            profile = self.profiles.get(user_name)
+            if profile is None:
+                profile = self.get_profile(user_name)
+
+            # Update profile based on test result, saving only on change.
+            # A result the profile has already learned from is not reapplied.
+            already_applied = profile.ab_test_results.get(test_id) == preferred_variant
+            if not already_applied and profile.update_from_ab_test(
+                test_id,
+                preferred_variant,
+                test.variant_a_params,
+                test.variant_b_params,
+            ):
+                self.invalidate_trends()
+
+                # Append to the feedback log; the full profile is saved on flush
+                profile.log_ab_test_result(
+                    test_id,
+                    preferred_variant,
+                    test.variant_a_params,
+                    test.variant_b_params,
+                )
+                self._mark_unsaved(user_name)
+
+                logger.info(
+                    f"Updated profile for {user_name} based on A/B test {test_id}"
+                )
+
+    def record_mix_feedback(
+        self, user_name: str, mix_id: str, feedback_score: int, mix_params: Dict
+    ) -> None:
+        """
+        Record feedback for a mix and update user profile
+
+        Args:
+            user_name: Name of the user
+            mix_id: ID of the mix
+            feedback_score: User feedback score (1-10)
+            mix_params: Parameters used to create the mix
+        """
+        # Get user profile
+        profile = self.get_profile(user_name)
+
+        # Update profile based on feedback
+        profile.update_from_feedback(mix_id, feedback_score, mix_params)
+        self.invalidate_trends()
+
+        # Append to the feedback log; the full profile is saved on flush
+        profile.log_feedback(mix_id, feedback_score, mix_params)
+        self._mark_unsaved(user_name)
+
+        logger.info(
+            f"Recorded feedback (score: {feedback_score}) for mix {mix_id} from user {user_name}"
+        )
+
+    def _mark_unsaved(self, user_name: str) -> None:
+        """Note a profile with logged events, scheduling a flush at exit."""
+        self._unsaved_profiles.add(user_name)
+        if not self._flush_registered:
+            # A weak reference so the exit hook doesn't keep the learner alive
+            atexit.register(_flush_at_exit, weakref.ref(self))
+            self._flush_registered = True
+
+    def flush_profiles(self) -> None:
+        """
+        Save profiles with logged events, compacting their feedback logs.
+
+        Registered to run at interpreter exit once an event is logged.
+        """
+        for user_name in sorted(self._unsaved_profiles):
+            profile = self.profiles.get(user_name)
+            if profile:
+                profile.save()
+        self._unsaved_profiles.clear()
+
+    def optimize_mix_parameters(self, user_name: str, base_params: Dict = None) -> Dict:
+        """
+        Optimize mix parameters for a user based on their profile
+
+        Args:
+            user_name: Name of the user
+            base_params: Optional base parameters
+
+        Returns:
+            Optimized parameters for creating a mix
+        """
+        # Get user profile
+        profile = self.get_profile(user_name)
+
+        # Start with base params or empty dict
+        optimized_params = base_params.copy() if base_params else {}
+
+        # Apply profile preferences
+
+        # Category weights
+        optimized_params["category_weights"] = profile.category_weights.copy()
+
+        # EQ preferences
+        optimized_params["eq_preferences"] = profile.eq_preferences.copy()
+
+        # Volume preferences
+        optimized_params["volume_preferences"] = profile.volume_preferences.copy()
+
+        # Sound preferences
+        optimized_params["preferred_sounds"] = profile.preferred_sounds.copy()
+        optimized_params["avoided_sounds"] = profile.avoided_sounds.copy()
+
+        # Duration preference
+        if "duration" not in optimized_params:
+            optimized_params["duration"] = profile.preferred_duration
+
+        logger.info(
+            f"Optimized mix parameters for user {user_name} based on their profile"
+        )
+        return optimized_params
+
+    def _category_matrix(self):
+        """
+        Build a columnar view of profile category weights.
+
+        Returns:
+            Tuple of (issue names, per-profile issue codes, category names,
+            weight matrix, presence mask) where the matrices have one row per
+            profile and one column per category
+        """
+        issue_index = {}
+        category_index = {}
+        issue_codes = np.empty(len(self.profiles), dtype=np.intp)
+        for row, profile in enumerate(self.profiles.values()):
+            sleep_issue = profile.sleep_issue or "unknown"
+            issue_codes[row] = issue_index.setdefault(sleep_issue, len(issue_index))
+            for category in profile.category_weights:
+                category_index.setdefault(category, len(category_index))
+
+        weights = np.zeros((len(self.profiles), len(category_index)))
+        present = np.zeros((len(self.profiles), len(category_index)), dtype=bool)
+        for row, profile in enumerate(self.profiles.values()):
+            cols = [category_index[c] for c in profile.category_weights]
+            weights[row, cols] = list(profile.category_weights.values())
+            present[row, cols] = True
+
+        return list(issue_index), issue_codes, list(category_index), weights, present
+
+    def analyze_learning_trends(self) -> Dict:
+        """
+        Analyze learning trends across all users and tests
+
+        The result is cached until profiles or A/B tests change; callers get
+        a copy, so modifying it does not affect later calls.
+
+        Returns:
+            Dictionary with trend analysis
+        """
+        if self._trends_cache is not None:
+            return copy.deepcopy(self._trends_cache)
+
+        trends = {"parameters": {}, "categories": {}, "sleep_issues": {}}
+
+        # Analyze profile trends on a columnar (profiles x categories) layout
+        issue_names, issue_codes, category_names, weights, present = (
+            self._category_matrix()
+        )
+        num_issues = len(issue_names)
+
+        issue_counts = np.bincount(issue_codes, minlength=num_issues)
+        trends["sleep_issues"] = {
+            issue: int(count)
+            for issue, count in zip(issue_names, issue_counts, strict=True)
+        }
+
+        # Sum weights and counts per (sleep issue, category) in one pass
+        issue_sums = np.zeros((num_issues, len(category_names)))
+        issue_totals = np.zeros((num_issues, len(category_names)), dtype=np.int64)
+        np.add.at(issue_sums, issue_codes, weights)
+        np.add.at(issue_totals, issue_codes, present)
+
+        category_sums = issue_sums.sum(axis=0)
+        category_counts = issue_totals.sum(axis=0)
+
+        for col, category in enumerate(category_names):
+            by_issue = {}
+            for row, issue in enumerate(issue_names):
+                count = int(issue_totals[row, col])
+                if count > 0:
+                    by_issue[issue] = {
+                        "total_weight": float(issue_sums[row, col]),
+                        "count": count,
+                        "average_weight": float(issue_sums[row, col] / count),
+                    }
+
+            count = int(category_counts[col])
+            trends["categories"][category] = {
+                "total_weight": float(category_sums[col]),
+                "count": count,
+                "by_issue": by_issue,
+                "average_weight": float(category_sums[col] / count),
+            }
+
+        # Analyze A/B test trends: integer-code each completed test's parameter
+        # and outcome (0 = A, 1 = B, -1 = other), then count with bincount
+        param_codes = dict(self._test_param_codes)
+        completed = [t for t in self.ab_tests if t.result and t.test_parameter]
+        codes = np.fromiter(
+            (
+                param_codes.setdefault(t.test_parameter, len(param_codes))
+                for t in completed
+            ),
+            dtype=np.intp,
+            count=len(completed),
+        )
+        outcomes = np.fromiter(
+            ({"A": 0, "B": 1}.get(t.result, -1) for t in completed),
+            dtype=np.int8,
+            count=len(completed),
+        )
+        a_counts = np.bincount(codes[outcomes == 0], minlength=len(param_codes))
+        b_counts = np.bincount(codes[outcomes == 1], minlength=len(param_codes))
+
+        parameter_names = list(param_codes)
+        parameter_tests = {
+            parameter_names[code]: {
+                "a_preferred": int(a_counts[code]),
+                "b_preferred": int(b_counts[code]),
+            }
+            for code in dict.fromkeys(codes.tolist())
+        }
+
+        trends["parameters"] = parameter_tests
+
+        # Calculate most effective sounds for each sleep issue
+        if trends["sleep_issues"]:
+            effective_sounds_by_issue = {}
+
+            for name, profile in self.profiles.items():
+                sleep_issue = profile.sleep_issue or "unknown"
+                if sleep_issue not in effective_sounds_by_issue:
+                    effective_sounds_by_issue[sleep_issue] = {}
+
+                # Analyze feedback to find effective sounds
+                for mix_id, score in profile.mix_feedback.items():
+                    if score >= 7:
+                        pass  # TODO: Implement logic for effective sounds based on score
+
+            # Calculate average scores
+            for issue, sounds in effective_sounds_by_issue.items():
+                for sound, data in sounds.items():
+                    if data["count"] > 0:
+                        pass  # TODO: Implement logic for calculating average scores
+
+            trends["effective_sounds_by_issue"] = effective_sounds_by_issue
+
+        self._trends_cache = trends
+        return copy.deepcopy(trends)
+
+    def get_recommended_parameters_for_sleep_issue(self, sleep_issue: str) -> Dict:
+        """
+        Get recommended parameters for a specific sleep issue
+        based on learning from all users with that issue
+
+        Args:
+            sleep_issue: Type of sleep issue
+
+        Returns:
+            Dictionary of recommended parameters
+        """
+        cached = self._recommendation_cache.get(sleep_issue)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        # Analyze trends
+        trends = self.analyze_learning_trends()
+
+        # Default parameters
+        recommended = {
+            "category_weights": {
+                "rain": 0.5,
+                "thunder": 0.3,
+                "white_noise": 0.5,
+                "nature": 0.5,
+                "water": 0.5,
+                "other": 0.3,
+            },
+            "eq_preferences": {
+                "low": 0,
+                "mid-low": 0,
+                "mid": 0,
+                "high-mid": 0,
+                "high": 0,
+            },
+            "volume_preferences": {"base_sounds": 0, "occasional_sounds": -3},
+        }
+
+        # Update with learned category weights for the sleep issue
+        categories = trends.get("categories", {})
+        for category, data in categories.items():
+            issue_data = data.get("by_issue", {}).get(sleep_issue)
+            if issue_data and "average_weight" in issue_data:
+                recommended["category_weights"][category] = issue_data["average_weight"]
+
+        # Find most effective sounds for the sleep issue
+        effective_sounds = trends.get("effective_sounds_by_issue", {}).get(
+            sleep_issue, {}
+        )
+
+        # Sort by average score
+        sorted_sounds = [
+            (sound, data["average_score"])
+            for sound, data in effective_sounds.items()
+            if "average_score" in data
+        ]
+        sorted_sounds.sort(key=lambda x: x[1], reverse=True)
+
+        # Add top sounds
+        recommended["recommended_sounds"] = [sound for sound, _ in sorted_sounds[:5]]
+
+        logger.info(
+            f"Generated recommended parameters for {sleep_issue} based on learning data"
+        )
+        self._recommendation_cache[sleep_issue] = recommended
+        return copy.deepcopy(recommended)
@@ -5,18 +5,209 @@ This module provides advanced audio analysis and segmentation capabilities
 for extracting useful content from longer audio files.
 """
 
-import logging
 import json
-import numpy as np
-import librosa
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+import librosa
+import numpy as np
 import soundfile as sf
+from joblib import Parallel, delayed
+from scipy import fft as scipy_fft
+from scipy.ndimage import minimum_filter1d
+from scipy.signal import get_window
 
 from project_name.core.audio_similarity import AudioSimilarityMatcher
 
 logger = logging.getLogger(__name__)
 
+# Frequency bands reported by _analyze_frequency_bands and their edges in Hz
+FREQUENCY_BAND_NAMES = [
+    "sub_bass", "bass", "low_mid", "mid", "high_mid", "presence", "brilliance"
+]
+FREQUENCY_BAND_EDGES = [20, 60, 250, 500, 2000, 4000, 6000, 20000]
+
+# Maximum concurrent file writes when exporting segments
+MAX_WRITE_WORKERS = 8
+
+# STFT frames transformed per batch by _magnitude_spectrogram
+STFT_BLOCK_FRAMES = 4096
+
+# Files longer than this (seconds) have their RMS and ZCR tracks computed
+# block by block rather than by framing the whole signal at once
+LONG_AUDIO_SECONDS = 300
+
+
+def _magnitude_spectrogram(audio: np.ndarray, n_fft: int = 2048,
+                           hop_length: int = 512) -> np.ndarray:
+    """
+    Magnitude STFT matching np.abs(librosa.stft(audio)) using multi-threaded scipy.fft.
+    
+    Args:
+        audio: Mono audio signal
+        n_fft: FFT size
+        hop_length: Samples between frames
+        
+    Returns:
+        Float32 magnitude spectrogram of shape (1 + n_fft // 2, frames)
+    """
+    # Centered, zero-padded Hann frames as in librosa's defaults
+    padded = np.pad(audio, n_fft // 2)
+    frames = np.lib.stride_tricks.sliding_window_view(padded, n_fft)[::hop_length]
+    window = get_window("hann", n_fft, fftbins=True).astype(np.float32)
+    
+    magnitude = np.empty((1 + n_fft // 2, len(frames)), dtype=np.float32)
+    # Transform in blocks so the windowed copy stays bounded on long files
+    for start in range(0, len(frames), STFT_BLOCK_FRAMES):
+        block = frames[start:start + STFT_BLOCK_FRAMES] * window
+        magnitude[:, start:start + len(block)] = np.abs(
+            scipy_fft.rfft(block, axis=1, workers=-1)
+        ).T
+    
+    return magnitude
+
+
+def _blocked_frame_feature(audio: np.ndarray,
+                           reducer: Callable[[np.ndarray], np.ndarray],
+                           pad_mode: str, frame_length: int = 2048,
+                           hop_length: int = 512) -> np.ndarray:
+    """
+    Per-frame feature track computed over centred frames a block at a time.
+    
+    Args:
+        audio: Mono audio signal
+        reducer: Maps a (frames, frame_length) block to one value per frame
+        pad_mode: np.pad mode used for centring, as in the matching librosa feature
+        frame_length: Samples per frame
+        hop_length: Samples between frames
+        
+    Returns:
+        Float32 feature track with one value per frame
+    """
+    padded = np.pad(audio, frame_length // 2, mode=pad_mode)
+    frames = np.lib.stride_tricks.sliding_window_view(padded, frame_length)
+    frames = frames[::hop_length]
+    
+    track = np.empty(len(frames), dtype=np.float32)
+    for start in range(0, len(frames), STFT_BLOCK_FRAMES):
+        stop = start + STFT_BLOCK_FRAMES
+        track[start:stop] = reducer(frames[start:stop])
+    
+    return track
+
+
+def _frame_rms(frames: np.ndarray) -> np.ndarray:
+    """RMS of each frame, as librosa.feature.rms."""
+    return np.sqrt(np.mean(np.square(frames), axis=1))
+
+
+def _frame_zero_crossing_rate(frames: np.ndarray) -> np.ndarray:
+    """Zero-crossing rate of each frame, as librosa.feature.zero_crossing_rate."""
+    # Near-silent samples count as zero, and zero counts as positive
+    signs = np.signbit(np.where(np.abs(frames) <= 1e-10, 0, frames))
+    return np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / frames.shape[1]
+
+
+@lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """
+    Whether torch and torchaudio are installed and a CUDA device is usable.
+    
+    torch is only imported here, on first use, so CPU-only analysis does not
+    pay for loading it.
+    """
+    try:
+        import torch
+        import torchaudio  # noqa: F401
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+def _gpu_spectral_features(audio: np.ndarray, sr: int, n_fft: int = 2048,
+                           hop_length: int = 512) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Magnitude spectrogram and spectral centroid computed on the GPU with torchaudio.
+    
+    Args:
+        audio: Mono audio signal
+        sr: Sample rate
+        n_fft: FFT size
+        hop_length: Samples between frames
+        
+    Returns:
+        Tuple of (float32 magnitude spectrogram, spectral centroid per frame)
+    """
+    import torch
+    import torchaudio
+    
+    device = torch.device("cuda")
+    spectrogram = torchaudio.transforms.Spectrogram(
+        n_fft=n_fft, hop_length=hop_length, power=1.0, pad_mode="constant"
+    ).to(device)
+    
+    with torch.no_grad():
+        magnitude = spectrogram(torch.from_numpy(audio).to(device))
+        freqs = torch.linspace(0, sr / 2, magnitude.shape[0], device=device)
+        weighted = (freqs[:, None] * magnitude).sum(0)
+        centroid = weighted / magnitude.sum(0).clamp_min(1e-10)
+    
+    return magnitude.cpu().numpy(), centroid.cpu().numpy()
+
+
+def _rms(x: np.ndarray) -> float:
+    """RMS of an array via BLAS nrm2, without a squared temporary."""
+    return float(np.linalg.norm(x) / np.sqrt(x.size))
+
+
+def _rms_range(cumsq: np.ndarray, start, end):
+    """
+    RMS of samples [start, end) (scalars or index arrays) from a
+    zero-prefixed cumulative sum of squares.
+    """
+    return np.sqrt((cumsq[end] - cumsq[start]) / (end - start))
+
+
+@lru_cache(maxsize=8)
+def _fade_curves(fade_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Read-only linear fade-out and fade-in ramps of the given length."""
+    fade_out = np.linspace(1, 0, fade_samples, dtype=np.float32)
+    fade_in = np.linspace(0, 1, fade_samples, dtype=np.float32)
+    fade_out.flags.writeable = False
+    fade_in.flags.writeable = False
+    return fade_out, fade_in
+
+
+def _row_pearson(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pearson correlation between matching rows of two 2-D arrays (NaN -> 0)."""
+    a0 = a - a.mean(axis=1, keepdims=True)
+    b0 = b - b.mean(axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.einsum("ij,ij->i", a0, b0) / np.sqrt(
+            np.einsum("ij,ij->i", a0, a0) * np.einsum("ij,ij->i", b0, b0)
+        )
+    return np.nan_to_num(corr, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def _mean_spectra(magnitude: np.ndarray, starts: np.ndarray, length: int) -> np.ndarray:
+    """Average spectrogram columns over non-overlapping sample windows."""
+    first = librosa.samples_to_frames(starts)
+    last = librosa.samples_to_frames(starts + length) + 1
+    counts = last - first
+    
+    # reduceat sums each [first, last) pair; a trailing bound past the final
+    # frame is dropped so the last window simply runs to the end
+    bounds = np.column_stack((first, last)).ravel()
+    if bounds[-1] >= magnitude.shape[1]:
+        bounds = bounds[:-1]
+        counts[-1] = magnitude.shape[1] - first[-1]
+    sums = np.add.reduceat(magnitude, bounds, axis=1)[:, ::2]
+    
+    return (sums / counts).T
+
 
 class IntelligentAudioClipper:
     """Advanced audio clipping and segmentation system."""
@@ -41,8 +232,13 @@ class IntelligentAudioClipper:
         
         # Load audio
         audio, sr = librosa.load(audio_file_path, sr=self.sample_rate)
+        # Keep a single contiguous float32 buffer to halve bandwidth on every pass
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
         duration = len(audio) / sr
         
+        # Frame-level features shared by the analysis helpers
+        features = self._compute_features(audio, sr)
+        
         # Comprehensive analysis
         analysis_results = {
             'file_info': {
@@ -50,11 +246,13 @@ class IntelligentAudioClipper:
                 'duration': duration,
                 'sample_rate': sr
             },
-            'audio_characteristics': self._analyze_audio_characteristics(audio, sr),
-            'segment_analysis': self._segment_audio(audio, sr),
-            'loop_analysis': self._find_perfect_loops(audio, sr),
-            'transition_points': self._find_transition_points(audio, sr),
-            'quality_metrics': self._assess_audio_quality(audio, sr)
+            "audio_characteristics": self._analyze_audio_characteristics(
+                audio, sr, features
+            ),
+            "segment_analysis": self._segment_audio(audio, sr, features),
+            "loop_analysis": self._find_perfect_loops(audio, sr, features),
+            "transition_points": self._find_transition_points(audio, sr, features),
+            "quality_metrics": self._assess_audio_quality(audio, sr, features)
         }
         
         # Extract segments if output directory provided
@@ -66,24 +264,54 @@ class IntelligentAudioClipper:
             
         return analysis_results
     
-    def _analyze_audio_characteristics(self, audio: np.ndarray, sr: int) -> Dict:
+    def _compute_features(self, audio: np.ndarray, sr: int) -> Dict:
+        """Compute the frame-level features reused across the analysis passes."""
+        if _cuda_available():
+            magnitude, spectral_centroid = _gpu_spectral_features(audio, sr)
+        else:
+            magnitude = _magnitude_spectrogram(audio)
+            spectral_centroid = librosa.feature.spectral_centroid(S=magnitude, sr=sr)[0]
+        tempo, beats = librosa.beat.beat_track(y=audio, sr=sr)
+        
+        if len(audio) > LONG_AUDIO_SECONDS * sr:
+            # librosa materialises every frame for these; bound the temporaries
+            rms = _blocked_frame_feature(audio, _frame_rms, pad_mode="constant")
+            zcr = _blocked_frame_feature(
+                audio, _frame_zero_crossing_rate, pad_mode="edge"
+            )
+        else:
+            rms = librosa.feature.rms(y=audio)[0]
+            zcr = librosa.feature.zero_crossing_rate(audio)[0]
+        
+        return {
+            "magnitude": magnitude,
+            "tempo": tempo,
+            "beats": beats,
+            "rms": rms,
+            "zcr": zcr,
+            "spectral_centroid": spectral_centroid,
+            # Running sum of squares gives any window's RMS in O(1)
+            "cumsq": np.concatenate(
+                ([0.0], np.cumsum(np.square(audio, dtype=np.float64)))
+            )
+        }
+    
+    def _analyze_audio_characteristics(self, audio: np.ndarray, sr: int,
+                                       features: Dict) -> Dict:
         """Analyze fundamental audio characteristics."""
         try:
             # Basic audio properties
-            rms = librosa.feature.rms(y=audio)[0]
-            spectral_centroid = librosa.feature.spectral_centroid(y=audio, sr=sr)[0]
-            spectral_rolloff = librosa.feature.spectral_rolloff(y=audio, sr=sr)[0]
-            zero_crossing_rate = librosa.feature.zero_crossing_rate(audio)[0]
+            rms = features["rms"]
+            spectral_centroid = features["spectral_centroid"]
+            magnitude = features["magnitude"]
+            spectral_rolloff = librosa.feature.spectral_rolloff(S=magnitude, sr=sr)[0]
+            zero_crossing_rate = features["zcr"]
             
             # Tempo and rhythm
-            tempo, beats = librosa.beat.beat_track(y=audio, sr=sr)
-            
-            # Frequency analysis
-            stft = librosa.stft(audio)
-            magnitude = np.abs(stft)
+            tempo, beats = features["tempo"], features["beats"]
             
             # Classify content type
-            content_type = self._classify_audio_content(audio, sr)
+            content_type = self._classify_audio_content(audio, sr, features)
             
             return {
                 'content_type': content_type,
@@ -110,13 +338,15 @@ class IntelligentAudioClipper:
             logger.error(f"Error analyzing audio characteristics: {e}")
             return {}
     
-    def _classify_audio_content(self, audio: np.ndarray, sr: int) -> str:
+    def _classify_audio_content(self, audio: np.ndarray, sr: int,
+                                features: Dict) -> str:
         """Classify the type of audio content."""
         try:
             # Simple heuristic-based classification
-            rms = np.sqrt(np.mean(audio**2))
-            zcr = np.mean(librosa.feature.zero_crossing_rate(audio))
-            spectral_centroid = np.mean(librosa.feature.spectral_centroid(y=audio, sr=sr))
+            rms = _rms_range(features["cumsq"], 0, len(audio))
+            zcr = np.mean(features["zcr"])
+            spectral_centroid = np.mean(features["spectral_centroid"])
+            rms_variation = np.std(features["rms"])
             
             # Rain characteristics: high ZCR, broad spectrum, consistent energy
             if zcr > 0.1 and spectral_centroid > 2000:
@@ -130,14 +360,14 @@ class IntelligentAudioClipper:
                 return "thunder"
             
             # Ambient/drone: steady energy, low variation
-            if np.std(librosa.feature.rms(y=audio)) < 0.05:
+            if rms_variation < 0.05:
                 if spectral_centroid < 500:
                     return "ambient_drone"
                 else:
                     return "ambient_texture"
             
             # Wind: moderate ZCR, energy variation
-            if 0.05 < zcr < 0.15 and np.std(librosa.feature.rms(y=audio)) > 0.02:
+            if 0.05 < zcr < 0.15 and rms_variation > 0.02:
                 return "wind"
             
             return "unknown"
@@ -149,66 +379,73 @@ class IntelligentAudioClipper:
     def _analyze_frequency_bands(self, magnitude: np.ndarray, sr: int) -> Dict:
         """Analyze energy distribution across frequency bands."""
         try:
-            # Define frequency bands
-            freqs = librosa.fft_frequencies(sr=sr)
-            
-            # Energy in different bands
-            sub_bass = np.mean(magnitude[(freqs >= 20) & (freqs < 60)])
-            bass = np.mean(magnitude[(freqs >= 60) & (freqs < 250)])
-            low_mid = np.mean(magnitude[(freqs >= 250) & (freqs < 500)])
-            mid = np.mean(magnitude[(freqs >= 500) & (freqs < 2000)])
-            high_mid = np.mean(magnitude[(freqs >= 2000) & (freqs < 4000)])
-            presence = np.mean(magnitude[(freqs >= 4000) & (freqs < 6000)])
-            brilliance = np.mean(magnitude[(freqs >= 6000) & (freqs < 20000)])
+            # Locate the band edges among the FFT bins
+            freqs = librosa.fft_frequencies(sr=sr, n_fft=2 * (magnitude.shape[0] - 1))
+            edges = np.searchsorted(freqs, FREQUENCY_BAND_EDGES)
+            
+            # Mean energy per band from one pass over the spectrogram; the
+            # trailing zero keeps an edge at the top of the spectrum in range
+            mean_spectrum = np.append(magnitude.mean(axis=1), 0.0)
+            band_sums = np.add.reduceat(mean_spectrum, edges)[:-1]
+            counts = np.diff(edges)
+            band_energy = np.divide(
+                band_sums, counts, out=np.zeros(len(counts)), where=counts > 0
+            )
             
-            total_energy = sub_bass + bass + low_mid + mid + high_mid + presence + brilliance
+            total_energy = band_energy.sum()
             
             return {
-                'sub_bass': float(sub_bass / total_energy),
-                'bass': float(bass / total_energy),
-                'low_mid': float(low_mid / total_energy),
-                'mid': float(mid / total_energy),
-                'high_mid': float(high_mid / total_energy),
-                'presence': float(presence / total_energy),
-                'brilliance': float(brilliance / total_energy)
+                name: float(energy / total_energy)
+                for name, energy in zip(FREQUENCY_BAND_NAMES, band_energy, strict=True)
             }
             
         except Exception as e:
             logger.error(f"Error analyzing frequency bands: {e}")
             return {}
     
-    def _segment_audio(self, audio: np.ndarray, sr: int) -> List[Dict]:
+    def _segment_audio(self, audio: np.ndarray, sr: int, features: Dict) -> List[Dict]:
         """Segment audio into distinct sections."""
         try:
-            # Use onset detection for segmentation
-            onset_frames = librosa.onset.onset_detect(y=audio, sr=sr, units='frames')
-            onset_times = librosa.frames_to_time(onset_frames, sr=sr)
-            
-            # Also use spectral change points
-            chroma = librosa.feature.chroma_stft(y=audio, sr=sr)
-            tempo, beats = librosa.beat.beat_track(y=audio, sr=sr)
-            
-            # Simple segmentation based on significant changes
+            # Fixed-length segmentation
             segments = []
             segment_length = 30  # 30 second segments
-            
-            for i in range(0, len(audio), sr * segment_length):
-                end_idx = min(i + sr * segment_length, len(audio))
-                segment_audio = audio[i:end_idx]
-                
-                if len(segment_audio) < sr * 5:  # Skip segments shorter than 5 seconds
-                    continue
+            spectral_centroid = features["spectral_centroid"]
+            
+            # Skip segments shorter than 5 seconds
+            starts = np.arange(0, len(audio), sr * segment_length)
+            ends = np.minimum(starts + sr * segment_length, len(audio))
+            keep = ends - starts >= sr * 5
+            starts, ends = starts[keep], ends[keep]
+            if starts.size == 0:
+                return []
+            
+            # Loop potential: how well each segment's end joins its start,
+            # scored the same way as loop candidates
+            fade_length = int(0.5 * sr)
+            loop_potential = self._score_loop_candidates(
+                audio, features["magnitude"], features["cumsq"],
+                starts, ends - fade_length, fade_length
+            )["seamless_score"]
+            
+            for i, end_idx, potential in zip(
+                starts.tolist(), ends.tolist(), loop_potential, strict=True
+            ):
+                # Slice the global feature tracks instead of re-running the STFT
+                start_frame, end_frame = librosa.samples_to_frames([i, end_idx])
+                energy = _rms_range(features["cumsq"], i, end_idx)
                 
                 segment_analysis = {
                     'start_time': i / sr,
                     'end_time': end_idx / sr,
-                    'duration': len(segment_audio) / sr,
-                    'energy': float(np.sqrt(np.mean(segment_audio**2))),
+                    "duration": (end_idx - i) / sr,
+                    "energy": float(energy),
                     'spectral_centroid': float(np.mean(
-                        librosa.feature.spectral_centroid(y=segment_audio, sr=sr)
+                        spectral_centroid[start_frame:end_frame]
                     )),
-                    'loop_potential': self._assess_loop_potential(segment_audio, sr),
-                    'transition_suitability': self._assess_transition_suitability(segment_audio, sr)
+                    "loop_potential": float(potential),
+                    "transition_suitability": self._assess_transition_suitability(
+                        energy, features["rms"][start_frame:end_frame]
+                    )
                 }
                 
                 segments.append(segment_analysis)
@@ -219,40 +456,19 @@ class IntelligentAudioClipper:
             logger.error(f"Error segmenting audio: {e}")
             return []
     
-    def _find_perfect_loops(self, audio: np.ndarray, sr: int) -> List[Dict]:
+    def _find_perfect_loops(self, audio: np.ndarray, sr: int,
+                            features: Dict) -> List[Dict]:
         """Find segments that can loop seamlessly."""
         try:
-            loops = []
-            
             # Test different loop lengths
             loop_lengths = [10, 15, 20, 30, 45, 60]  # seconds
             
-            for length in loop_lengths:
-                length_samples = int(length * sr)
-                
-                if length_samples > len(audio):
-                    continue
-                
-                # Test multiple starting points
-                step = sr * 5  # Every 5 seconds
-                
-                for start_idx in range(0, len(audio) - length_samples, step):
-                    end_idx = start_idx + length_samples
-                    
-                    # Extract potential loop
-                    loop_segment = audio[start_idx:end_idx]
-                    
-                    # Test loop quality
-                    loop_quality = self._assess_loop_quality(loop_segment, sr)
-                    
-                    if loop_quality['seamless_score'] > 0.7:  # Good loop threshold
-                        loops.append({
-                            'start_time': start_idx / sr,
-                            'end_time': end_idx / sr,
-                            'duration': length,
-                            'quality_metrics': loop_quality,
-                            'loop_type': self._classify_loop_type(loop_segment, sr)
-                        })
+            # Lengths are independent; numpy releases the GIL so threads suffice
+            results = Parallel(n_jobs=-1, prefer="threads")(
+                delayed(self._score_loops_of_length)(length, audio, sr, features)
+                for length in loop_lengths
+            )
+            loops = [loop for length_loops in results for loop in length_loops]
             
             # Sort by quality and return best candidates
             loops.sort(key=lambda x: x['quality_metrics']['seamless_score'], reverse=True)
@@ -262,61 +478,98 @@ class IntelligentAudioClipper:
             logger.error(f"Error finding perfect loops: {e}")
             return []
     
-    def _assess_loop_quality(self, audio: np.ndarray, sr: int) -> Dict:
-        """Assess how well an audio segment can loop."""
-        try:
-            # Compare beginning and end for seamless transition
-            fade_length = int(0.5 * sr)  # 0.5 second comparison
-            
-            if len(audio) < fade_length * 2:
-                return {'seamless_score': 0.0}
-            
-            beginning = audio[:fade_length]
-            ending = audio[-fade_length:]
-            
-            # Correlation between beginning and end
-            correlation = np.corrcoef(beginning, ending)[0, 1]
-            if np.isnan(correlation):
-                correlation = 0.0
-            
-            # RMS energy difference
-            rms_beginning = np.sqrt(np.mean(beginning**2))
-            rms_ending = np.sqrt(np.mean(ending**2))
-            energy_match = 1.0 - abs(rms_beginning - rms_ending)
-            
-            # Spectral similarity
-            spec_beginning = np.abs(librosa.stft(beginning))
-            spec_ending = np.abs(librosa.stft(ending))
-            
-            spec_corr = np.corrcoef(
-                np.mean(spec_beginning, axis=1),
-                np.mean(spec_ending, axis=1)
-            )[0, 1]
-            
-            if np.isnan(spec_corr):
-                spec_corr = 0.0
-            
-            # Overall seamless score
-            seamless_score = (correlation * 0.4 + energy_match * 0.3 + spec_corr * 0.3)
-            
-            return {
-                'seamless_score': float(max(0, seamless_score)),
-                'correlation': float(correlation),
-                'energy_match': float(energy_match),
-                'spectral_match': float(spec_corr)
-            }
+    def _score_loops_of_length(self, length: int, audio: np.ndarray, sr: int,
+                               features: Dict) -> List[Dict]:
+        """Find good loops of a single length across all starting points."""
+        length_samples = int(length * sr)
+        
+        if length_samples > len(audio):
+            return []
+        
+        # Compare 0.5 second windows at either end, testing a start every 5 seconds
+        fade_length = int(0.5 * sr)
+        starts = np.arange(0, len(audio) - length_samples, sr * 5)
+        if starts.size == 0:
+            return []
+        
+        quality = self._score_loop_candidates(
+            audio, features["magnitude"], features["cumsq"],
+            starts, starts + length_samples - fade_length, fade_length
+        )
+        
+        loops = []
+        # Good loop threshold
+        for idx in np.flatnonzero(quality["seamless_score"] > 0.7):
+            start_idx = int(starts[idx])
+            end_idx = start_idx + length_samples
+            
+            loops.append({
+                "start_time": start_idx / sr,
+                "end_time": end_idx / sr,
+                "duration": length,
+                "quality_metrics": {
+                    name: float(values[idx]) for name, values in quality.items()
+                },
+                "loop_type": self._classify_loop_type(
+                    features, *librosa.samples_to_frames([start_idx, end_idx])
+                )
+            })
+        
+        return loops
+    
+    def _score_loop_candidates(self, audio: np.ndarray, magnitude: np.ndarray,
+                               cumsq: np.ndarray, head_starts: np.ndarray,
+                               tail_starts: np.ndarray,
+                               fade_length: int) -> Dict[str, np.ndarray]:
+        """
+        Score how seamlessly many candidate loops join their end to their start.
+        
+        Args:
+            audio: Full audio signal
+            magnitude: Magnitude spectrogram of the full signal
+            cumsq: Cumulative sum of squared samples, prefixed with zero
+            head_starts: Sample offsets of each candidate's opening window
+            tail_starts: Sample offsets of each candidate's closing window
+            fade_length: Window length in samples
             
-        except Exception as e:
-            logger.error(f"Error assessing loop quality: {e}")
-            return {'seamless_score': 0.0}
+        Returns:
+            Dictionary of per-candidate score arrays
+        """
+        # Correlation between beginning and end
+        windows = np.lib.stride_tricks.sliding_window_view(audio, fade_length)
+        correlation = _row_pearson(windows[head_starts], windows[tail_starts])
+        
+        # RMS energy difference
+        rms_beginning = _rms_range(cumsq, head_starts, head_starts + fade_length)
+        rms_ending = _rms_range(cumsq, tail_starts, tail_starts + fade_length)
+        energy_match = 1.0 - np.abs(rms_beginning - rms_ending)
+        
+        # Spectral similarity of the average spectra over each window
+        spectral_match = _row_pearson(
+            _mean_spectra(magnitude, head_starts, fade_length),
+            _mean_spectra(magnitude, tail_starts, fade_length)
+        )
+        
+        # Overall seamless score
+        seamless_score = correlation * 0.4 + energy_match * 0.3 + spectral_match * 0.3
+        
+        return {
+            "seamless_score": np.maximum(0, seamless_score),
+            "correlation": correlation,
+            "energy_match": energy_match,
+            "spectral_match": spectral_match
+        }
     
-    def _classify_loop_type(self, audio: np.ndarray, sr: int) -> str:
-        """Classify the type of loop based on its characteristics."""
+    def _classify_loop_type(self, features: Dict, start_frame: int,
+                            end_frame: int) -> str:
+        """Classify the type of loop from the shared feature tracks over its frames."""
         try:
             # Analyze the loop characteristics
-            rms = np.mean(librosa.feature.rms(y=audio))
-            zcr = np.mean(librosa.feature.zero_crossing_rate(audio))
-            spectral_centroid = np.mean(librosa.feature.spectral_centroid(y=audio, sr=sr))
+            rms = np.mean(features["rms"][start_frame:end_frame])
+            zcr = np.mean(features["zcr"][start_frame:end_frame])
+            spectral_centroid = np.mean(
+                features["spectral_centroid"][start_frame:end_frame]
+            )
             
             # Simple classification
             if rms < 0.01:
@@ -334,27 +587,42 @@ class IntelligentAudioClipper:
             logger.error(f"Error classifying loop type: {e}")
             return "unknown"
     
-    def _find_transition_points(self, audio: np.ndarray, sr: int) -> List[Dict]:
+    def _find_transition_points(self, audio: np.ndarray, sr: int,
+                                features: Dict) -> List[Dict]:
         """Find good points for transitioning between different audio content."""
         try:
             # Find points with low energy (good for transitions)
-            rms = librosa.feature.rms(y=audio, hop_length=sr//4)[0]  # Every 0.25 seconds
-            
-            # Find local minima in energy
-            from scipy.signal import argrelmin
-            
-            min_indices = argrelmin(rms, order=int(sr/2))[0]  # At least 0.5 seconds apart
+            hop_length = sr // 4
+            # Every 0.25 seconds
+            rms = librosa.feature.rms(y=audio, hop_length=hop_length)[0]
+            
+            # Find below-average local minima in energy with a sliding minimum filter
+            min_gap = max(1, int(0.5 * sr / hop_length))  # Frames in 0.5 seconds
+            local_min = minimum_filter1d(rms, size=2 * min_gap + 1)
+            is_min = (rms == local_min) & (rms < rms.mean())
+            is_min[[0, -1]] = False  # The file boundaries are not transitions
+            min_indices = np.flatnonzero(is_min)
+            
+            # Keep minima at least 0.5 seconds apart (collapses flat plateaus)
+            if min_indices.size:
+                keep = np.concatenate(([True], np.diff(min_indices) >= min_gap))
+                min_indices = min_indices[keep]
             
             transitions = []
             for idx in min_indices:
                 time = idx * 0.25  # Convert to time
                 
-                # Get surrounding context for analysis
+                # Get surrounding context for analysis from the shared frame tracks
                 start_sample = max(0, int((time - 1) * sr))
                 end_sample = min(len(audio), int((time + 1) * sr))
-                context = audio[start_sample:end_sample]
+                start_frame, end_frame = librosa.samples_to_frames(
+                    [start_sample, end_sample]
+                )
                 
-                transition_quality = self._assess_transition_quality(context, sr)
+                transition_quality = self._assess_transition_quality(
+                    features["rms"][start_frame:end_frame],
+                    features["spectral_centroid"][start_frame:end_frame]
+                )
                 
                 transitions.append({
                     'time': time,
@@ -370,15 +638,15 @@ class IntelligentAudioClipper:
             logger.error(f"Error finding transition points: {e}")
             return []
     
-    def _assess_transition_quality(self, audio: np.ndarray, sr: int) -> float:
-        """Assess how suitable a point is for transitions."""
+    def _assess_transition_quality(self, rms: np.ndarray,
+                                   spectral_centroid: np.ndarray) -> float:
+        """Assess how suitable a point is for transitions from RMS and centroid."""
         try:
             # Low energy is good for transitions
-            energy = np.sqrt(np.mean(audio**2))
+            energy = _rms(rms)
             energy_score = max(0, 1.0 - energy * 5)  # Invert energy
             
             # Stable spectral content is good
-            spectral_centroid = librosa.feature.spectral_centroid(y=audio, sr=sr)[0]
             spectral_stability = 1.0 - min(1.0, np.std(spectral_centroid) / 1000)
             
             return float(energy_score * 0.6 + spectral_stability * 0.4)
@@ -387,19 +655,19 @@ class IntelligentAudioClipper:
             logger.error(f"Error assessing transition quality: {e}")
             return 0.0
     
-    def _assess_audio_quality(self, audio: np.ndarray, sr: int) -> Dict:
+    def _assess_audio_quality(self, audio: np.ndarray, sr: int, features: Dict) -> Dict:
         """Assess overall audio quality metrics."""
         try:
             # Dynamic range
-            dynamic_range = 20 * np.log10(np.max(np.abs(audio))) - 20 * np.log10(np.sqrt(np.mean(audio**2)))
+            peak_db = 20 * np.log10(np.max(np.abs(audio)))
+            dynamic_range = peak_db - 20 * np.log10(_rms(audio))
             
             # Clipping detection
             clipping_ratio = np.sum(np.abs(audio) > 0.99) / len(audio)
             
             # Signal-to-noise ratio estimation
             # Simple approach: compare energy in different frequency bands
-            stft = librosa.stft(audio)
-            magnitude = np.abs(stft)
+            magnitude = features["magnitude"]
             
             # Estimate noise floor (lowest 10% of magnitudes)
             noise_floor = np.percentile(magnitude, 10)
@@ -426,18 +694,11 @@ class IntelligentAudioClipper:
         
         return float(dr_score * 0.4 + clipping_score * 0.4 + snr_score * 0.2)
     
-    def _assess_loop_potential(self, audio: np.ndarray, sr: int) -> float:
-        """Quick assessment of how well this segment might loop."""
-        if len(audio) < sr * 5:  # Need at least 5 seconds
-            return 0.0
-            
-        return self._assess_loop_quality(audio, sr)['seamless_score']
-    
-    def _assess_transition_suitability(self, audio: np.ndarray, sr: int) -> float:
-        """Quick assessment of transition suitability."""
+    def _assess_transition_suitability(self, rms: float,
+                                       frame_rms: np.ndarray) -> float:
+        """Quick assessment of transition suitability from overall and frame RMS."""
         # Look for stable, low-energy sections
-        rms = np.sqrt(np.mean(audio**2))
-        rms_variation = np.std(librosa.feature.rms(y=audio)[0])
+        rms_variation = np.std(frame_rms)
         
         # Good for transitions: low energy, low variation
         energy_score = max(0, 1.0 - rms * 3)
@@ -454,7 +715,8 @@ class IntelligentAudioClipper:
             output_path.mkdir(parents=True, exist_ok=True)
             
             source_name = Path(source_file).stem
-            extracted_files = []
+            audio_tasks = []
+            metadata_tasks = []
             
             # Extract best loops
             loops = analysis.get('loop_analysis', [])
@@ -466,11 +728,12 @@ class IntelligentAudioClipper:
                 filename = f"{source_name}_loop_{i+1}_{loop['duration']}s.wav"
                 file_path = output_path / filename
                 
-                # Add crossfade for perfect looping
-                loop_audio = self._add_loop_crossfade(loop_audio, sr)
-                
-                sf.write(str(file_path), loop_audio, sr)
-                extracted_files.append(str(file_path))
+                # Add crossfade for perfect looping (on a contiguous copy, since
+                # the crossfade is applied in place)
+                loop_audio = self._add_loop_crossfade(
+                    np.array(loop_audio, order="C"), sr
+                )
+                audio_tasks.append((str(file_path), loop_audio))
                 
                 # Save loop metadata
                 metadata = {
@@ -481,10 +744,7 @@ class IntelligentAudioClipper:
                     'quality_metrics': loop['quality_metrics'],
                     'loop_type': loop['loop_type']
                 }
-                
-                metadata_path = file_path.with_suffix('.json')
-                with open(metadata_path, 'w') as f:
-                    json.dump(metadata, f, indent=2)
+                metadata_tasks.append((file_path.with_suffix(".json"), metadata))
             
             # Extract best segments for other uses
             segments = analysis.get('segment_analysis', [])
@@ -497,9 +757,25 @@ class IntelligentAudioClipper:
                 
                 filename = f"{source_name}_segment_{i+1}_{segment['duration']:.1f}s.wav"
                 file_path = output_path / filename
-                
-                sf.write(str(file_path), segment_audio, sr)
-                extracted_files.append(str(file_path))
+                audio_tasks.append((str(file_path), segment_audio))
+            
+            # Writes are I/O bound and release the GIL, so overlap them
+            def write_audio(task):
+                sf.write(task[0], task[1], sr, subtype="PCM_16")
+            
+            def write_metadata(task):
+                with open(task[0], "w") as f:
+                    json.dump(task[1], f, indent=2)
+            
+            with ThreadPoolExecutor(max_workers=MAX_WRITE_WORKERS) as executor:
+                futures = [executor.submit(write_audio, task) for task in audio_tasks]
+                futures += [
+                    executor.submit(write_metadata, task) for task in metadata_tasks
+                ]
+                for future in futures:
+                    future.result()
+            
+            extracted_files = [path for path, _ in audio_tasks]
             
             logger.info(f"Extracted {len(extracted_files)} segments from {source_file}")
             return extracted_files
@@ -517,11 +793,13 @@ class IntelligentAudioClipper:
                 return audio
             
             # Create crossfade
-            fade_out = np.linspace(1, 0, fade_samples)
-            fade_in = np.linspace(0, 1, fade_samples)
+            fade_out, fade_in = _fade_curves(fade_samples)
             
-            # Apply crossfade
-            audio[-fade_samples:] = audio[-fade_samples:] * fade_out + audio[:fade_samples] * fade_in
+            # Apply crossfade in place with a single temporary
+            faded_head = np.multiply(audio[:fade_samples], fade_in)
+            tail = audio[-fade_samples:]
+            np.multiply(tail, fade_out, out=tail)
+            np.add(tail, faded_head, out=tail)
             
             return audio
             
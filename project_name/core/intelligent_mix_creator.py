@@ -1,17 +1,112 @@
 import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-from pydub import AudioSegment  # Required for mix generation
+import soundfile as sf
+
+try:
+    import numexpr as ne
+
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
 
 from .analysis_pipeline import AudioAnalysisPipeline
-from .audio_metadata import AudioAnalysisData, AudioMetadata
+from .audio_metadata import AudioMetadata
 from .mix_creator import MixCreator  # Assuming MixCreator is in the same directory
 
 logger = logging.getLogger(__name__)
 
 
+# Sample rate of the placeholder file written by _generate_intelligent_mix
+PLACEHOLDER_SAMPLE_RATE = 44100
+
+# Row of SLEEP_PHASE_WEIGHTS for each known sleep phase
+SLEEP_PHASE_ROWS = {"falling_asleep": 0, "deep_sleep": 1, "rem": 2}
+# Phase suitability weights over the features
+# [relaxation, 1 - arousal, ambient, masking]:
+#   falling_asleep: low arousal is key
+#   deep_sleep: very low arousal, consistent, masking
+#   rem: more varied, still prefer lower arousal
+SLEEP_PHASE_WEIGHTS = np.array(
+    [
+        [0.4, 0.4, 0.2, 0.0],
+        [0.0, 0.5, 0.3, 0.2],
+        [0.3, 0.3, 0.4, 0.0],
+    ],
+    dtype=np.float32,
+)
+
+# Selector score formulas over the columns built by _stack_analysis, as
+# numexpr expressions. Each has a NumPy twin below for when numexpr is missing.
+FOCUS_SCORE_EXPRESSION = (
+    "focus * 0.5 + (1 - arousal) * 0.3 + (1 - abs(valence - 0.5)) * 0.2"
+)
+RELAX_SCORE_EXPRESSION = "relax * 0.5 + (1 - arousal) * 0.3 + valence * 0.2"
+
+
+def _focus_scores(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """NumPy form of FOCUS_SCORE_EXPRESSION."""
+    return (
+        columns["focus"] * 0.5
+        + (1 - columns["arousal"]) * 0.3
+        + (1 - np.abs(columns["valence"] - 0.5)) * 0.2
+    )
+
+
+def _relax_scores(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """NumPy form of RELAX_SCORE_EXPRESSION."""
+    return (
+        columns["relax"] * 0.5
+        + (1 - columns["arousal"]) * 0.3
+        + columns["valence"] * 0.2
+    )
+
+
+def _evaluate_scores(
+    expression: str,
+    numpy_scores: Callable[[Dict[str, np.ndarray]], np.ndarray],
+    columns: Dict[str, np.ndarray],
+) -> np.ndarray:
+    """Evaluate a selector score over stacked clip features.
+
+    Uses numexpr's threaded single-pass evaluation of `expression` when it is
+    installed and the equivalent NumPy function otherwise.
+
+    Args:
+        expression: numexpr expression over the feature names in `columns`
+        numpy_scores: NumPy function computing the same scores from `columns`
+        columns: Feature name -> array, as returned by _stack_analysis
+
+    Returns:
+        Array with one score per clip
+    """
+    if NUMEXPR_AVAILABLE:
+        return ne.evaluate(expression, local_dict=columns)
+    return numpy_scores(columns)
+
+
+# Analysis pipeline of a worker process, created on its first task
+_worker_pipeline: Optional[AudioAnalysisPipeline] = None
+
+
+def _analyze_clip_in_worker(file_path: Path) -> Optional[AudioMetadata]:
+    """Analyze one clip in a pool worker, reusing that worker's pipeline."""
+    global _worker_pipeline
+    try:
+        if _worker_pipeline is None:
+            _worker_pipeline = AudioAnalysisPipeline()
+        return _worker_pipeline.analyze_audio_file(file_path)
+    except Exception as e:
+        logger.error(f"Failed to analyze clip {file_path}: {e}")
+        return None
+
+
 class IntelligentMixCreator(MixCreator):
     """Enhanced MixCreator with intelligent audio analysis integration"""
 
@@ -20,9 +115,7 @@ class IntelligentMixCreator(MixCreator):
     ):  # Added output_folder to super()
         super().__init__(output_folder=output_folder)  # Pass output_folder to parent
         self.analysis_pipeline = AudioAnalysisPipeline()
-        self.analyzed_clips: Dict[
-            str, AudioMetadata
-        ] = {}  # Store by file_path as string
+        self.analyzed_clips: Dict[Path, AudioMetadata] = {}  # Keyed by clip path
 
     def add_clip_with_analysis(
         self, file_path: Path, force_reanalysis: bool = False
@@ -32,13 +125,48 @@ class IntelligentMixCreator(MixCreator):
             metadata = self.analysis_pipeline.analyze_audio_file(
                 file_path, force_reanalysis=force_reanalysis
             )
-            self.analyzed_clips[str(file_path)] = metadata
+            self.analyzed_clips[file_path] = metadata
             logger.info(f"Analyzed and cached metadata for {file_path}")
             return metadata
         except Exception as e:
             logger.error(f"Failed to analyze or add clip {file_path}: {e}")
             return None
 
+    def analyze_clips_parallel(
+        self, clip_paths: List[Path], max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Analyze clips concurrently in worker processes and store the results.
+
+        Each worker builds its own AudioAnalysisPipeline, as the pipeline holds
+        models that cannot be pickled. Workers are spawned rather than forked,
+        since forking a process that has already loaded TensorFlow can
+        deadlock; the models are therefore loaded once per worker, which only
+        pays off for larger batches of clips.
+
+        Args:
+            clip_paths: Clips to analyze
+            max_workers: Worker processes to use (defaults to the CPU count)
+        """
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = {
+                executor.submit(_analyze_clip_in_worker, path): path
+                for path in clip_paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    metadata = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to analyze or add clip {path}: {e}")
+                    continue
+                if metadata:
+                    self.analyzed_clips[path] = metadata
+                    logger.info(f"Analyzed and cached metadata for {path}")
+
     def create_intelligent_mix(  # Renamed for clarity, more generic
         self,
         clip_paths: List[Path],
@@ -48,18 +176,36 @@ class IntelligentMixCreator(MixCreator):
         add_binaural_beats: bool = False,  # from parent
         binaural_base_freq: float = 200.0,  # from parent
         binaural_beat_freq: float = 5.0,  # from parent
+        max_workers: Optional[int] = None,  # Analysis processes; None analyzes inline
     ) -> Optional[Path]:
         """Create mix using intelligent analysis based on mix_type."""
+        # Drop repeated paths (keeping order) so no clip is analyzed or mixed twice
+        clip_paths = list(dict.fromkeys(clip_paths))
 
-        analyzed_clips_data: List[AudioMetadata] = []
+        # Reuse analyses from earlier runs before spending any workers
+        pending = []
         for path in clip_paths:
-            path_str = str(path)
-            if path_str not in self.analyzed_clips:
-                meta = self.add_clip_with_analysis(path)
-                if meta:
-                    analyzed_clips_data.append(meta)
+            if path in self.analyzed_clips:
+                continue
+            metadata = self.analysis_pipeline.load_cached_analysis(path)
+            if metadata is not None:
+                self.analyzed_clips[path] = metadata
             else:
-                analyzed_clips_data.append(self.analyzed_clips[path_str])
+                pending.append(path)
+
+        # Worker processes are opt-in: each one reloads the analysis models
+        if max_workers and max_workers > 1 and len(pending) > 1:
+            self.analyze_clips_parallel(pending, max_workers=max_workers)
+        else:
+            for path in pending:
+                self.add_clip_with_analysis(path)
+
+        # One dict lookup per clip
+        analyzed_clips_data: List[AudioMetadata] = [
+            metadata
+            for path in clip_paths
+            if (metadata := self.analyzed_clips.get(path)) is not None
+        ]
 
         if not analyzed_clips_data:
             logger.warning(
@@ -108,15 +254,12 @@ class IntelligentMixCreator(MixCreator):
 
         # Construct audio_files dict for parent create_mix
         # This is a temporary adaptation. Ideally, parent create_mix would be more flexible.
-        intelligent_audio_files: Dict[str, List[str]] = {"selected_for_mix": []}
-        for metadata, score in selected_clips_with_scores:
-            intelligent_audio_files["selected_for_mix"].append(str(metadata.file_path))
-
-        if not intelligent_audio_files["selected_for_mix"]:
-            logger.warning(
-                "No clips selected for the intelligent mix based on criteria."
-            )
-            return None
+        # Non-empty: an empty selection already returned above
+        intelligent_audio_files: Dict[str, List[str]] = {
+            "selected_for_mix": [
+                str(metadata.file_path) for metadata, _ in selected_clips_with_scores
+            ]
+        }
 
         # Use parent's create_mix for actual audio generation with selected files
         # We are passing a single category here. The parent's logic will pick from this.
@@ -135,104 +278,113 @@ class IntelligentMixCreator(MixCreator):
             return Path(output_path_str)
         return None
 
-    def _select_clips_for_sleep(
-        self, clips: List[AudioMetadata], sleep_phase: str
-    ) -> List[Tuple[AudioMetadata, float]]:
-        """Select and score clips for sleep mix"""
-        scored_clips = []
+    def _stack_analysis(
+        self, clips: List[AudioMetadata]
+    ) -> Tuple[List[AudioMetadata], Dict[str, np.ndarray]]:
+        """
+        Gather the scoring features of analyzed clips into per-feature arrays.
+
+        Args:
+            clips: Candidate clips; those without analysis data are skipped
+
+        Returns:
+            Tuple of (clips with analysis data, feature name -> array aligned with them)
+        """
+        analyzed = []
         for clip_meta in clips:
-            if not clip_meta.analysis:
+            if clip_meta.analysis:
+                analyzed.append(clip_meta)
+            else:
                 logger.debug(
                     f"Skipping clip {clip_meta.file_path} due to missing analysis data."
                 )
-                continue
 
-            analysis_data = clip_meta.analysis
-            score = self._calculate_sleep_suitability_score(analysis_data, sleep_phase)
+        analyses = [clip_meta.analysis for clip_meta in analyzed]
+        columns = {
+            # Scores are all in [0, 1]; float32 halves the memory traffic
+            name: np.fromiter(
+                (getattr(analysis, attr) for analysis in analyses),
+                dtype=np.float32,
+                count=len(analyses),
+            )
+            for name, attr in (
+                ("relax", "relaxation_factor"),
+                ("arousal", "arousal"),
+                ("valence", "valence"),
+                ("focus", "focus_enhancement_score"),
+                ("ambient", "ambient_score"),
+                ("masking", "masking_potential"),
+                ("sleep_pot", "sleep_induction_potential"),
+            )
+        }
+        return analyzed, columns
+
+    def _top_scored_clips(
+        self,
+        clips: List[AudioMetadata],
+        scores: np.ndarray,
+        limit: int = 8,
+        threshold: float = 0.3,
+    ) -> List[Tuple[AudioMetadata, float]]:
+        """Best `limit` clips scoring above `threshold`, highest first."""
+        candidates = np.flatnonzero(scores > threshold)
+        if len(candidates) > limit:
+            candidates = candidates[
+                np.argpartition(-scores[candidates], limit - 1)[:limit]
+            ]
+        # Highest score first; ties keep their input order
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [(clips[i], float(scores[i])) for i in candidates]
 
-            if score > 0.3:  # Minimum threshold
-                scored_clips.append((clip_meta, score))
+    def _select_clips_for_sleep(
+        self, clips: List[AudioMetadata], sleep_phase: str
+    ) -> List[Tuple[AudioMetadata, float]]:
+        """Select and score clips for sleep mix"""
+        analyzed, columns = self._stack_analysis(clips)
+        scores = self._calculate_sleep_suitability_scores(columns, sleep_phase)
 
-        scored_clips.sort(key=lambda x: x[1], reverse=True)
         logger.info(
-            f"Selected {len(scored_clips)} clips for sleep phase '{sleep_phase}' based on scores."
+            f"Selected {np.count_nonzero(scores > 0.3)} clips for sleep phase '{sleep_phase}' based on scores."
         )
-        return scored_clips[:8]  # Limit to top N clips
+        return self._top_scored_clips(analyzed, scores)  # Limit to top N clips
 
     def _select_clips_for_focus(
         self, clips: List[AudioMetadata]
     ) -> List[Tuple[AudioMetadata, float]]:
-        scored_clips = []
-        for clip_meta in clips:
-            if not clip_meta.analysis:
-                continue
-            analysis = clip_meta.analysis
-            # Prioritize focus_enhancement_score, low arousal, moderate valence
-            score = (
-                analysis.focus_enhancement_score * 0.5
-                + (1 - analysis.arousal) * 0.3  # Low arousal is good for focus
-                + (1 - abs(analysis.valence - 0.5))
-                * 0.2  # Neutral to slightly positive valence
-            )
-            if score > 0.3:
-                scored_clips.append((clip_meta, score))
-        scored_clips.sort(key=lambda x: x[1], reverse=True)
-        return scored_clips[:8]
+        analyzed, columns = self._stack_analysis(clips)
+        # Prioritize focus_enhancement_score, low arousal, neutral valence
+        scores = _evaluate_scores(FOCUS_SCORE_EXPRESSION, _focus_scores, columns)
+        return self._top_scored_clips(analyzed, scores)
 
     def _select_clips_for_relax(
         self, clips: List[AudioMetadata]
     ) -> List[Tuple[AudioMetadata, float]]:
-        scored_clips = []
-        for clip_meta in clips:
-            if not clip_meta.analysis:
-                continue
-            analysis = clip_meta.analysis
-            # Prioritize relaxation_factor, low arousal, positive valence
-            score = (
-                analysis.relaxation_factor * 0.5
-                + (1 - analysis.arousal) * 0.3
-                + analysis.valence * 0.2  # Positive valence
-            )
-            if score > 0.3:
-                scored_clips.append((clip_meta, score))
-        scored_clips.sort(key=lambda x: x[1], reverse=True)
-        return scored_clips[:8]
-
-    def _calculate_sleep_suitability_score(
-        self, analysis: AudioAnalysisData, sleep_phase: str
-    ) -> float:
-        """Calculate how suitable a clip is for specific sleep phase"""
-        base_score = analysis.sleep_induction_potential
-
-        phase_score_component = 0.0
-        if sleep_phase == "falling_asleep":
-            phase_score_component = (
-                analysis.relaxation_factor * 0.4
-                +
-                # analysis.focus_enhancement_score * 0.2 + # Focus might be counterproductive for falling asleep
-                (1 - analysis.arousal) * 0.4  # Low arousal is key
-                + analysis.ambient_score * 0.2
-            )
-        elif sleep_phase == "deep_sleep":
-            phase_score_component = (
-                (1 - analysis.arousal) * 0.5  # Very low arousal
-                + analysis.ambient_score * 0.3  # Consistent ambient sounds
-                + analysis.masking_potential * 0.2  # Good for blocking disturbances
-            )
-        elif sleep_phase == "rem":  # REM sleep can have more varied brain activity
-            phase_score_component = (
-                analysis.relaxation_factor * 0.3
-                +
-                # analysis.harmonic_ratio * 0.2 + # Could be too stimulating
-                analysis.ambient_score * 0.4
-                + (1 - analysis.arousal) * 0.3  # Still prefer lower arousal
+        analyzed, columns = self._stack_analysis(clips)
+        # Prioritize relaxation_factor, low arousal, positive valence
+        scores = _evaluate_scores(RELAX_SCORE_EXPRESSION, _relax_scores, columns)
+        return self._top_scored_clips(analyzed, scores)
+
+    def _calculate_sleep_suitability_scores(
+        self, columns: Dict[str, np.ndarray], sleep_phase: str
+    ) -> np.ndarray:
+        """Calculate how suitable each stacked clip is for a sleep phase"""
+        base = columns["sleep_pot"]
+        row = SLEEP_PHASE_ROWS.get(sleep_phase)
+        if row is None:  # Default to base score if phase is unknown
+            return np.clip(base, 0.0, 1.0)
+
+        features = np.column_stack(
+            (
+                columns["relax"],
+                1 - columns["arousal"],
+                columns["ambient"],
+                columns["masking"],
             )
-        else:  # Default to base_score if phase is unknown
-            phase_score_component = base_score
+        )
+        phase_scores = features @ SLEEP_PHASE_WEIGHTS[row]
 
         # Weighted average: base sleep potential and phase-specific suitability
-        final_score = base_score * 0.6 + phase_score_component * 0.4
-        return float(np.clip(final_score, 0, 1))
+        return np.clip(base * 0.6 + phase_scores * 0.4, 0.0, 1.0)
 
     def _create_sleep_mix_plan(  # This method is from the prompt but not fully used yet
         self,
@@ -258,50 +410,65 @@ class IntelligentMixCreator(MixCreator):
         }
 
         # Simplified layering for now: sequence with crossfades
-        current_time = 0.0
-        for i, (clip_meta, score) in enumerate(selected_clips):
-            clip_duration = (
+        if not selected_clips:
+            return plan
+
+        # Constant for the whole plan
+        transition_ms = self.mix_profiles.get(sleep_phase, self.mix_profiles["sleep"])[
+            "crossfade"
+        ]
+        crossfade_s = self.mix_profiles["sleep"]["crossfade"] / 1000
+        share_duration = target_duration / len(selected_clips)
+        clip_durations = np.array(
+            [
                 clip_meta.analysis.duration if clip_meta.analysis else 300
-            )  # Default 5 mins
+                for clip_meta, _ in selected_clips
+            ],  # Default 5 mins
+            dtype=float,
+        )
+        scores = np.array([score for _, score in selected_clips], dtype=float)
 
-            # Adjust duration based on score or other factors (simplified)
-            effective_duration = min(
-                clip_duration,
-                (target_duration / len(selected_clips)) * (1 + score * 0.5),
-            )
+        # Adjust duration based on score or other factors (simplified)
+        effective_durations = np.minimum(
+            clip_durations,
+            share_duration * (1 + scores * 0.5),
+        )
 
-            if (
-                current_time + effective_duration > target_duration
-                and current_time < target_duration
-            ):
-                effective_duration = target_duration - current_time  # Trim last clip
-
-            if current_time >= target_duration:
-                break
-
-            plan["layers"].append(
-                {
-                    "file_path": str(clip_meta.file_path),
-                    "start_time": current_time,
-                    "duration": effective_duration,
-                    "volume_db": -6 * (1 - score),  # Quieter for lower scores (example)
-                }
-            )
+        # Each clip after the first overlaps its predecessor by the crossfade
+        steps = effective_durations - crossfade_s
+        steps[0] = effective_durations[0]
+        start_times = np.concatenate(([0.0], np.cumsum(steps[:-1])))
 
-            if i > 0:
-                plan["transitions"].append(
-                    {
-                        "from_layer_index": i - 1,
-                        "to_layer_index": i,
-                        "type": "crossfade",
-                        "duration_ms": self.mix_profiles.get(
-                            sleep_phase, self.mix_profiles["sleep"]
-                        )["crossfade"],
-                    }
-                )
-            current_time += effective_duration - (
-                self.mix_profiles["sleep"]["crossfade"] / 1000 if i > 0 else 0
+        # Keep clips that start before the target and trim them to end there
+        layer_count = int(np.count_nonzero(start_times < target_duration))
+        start_times = start_times[:layer_count]
+        effective_durations = np.minimum(
+            effective_durations[:layer_count], target_duration - start_times
+        )
+
+        plan["layers"] = [
+            {
+                "file_path": str(clip_meta.file_path),
+                "start_time": float(start_time),
+                "duration": float(duration),
+                "volume_db": -6 * (1 - score),  # Quieter for lower scores (example)
+            }
+            for (clip_meta, score), start_time, duration in zip(
+                selected_clips[:layer_count],
+                start_times,
+                effective_durations,
+                strict=True,
             )
+        ]
+        plan["transitions"] = [
+            {
+                "from_layer_index": i - 1,
+                "to_layer_index": i,
+                "type": "crossfade",
+                "duration_ms": transition_ms,
+            }
+            for i in range(1, layer_count)
+        ]
 
         logger.debug(f"Generated mix plan: {plan}")
         return plan
@@ -329,14 +496,22 @@ class IntelligentMixCreator(MixCreator):
 
         # Simplified example: just log the plan and return a dummy path
         # In a real scenario, this would produce an actual audio file.
-        dummy_output_filename = f"intelligent_mix_{mix_plan.get('sleep_phase', 'default')}_{int(time.time())}.mp3"
+        dummy_output_filename = f"intelligent_mix_{mix_plan.get('sleep_phase', 'default')}_{int(time.time())}.wav"
         dummy_output_path = Path(self.output_folder) / dummy_output_filename
 
-        # Create a silent file as a placeholder
-        silent_segment = AudioSegment.silent(
-            duration=int(mix_plan["target_duration"] * 1000)
-        )
-        silent_segment.export(str(dummy_output_path), format="mp3")
+        # Create a silent file as a placeholder, written a second at a time
+        # as raw PCM rather than encoding a full-length silent segment
+        silence = np.zeros(PLACEHOLDER_SAMPLE_RATE, dtype=np.int16)
+        total_samples = int(mix_plan["target_duration"] * PLACEHOLDER_SAMPLE_RATE)
+        with sf.SoundFile(
+            str(dummy_output_path),
+            "w",
+            samplerate=PLACEHOLDER_SAMPLE_RATE,
+            channels=1,
+            subtype="PCM_16",
+        ) as f:
+            for start in range(0, total_samples, PLACEHOLDER_SAMPLE_RATE):
+                f.write(silence[: total_samples - start])
 
         logger.warning(
             "Intelligent mix generation is currently a placeholder. Uses basic layering."
@@ -352,7 +527,7 @@ if __name__ == "__main__":
     for i in range(5):
         fname = Path(f"input_clips_test/sample_{i}.wav")
         if not fname.exists():  # Avoid recreating if they exist
-            AudioSegment.silent(duration=10000).export(fname, format="wav")
+            sf.write(fname, np.zeros(10 * 44100, dtype=np.int16), 44100)
 
     intelligent_mixer = IntelligentMixCreator(output_folder="output_mixes_intelligent")
 
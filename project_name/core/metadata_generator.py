@@ -6,12 +6,144 @@ metadata (titles, descriptions, and tags) for sleep/relaxation videos.
 """
 
 import logging
+import operator
 import random
+import string
+import time
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Research-based optimal publish times for different content types
+OPTIMAL_PUBLISH_TIMES = MappingProxyType(
+    {
+        "sleep": MappingProxyType(
+            {
+                "weekday": "20:00",  # 8 PM - People preparing for bed
+                "weekend": "21:00",  # 9 PM - Later bedtime on weekends
+                "best_days": ("Sunday", "Thursday"),
+            }
+        ),
+        "focus": MappingProxyType(
+            {
+                "weekday": "08:00",  # 8 AM - Start of work/study day
+                "weekend": "10:00",  # 10 AM - Later start on weekends
+                "best_days": ("Monday", "Tuesday", "Wednesday"),
+            }
+        ),
+        "relax": MappingProxyType(
+            {
+                "weekday": "18:00",  # 6 PM - After work
+                "weekend": "15:00",  # 3 PM - Afternoon relaxation
+                "best_days": ("Friday", "Saturday", "Sunday"),
+            }
+        ),
+    }
+)
+
+# Quality adjectives substituted into title templates
+_QUALITY_ADJECTIVES = (
+    "HD",
+    "High Quality",
+    "Premium",
+    "Crystal Clear",
+    "Studio Quality",
+    "Authentic",
+    "Natural",
+    "Pure",
+)
+
+# General video tags added to every tag list
+_GENERAL_TAGS = (
+    "asmr",
+    "relaxingsounds",
+    "ambience",
+    "soundscape",
+    "blackscreen",
+    "8hours",
+    "10hours",
+    "allnight",
+)
+
+# Distinct (sound type, duration, purpose, extras) descriptions and tag lists
+# each generator keeps for reuse
+METADATA_CACHE_SIZE = 128
+
+# (whole second, ISO timestamp) last stamped onto generated metadata
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+# Renders a compiled template from a mapping of field values
+TemplateRenderer = Callable[[Mapping[str, Any]], str]
+
+
+def _compile_template(template: str) -> TemplateRenderer:
+    """
+    Specialize a str.format template into a renderer, parsing its text once.
+
+    Plain {name} fields become %s conversions in a printf-style string whose
+    values are fetched by one itemgetter call, which renders faster than
+    str.format. Templates using format specs, conversions or indexed fields
+    fall back to str.format_map.
+
+    Args:
+        template: Template using str.format fields.
+
+    Returns:
+        Function rendering the template from field values, identically to
+        template.format(**fields) for string and number values.
+    """
+    parsed = list(string.Formatter().parse(template))
+    names = [field for _, field, _, _ in parsed if field is not None]
+    if any(spec or conversion for _, _, spec, conversion in parsed) or not all(
+        name.isidentifier() for name in names
+    ):
+        return template.format_map
+
+    printf = "".join(
+        literal.replace("%", "%%") + ("" if field is None else "%s")
+        for literal, field, _, _ in parsed
+    )
+    if not names:
+        return lambda fields: printf % ()
+    if len(names) == 1:
+        name = names[0]
+        return lambda fields: printf % (fields[name],)
+    values = operator.itemgetter(*names)
+    return lambda fields: printf % values(fields)
+
+
+@lru_cache(maxsize=32)
+def _optimal_publish_time(purpose: str, timezone: str) -> Mapping[str, Any]:
+    """Immutable publish time suggestion for a purpose and timezone."""
+    base = OPTIMAL_PUBLISH_TIMES.get(purpose, OPTIMAL_PUBLISH_TIMES["sleep"])
+    return MappingProxyType({**base, "timezone": timezone, "purpose": purpose})
+
+
+def _timestamp() -> str:
+    """ISO timestamp of the current second, formatted once per second."""
+    global _last_timestamp
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        _last_timestamp = (now, datetime.fromtimestamp(now).isoformat())
+    return _last_timestamp[1]
+
+
+def _format_title(
+    template: str, sound_type: str, duration_hours: int, quality: str
+) -> str:
+    """Fill in a title template, keeping within YouTube's 100 character limit."""
+    title = template.format(
+        sound_type=sound_type.title(),
+        duration=duration_hours,
+        quality=quality,
+    )
+    if len(title) > 100:
+        title = title[:97] + "..."
+    return title
+
 
 class MetadataGenerator:
     """
@@ -22,37 +154,40 @@ class MetadataGenerator:
     """
 
     # Default templates for different video types
-    TITLE_TEMPLATES = {
-        "sleep": [
-            "{sound_type} Sounds for Deep Sleep - {duration} Hours",
-            "{duration} Hours of {sound_type} for Sleeping",
-            "Sleep Better with {sound_type} - {duration}H {quality} Sound",
-            "{sound_type} White Noise for Sleep - {duration} Hours",
-            "Relaxing {sound_type} Sounds - Fall Asleep Fast",
-            "{duration} Hour {sound_type} | Sleep Sounds",
-            "Deep Sleep {sound_type} - {duration} Hours of Relaxation",
-            "{sound_type} for Sleep and Relaxation | {duration}H",
-        ],
-        "focus": [
-            "{sound_type} for Focus and Concentration - {duration} Hours",
-            "Study with {sound_type} - {duration}H Focus Music",
-            "{duration} Hours {sound_type} for Work and Study",
-            "Ambient {sound_type} for Productivity - {duration}H",
-            "Focus Better with {sound_type} | {duration} Hours",
-            "{sound_type} Sounds for Deep Work - {duration}H",
-        ],
-        "relax": [
-            "Relaxing {sound_type} Sounds - {duration} Hours",
-            "{duration} Hours of Calming {sound_type}",
-            "Stress Relief {sound_type} - {duration}H Relaxation",
-            "Peaceful {sound_type} for Meditation - {duration} Hours",
-            "{sound_type} Ambient Sounds - {duration}H Peace",
-            "Unwind with {sound_type} | {duration} Hours",
-        ],
-    }
+    TITLE_TEMPLATES = MappingProxyType(
+        {
+            "sleep": (
+                "{sound_type} Sounds for Deep Sleep - {duration} Hours",
+                "{duration} Hours of {sound_type} for Sleeping",
+                "Sleep Better with {sound_type} - {duration}H {quality} Sound",
+                "{sound_type} White Noise for Sleep - {duration} Hours",
+                "Relaxing {sound_type} Sounds - Fall Asleep Fast",
+                "{duration} Hour {sound_type} | Sleep Sounds",
+                "Deep Sleep {sound_type} - {duration} Hours of Relaxation",
+                "{sound_type} for Sleep and Relaxation | {duration}H",
+            ),
+            "focus": (
+                "{sound_type} for Focus and Concentration - {duration} Hours",
+                "Study with {sound_type} - {duration}H Focus Music",
+                "{duration} Hours {sound_type} for Work and Study",
+                "Ambient {sound_type} for Productivity - {duration}H",
+                "Focus Better with {sound_type} | {duration} Hours",
+                "{sound_type} Sounds for Deep Work - {duration}H",
+            ),
+            "relax": (
+                "Relaxing {sound_type} Sounds - {duration} Hours",
+                "{duration} Hours of Calming {sound_type}",
+                "Stress Relief {sound_type} - {duration}H Relaxation",
+                "Peaceful {sound_type} for Meditation - {duration} Hours",
+                "{sound_type} Ambient Sounds - {duration}H Peace",
+                "Unwind with {sound_type} | {duration} Hours",
+            ),
+        }
+    )
 
-    DESCRIPTION_TEMPLATES = {
-        "sleep": """🌙 {sound_type} Sounds for Sleep | {duration} Hours
+    DESCRIPTION_TEMPLATES = MappingProxyType(
+        {
+            "sleep": """🌙 {sound_type} Sounds for Sleep | {duration} Hours
 
 Drift off to peaceful sleep with this {duration}-hour recording of {sound_type_lower} sounds. Perfect for:
 • Deep, restful sleep
@@ -80,7 +215,7 @@ Drift off to peaceful sleep with this {duration}-hour recording of {sound_type_l
 ---
 {sound_type} Sounds for Deep Sleep - {duration} Hours
 """,
-        "focus": """🎯 {sound_type} for Focus | {duration} Hours
+            "focus": """🎯 {sound_type} for Focus | {duration} Hours
 
 Enhance your concentration and productivity with this {duration}-hour recording of {sound_type_lower} sounds. Ideal for:
 • Studying and homework
@@ -108,7 +243,7 @@ Ambient sounds like {sound_type_lower} can help mask distracting noises and crea
 ---
 {sound_type} Sounds for Focus - {duration} Hours
 """,
-        "relax": """🧘 Relaxing {sound_type} | {duration} Hours
+            "relax": """🧘 Relaxing {sound_type} | {duration} Hours
 
 Unwind and de-stress with this {duration}-hour recording of peaceful {sound_type_lower} sounds. Perfect for:
 • Meditation and mindfulness
@@ -136,102 +271,123 @@ Regular relaxation practice can reduce stress, lower blood pressure, improve sle
 ---
 Relaxing {sound_type} Sounds - {duration} Hours
 """,
-    }
+        }
+    )
+
+    # Built-in description templates, compiled once at import
+    _DESCRIPTION_RENDERERS = MappingProxyType(
+        {
+            purpose: _compile_template(template)
+            for purpose, template in DESCRIPTION_TEMPLATES.items()
+        }
+    )
 
     # Common tags for different sound types and purposes
-    SOUND_TYPE_TAGS = {
-        "rain": [
-            "rain",
-            "rainsounds",
-            "rainfall",
-            "rainstorm",
-            "rainforest",
-            "thunderstorm",
-            "rainloop",
-        ],
-        "ocean": [
-            "ocean",
-            "oceansounds",
-            "waves",
-            "seasounds",
-            "beach",
-            "oceanwaves",
-            "seawaves",
-        ],
-        "nature": [
-            "nature",
-            "naturesounds",
-            "forest",
-            "birds",
-            "wildlife",
-            "ambient",
-            "outdoor",
-        ],
-        "white_noise": [
-            "whitenoise",
-            "pinknoise",
-            "brownnoise",
-            "noise",
-            "static",
-            "fan",
-            "fansound",
-        ],
-        "ambient": [
-            "ambient",
-            "ambience",
-            "atmospheric",
-            "soundscape",
-            "background",
-            "mood",
-        ],
-    }
+    SOUND_TYPE_TAGS = MappingProxyType(
+        {
+            "rain": (
+                "rain",
+                "rainsounds",
+                "rainfall",
+                "rainstorm",
+                "rainforest",
+                "thunderstorm",
+                "rainloop",
+            ),
+            "ocean": (
+                "ocean",
+                "oceansounds",
+                "waves",
+                "seasounds",
+                "beach",
+                "oceanwaves",
+                "seawaves",
+            ),
+            "nature": (
+                "nature",
+                "naturesounds",
+                "forest",
+                "birds",
+                "wildlife",
+                "ambient",
+                "outdoor",
+            ),
+            "white_noise": (
+                "whitenoise",
+                "pinknoise",
+                "brownnoise",
+                "noise",
+                "static",
+                "fan",
+                "fansound",
+            ),
+            "ambient": (
+                "ambient",
+                "ambience",
+                "atmospheric",
+                "soundscape",
+                "background",
+                "mood",
+            ),
+        }
+    )
+
+    PURPOSE_TAGS = MappingProxyType(
+        {
+            "sleep": (
+                "sleep",
+                "sleepsounds",
+                "deepsleep",
+                "sleeping",
+                "insomnia",
+                "babysleep",
+                "sleepaid",
+                "bedtime",
+            ),
+            "focus": (
+                "focus",
+                "study",
+                "studying",
+                "concentration",
+                "productivity",
+                "work",
+                "studymusic",
+                "focusmusic",
+            ),
+            "relax": (
+                "relax",
+                "relaxation",
+                "calm",
+                "peaceful",
+                "meditation",
+                "stressrelief",
+                "zen",
+                "mindfulness",
+            ),
+        }
+    )
 
-    PURPOSE_TAGS = {
-        "sleep": [
-            "sleep",
-            "sleepsounds",
-            "deepsleep",
-            "sleeping",
-            "insomnia",
-            "babysleep",
-            "sleepaid",
-            "bedtime",
-        ],
-        "focus": [
-            "focus",
-            "study",
-            "studying",
-            "concentration",
-            "productivity",
-            "work",
-            "studymusic",
-            "focusmusic",
-        ],
-        "relax": [
-            "relax",
-            "relaxation",
-            "calm",
-            "peaceful",
-            "meditation",
-            "stressrelief",
-            "zen",
-            "mindfulness",
-        ],
-    }
+    QUALITY_ADJECTIVES = _QUALITY_ADJECTIVES
 
-    QUALITY_ADJECTIVES = [
-        "HD",
-        "High Quality",
-        "Premium",
-        "Crystal Clear",
-        "Studio Quality",
-        "Authentic",
-        "Natural",
-        "Pure",
-    ]
-
-    def __init__(self):
-        """Initialize the MetadataGenerator."""
+    # Title templates with a duration placeholder, preferred for very long videos
+    LONG_TITLE_TEMPLATES = MappingProxyType(
+        {
+            purpose: tuple(t for t in templates if "{duration" in t)
+            for purpose, templates in TITLE_TEMPLATES.items()
+        }
+    )
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initialize the MetadataGenerator.
+
+        Args:
+            rng: Random number generator for title picks. Defaults to the
+                random module's shared generator, so random.seed applies.
+        """
+        self._rng = rng if rng is not None else random
+        # Descriptions and tags depend only on the arguments, unlike titles
+        self._metadata_cache = {}
         logger.info("MetadataGenerator initialized")
 
     def generate_title(
@@ -253,32 +409,82 @@ Relaxing {sound_type} Sounds - {duration} Hours
         Returns:
             Generated title string.
         """
-        if custom_template:
-            template = custom_template
-        else:
-            templates = self.TITLE_TEMPLATES.get(purpose, self.TITLE_TEMPLATES["sleep"])
-            # For very long durations, prefer templates that contain a duration placeholder
-            templates_with_duration = [t for t in templates if "{duration" in t]
-            if duration_hours >= 24 and templates_with_duration:
-                template = random.choice(templates_with_duration)
-            else:
-                template = random.choice(templates)
-
-        quality = random.choice(self.QUALITY_ADJECTIVES)
-
-        title = template.format(
-            sound_type=sound_type.title(),
-            duration=duration_hours,
-            quality=quality,
+        template = self._title_template(
+            duration_hours, purpose, custom_template, self._rng.random()
+        )
+        title = _format_title(
+            template, sound_type, duration_hours, self._rng.choice(_QUALITY_ADJECTIVES)
         )
-
-        # Ensure title doesn't exceed YouTube's 100 character limit
-        if len(title) > 100:
-            title = title[:97] + "..."
 
         logger.info(f"Generated title: {title}")
         return title
 
+    def generate_titles_batch(self, specs: list) -> list:
+        """
+        Generate titles for many videos, such as a whole upload schedule.
+
+        The random template and quality picks for all titles are drawn
+        together rather than per call.
+
+        Args:
+            specs: Dictionaries of generate_title arguments; each needs
+                sound_type and may set duration_hours, purpose and
+                custom_template.
+
+        Returns:
+            Generated titles, in the order of specs.
+        """
+        rng = self._rng
+        draws = [rng.random() for _ in specs]
+        qualities = rng.choices(_QUALITY_ADJECTIVES, k=len(specs))
+
+        titles = [
+            _format_title(
+                self._title_template(
+                    spec.get("duration_hours", 8),
+                    spec.get("purpose", "sleep"),
+                    spec.get("custom_template"),
+                    draw,
+                ),
+                spec["sound_type"],
+                spec.get("duration_hours", 8),
+                quality,
+            )
+            for spec, draw, quality in zip(specs, draws, qualities, strict=True)
+        ]
+
+        logger.info(f"Generated {len(titles)} titles")
+        return titles
+
+    def _title_template(
+        self,
+        duration_hours: int,
+        purpose: str,
+        custom_template: Optional[str],
+        draw: float,
+    ) -> str:
+        """
+        Pick a title template.
+
+        Args:
+            duration_hours: Duration of the video in hours.
+            purpose: Purpose of the video ("sleep", "focus", "relax").
+            custom_template: Optional custom title template.
+            draw: Uniform random number in [0, 1) selecting the template.
+
+        Returns:
+            Title template string.
+        """
+        if custom_template:
+            return custom_template
+        if purpose not in self.TITLE_TEMPLATES:
+            purpose = "sleep"
+        # For very long durations, prefer templates that contain a duration placeholder
+        templates = self.LONG_TITLE_TEMPLATES[purpose]
+        if duration_hours < 24 or not templates:
+            templates = self.TITLE_TEMPLATES[purpose]
+        return templates[int(draw * len(templates))]
+
     def generate_description(
         self,
         sound_type: str,
@@ -300,23 +506,23 @@ Relaxing {sound_type} Sounds - {duration} Hours
         Returns:
             Generated description string.
         """
-        if custom_template:
-            template = custom_template
-        else:
-            template = self.DESCRIPTION_TEMPLATES.get(
-                purpose, self.DESCRIPTION_TEMPLATES["sleep"]
-            )
-
         # Create sound tag from sound type
         sound_tag = sound_type.lower().replace(" ", "")
 
-        description = template.format(
-            sound_type=sound_type.title(),
-            sound_type_lower=sound_type.lower(),
-            duration=duration_hours,
-            additional_info=additional_info,
-            sound_tag=sound_tag,
-        )
+        fields = {
+            "sound_type": sound_type.title(),
+            "sound_type_lower": sound_type.lower(),
+            "duration": duration_hours,
+            "additional_info": additional_info,
+            "sound_tag": sound_tag,
+        }
+        if custom_template:
+            description = custom_template.format(**fields)
+        else:
+            render = self._DESCRIPTION_RENDERERS.get(
+                purpose, self._DESCRIPTION_RENDERERS["sleep"]
+            )
+            description = render(fields)
 
         # Ensure description doesn't exceed YouTube's 5000 character limit
         if len(description) > 5000:
@@ -359,32 +565,20 @@ Relaxing {sound_type} Sounds - {duration} Hours
             tags.extend(self.PURPOSE_TAGS[purpose])
 
         # Add general video tags
-        general_tags = [
-            "asmr",
-            "relaxingsounds",
-            "ambience",
-            "soundscape",
-            "blackscreen",
-            "8hours",
-            "10hours",
-            "allnight",
-        ]
-        tags.extend(general_tags)
+        tags.extend(_GENERAL_TAGS)
 
-        # Add additional custom tags
+        # Remove duplicates while preserving order. The built-in tags are all
+        # lowercase, so they dedupe in one dict build keyed by the tag itself.
+        unique_tags = dict(zip(tags, tags, strict=True))
+
+        # Add additional custom tags, matching case-insensitively and keeping
+        # the first spelling seen
         if additional_tags:
-            tags.extend(additional_tags)
-
-        # Remove duplicates while preserving order using walrus operator
-        seen = set()
-        unique_tags = [
-            tag
-            for tag in tags
-            if (tag_lower := tag.lower()) not in seen and not seen.add(tag_lower)
-        ]
+            for tag in additional_tags:
+                unique_tags.setdefault(tag.lower(), tag)
 
         # Limit to max_tags
-        result = unique_tags[:max_tags]
+        result = list(unique_tags.values())[:max_tags]
         logger.info(f"Generated {len(result)} tags")
         return result
 
@@ -409,13 +603,34 @@ Relaxing {sound_type} Sounds - {duration} Hours
         Returns:
             Dictionary containing title, description, and tags.
         """
+        # The description and tags are reused for repeated arguments, as in
+        # a rotating content plan; the title is still drawn for every video
+        key = (
+            sound_type,
+            duration_hours,
+            purpose,
+            additional_info,
+            tuple(additional_tags or ()),
+        )
+        cached = self._metadata_cache.get(key)
+        if cached is None:
+            cached = (
+                self.generate_description(
+                    sound_type, duration_hours, purpose, additional_info
+                ),
+                tuple(self.generate_tags(sound_type, purpose, additional_tags)),
+            )
+            if len(self._metadata_cache) >= METADATA_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._metadata_cache[next(iter(self._metadata_cache))]
+            self._metadata_cache[key] = cached
+        description, tags = cached
+
         metadata = {
             "title": self.generate_title(sound_type, duration_hours, purpose),
-            "description": self.generate_description(
-                sound_type, duration_hours, purpose, additional_info
-            ),
-            "tags": self.generate_tags(sound_type, purpose, additional_tags),
-            "generated_at": datetime.now().isoformat(),
+            "description": description,
+            "tags": list(tags),
+            "generated_at": _timestamp(),
         }
 
         logger.info(f"Generated complete metadata for {sound_type} {purpose} video")
@@ -468,28 +683,9 @@ Relaxing {sound_type} Sounds - {duration} Hours
         Returns:
             Dictionary with suggested publish times.
         """
-        # Research-based optimal times for different content types
-        optimal_times = {
-            "sleep": {
-                "weekday": "20:00",  # 8 PM - People preparing for bed
-                "weekend": "21:00",  # 9 PM - Later bedtime on weekends
-                "best_days": ["Sunday", "Thursday"],
-            },
-            "focus": {
-                "weekday": "08:00",  # 8 AM - Start of work/study day
-                "weekend": "10:00",  # 10 AM - Later start on weekends
-                "best_days": ["Monday", "Tuesday", "Wednesday"],
-            },
-            "relax": {
-                "weekday": "18:00",  # 6 PM - After work
-                "weekend": "15:00",  # 3 PM - Afternoon relaxation
-                "best_days": ["Friday", "Saturday", "Sunday"],
-            },
-        }
-
-        times = optimal_times.get(purpose, optimal_times["sleep"])
-        times["timezone"] = timezone
-        times["purpose"] = purpose
+        cached = _optimal_publish_time(purpose, timezone)
+        # Hand out a plain copy so callers can modify and serialize it freely
+        times = {**cached, "best_days": list(cached["best_days"])}
 
         logger.info(f"Optimal publish times for {purpose}: {times}")
         return times
@@ -1,15 +1,223 @@
 import logging
+import math
 import os
 import random
+import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
 
 import numpy as np
 from pydub import AudioSegment
 from pydub.effects import normalize
+from pydub.utils import db_to_float
+from scipy.signal import lfilter
+
+try:
+    import numexpr as ne
+
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Samples per block when rendering binaural tones, bounding the float working
+# memory independently of the mix duration
+BINAURAL_BLOCK_SAMPLES = 1 << 20
+
+# Frames per block when filtering a mix, bounding the float working memory
+FILTER_BLOCK_FRAMES = 1 << 20
+
+# Peak level (dBFS) that normalize() leaves sources at, using its default
+# 0.1 dB headroom; sources already peaking above it are used as decoded
+NORMALIZED_PEAK_DBFS = -0.1
+
+# Maximum concurrent source decodes for a category mix
+MAX_DECODE_WORKERS = 8
+
+# Bytes of decoded sources each MixCreator keeps for reuse; clips larger than
+# this are decoded again on every use
+DECODE_CACHE_BYTES = 256 * 1024 * 1024
+
+# NumPy sample type for each pydub sample width (pydub's arrays are signed)
+SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+def _frames(segment: AudioSegment) -> np.ndarray:
+    """View a segment's samples as a read-only (frames, channels) array."""
+    return np.frombuffer(
+        segment.raw_data, dtype=SAMPLE_DTYPES[segment.sample_width]
+    ).reshape(-1, segment.channels)
+
+
+def _random_picks(population: List[Any], batch: int) -> Iterator[Any]:
+    """Yield uniform random picks from population, drawn batch at a time."""
+    while True:
+        yield from random.choices(population, k=batch)
+
+
+def _rotate_tone(
+    sin_table: np.ndarray,
+    cos_table: np.ndarray,
+    cos_gain: np.float32,
+    sin_gain: np.float32,
+    out: np.ndarray,
+    scratch: np.ndarray,
+) -> None:
+    """
+    Write sin_table * cos_gain + cos_table * sin_gain into out.
+
+    This rotates a block of sine samples by a start phase (angle addition).
+    When numexpr (the "fast-math" extra) runs multithreaded it evaluates this
+    in one fused pass; single-threaded, NumPy's two multiplies and an add into
+    scratch are faster.
+
+    Args:
+        sin_table: Sines of the block's phases
+        cos_table: Cosines of the block's phases
+        cos_gain: Amplitude times the cosine of the start phase
+        sin_gain: Amplitude times the sine of the start phase
+        out: float32 array receiving the rotated samples
+        scratch: float32 array of the same length for the NumPy fallback
+    """
+    if NUMEXPR_AVAILABLE and ne.get_num_threads() > 1:
+        ne.evaluate(
+            "sin_table * cos_gain + cos_table * sin_gain",
+            local_dict={
+                "sin_table": sin_table,
+                "cos_table": cos_table,
+                "cos_gain": cos_gain,
+                "sin_gain": sin_gain,
+            },
+            out=out,
+        )
+        return
+    np.multiply(sin_table, cos_gain, out=out)
+    np.multiply(cos_table, sin_gain, out=scratch)
+    np.add(out, scratch, out=out)
+
+
+def _overlay_layers(layers: List[AudioSegment], duration_ms: int) -> AudioSegment:
+    """
+    Overlay segments onto silence, as repeated AudioSegment.overlay calls would.
+
+    The layers are summed in a wider integer accumulator and saturated once,
+    rather than copying the whole mix for every overlay. As with overlay onto
+    AudioSegment.silent, longer layers are cut to the duration and the result
+    takes the widest channel count, frame rate and sample width involved.
+
+    Args:
+        layers: Segments to overlay
+        duration_ms: Duration of the result in milliseconds
+
+    Returns:
+        Overlaid audio segment
+    """
+    formats = [AudioSegment.silent(duration=0), *layers]
+    channels = max(segment.channels for segment in formats)
+    frame_rate = max(segment.frame_rate for segment in formats)
+    sample_width = max(segment.sample_width for segment in formats)
+    dtype = SAMPLE_DTYPES[sample_width]
+
+    n_frames = int(frame_rate * (duration_ms / 1000.0))
+    total = np.zeros(
+        (n_frames, channels), dtype=np.int64 if sample_width == 4 else np.int32
+    )
+    for layer in layers:
+        synced = (
+            layer.set_channels(channels)
+            .set_frame_rate(frame_rate)
+            .set_sample_width(sample_width)
+        )
+        samples = _frames(synced)[:n_frames]
+        total[: len(samples)] += samples
+
+    limits = np.iinfo(dtype)
+    np.clip(total, limits.min, limits.max, out=total)
+    return AudioSegment(
+        total.astype(dtype).tobytes(),
+        frame_rate=frame_rate,
+        sample_width=sample_width,
+        channels=channels,
+    )
+
+
+def _first_order_filter(
+    segment: AudioSegment, b: List[float], a: List[float]
+) -> AudioSegment:
+    """
+    Run a first-order IIR filter over each channel of a segment.
+
+    The filter state is seeded so the first output frame equals the first
+    input frame, and outputs are truncated and clipped to the sample range,
+    which reproduces pydub's per-sample RC filters. The samples are filtered
+    in blocks, carrying the filter state across block boundaries.
+
+    Args:
+        segment: Audio to filter
+        b: Numerator coefficients
+        a: Denominator coefficients
+
+    Returns:
+        Filtered audio segment
+    """
+    samples = _frames(segment)
+    if not len(samples):
+        return segment
+    limits = np.iinfo(samples.dtype)
+    filtered = np.empty_like(samples)
+    state = (1 - b[0]) * samples[:1].astype(np.float64)
+    for start in range(0, len(samples), FILTER_BLOCK_FRAMES):
+        block = samples[start : start + FILTER_BLOCK_FRAMES]
+        output, state = lfilter(b, a, block, axis=0, zi=state)
+        np.clip(output, limits.min, limits.max, out=output)
+        filtered[start : start + len(block)] = output  # Truncates like int()
+    return segment._spawn(filtered.tobytes())
+
+
+def _low_pass_filter(segment: AudioSegment, cutoff: float) -> AudioSegment:
+    """Array version of pydub's low_pass_filter (6 dB/octave RC filter)."""
+    rc = 1.0 / (cutoff * 2 * math.pi)
+    dt = 1.0 / segment.frame_rate
+    alpha = dt / (rc + dt)
+    return _first_order_filter(segment, [alpha], [1.0, alpha - 1.0])
+
+
+def _high_pass_filter(segment: AudioSegment, cutoff: float) -> AudioSegment:
+    """Array version of pydub's high_pass_filter (6 dB/octave RC filter)."""
+    rc = 1.0 / (cutoff * 2 * math.pi)
+    dt = 1.0 / segment.frame_rate
+    alpha = rc / (rc + dt)
+    return _first_order_filter(segment, [alpha, -alpha], [1.0, -alpha])
+
+
+def _export_parameters(output_format: str) -> Optional[List[str]]:
+    """
+    ffmpeg options for exporting a mix, letting the encoder use every core.
+
+    pydub writes wav and raw output itself unless ffmpeg parameters are
+    given, so those formats get none and still skip ffmpeg entirely.
+
+    Args:
+        output_format: Export format
+
+    Returns:
+        Extra ffmpeg parameters, or None
+    """
+    if output_format in ("wav", "raw"):
+        return None
+    return ["-threads", str(os.cpu_count() or 1)]
+
+
+def _decode_normalized(file_path: str) -> AudioSegment:
+    """Decode and normalize an audio file."""
+    audio = AudioSegment.from_file(file_path)
+    if audio.max_dBFS > NORMALIZED_PEAK_DBFS:
+        # Already close to full scale; skip normalize's gain pass
+        return audio
+    return normalize(audio)
+
 
 class MixCreator:
     def __init__(self, output_folder: str = "output_mixes"):
@@ -22,6 +230,11 @@ class MixCreator:
         self.output_folder = output_folder
         os.makedirs(output_folder, exist_ok=True)
 
+        # Decoded sources keyed by (path, mtime_ns, size), oldest first
+        self._decode_cache: Dict[tuple, AudioSegment] = {}
+        self._decode_cache_bytes = 0
+        self._decode_cache_lock = threading.Lock()
+
         # Define mix profiles
         self.mix_profiles = {
             "sleep": {
@@ -90,59 +303,14 @@ class MixCreator:
             Path to the created mix file
         """
         try:
-            # Convert duration to milliseconds
-            target_duration = duration_minutes * 60 * 1000
-
-            # Get mix profile
-            profile = self.mix_profiles.get(mix_type, self.mix_profiles["sleep"])
-
-            # Create base silent mix
-            mix = AudioSegment.silent(duration=target_duration)
-
-            # Add each category of sounds
-            for category, files in audio_files.items():
-                if not files:
-                    continue
-
-                # Create submix for this category
-                category_mix = self._create_category_mix(
-                    files, target_duration, profile["crossfade"]
-                )
-
-                # Apply volume adjustment
-                volume_adjust = profile["volume_adjustments"].get(category, 0)
-                if volume_adjust != 0:
-                    category_mix = category_mix + volume_adjust
-
-                # Layer into main mix
-                mix = mix.overlay(category_mix)
-
-            # Apply effects based on mix type
-            mix = self._apply_mix_effects(mix, profile)
-
-            # Add binaural beats if requested
-            if add_binaural_beats:
-                binaural_segment = self._generate_binaural_beats(
-                    duration_ms=target_duration,
-                    base_freq=binaural_base_freq,
-                    beat_freq=binaural_beat_freq,
-                )
-                if binaural_segment:
-                    # Ensure binaural beats are stereo if mix is mono, or convert mix to stereo
-                    if mix.channels == 1 and binaural_segment.channels == 2:
-                        mix = mix.set_channels(2)
-                    elif mix.channels == 2 and binaural_segment.channels == 1:
-                        # This case should ideally not happen with current binaural generation
-                        # but as a fallback, make binaural stereo by duplicating channel
-                        binaural_segment = AudioSegment.from_mono_audiosegments(
-                            binaural_segment, binaural_segment
-                        )
-
-                    # Overlay with a specific volume for binaural beats, e.g., -12dB
-                    # The volume is already applied in _generate_binaural_beats,
-                    # but could be adjusted further here if needed.
-                    mix = mix.overlay(binaural_segment)
-                    logger.info("Added binaural beats to the mix.")
+            mix = self._build_mix(
+                audio_files,
+                mix_type=mix_type,
+                duration_minutes=duration_minutes,
+                add_binaural_beats=add_binaural_beats,
+                binaural_base_freq=binaural_base_freq,
+                binaural_beat_freq=binaural_beat_freq,
+            )
 
             # Export mix
             timestamp = int(time.time())
@@ -153,6 +321,7 @@ class MixCreator:
                 output_path,
                 format=output_format,
                 bitrate=bitrate,
+                parameters=_export_parameters(output_format),
                 tags={
                     "title": f"Sleep Sound Mix {timestamp}",
                     "date": time.strftime("%Y-%m-%d"),
@@ -167,6 +336,128 @@ class MixCreator:
             logger.error(f"Error creating mix: {str(e)}")
             return None
 
+    def _build_mix(
+        self,
+        audio_files: Dict[str, List[str]],
+        mix_type: str = "sleep",
+        duration_minutes: float = 60,
+        add_binaural_beats: bool = False,
+        binaural_base_freq: float = 200.0,
+        binaural_beat_freq: float = 5.0,
+    ) -> AudioSegment:
+        """
+        Build an audio mix in memory from the provided files.
+
+        Args:
+            audio_files: Dictionary of categories with file paths
+            mix_type: Type of mix to create (sleep/focus/relax)
+            duration_minutes: Duration of mix in minutes
+            add_binaural_beats: Whether to add binaural beats to the mix.
+            binaural_base_freq: Base frequency for binaural beats.
+            binaural_beat_freq: Beat frequency for binaural beats.
+
+        Returns:
+            Mixed audio segment
+        """
+        # Convert duration to milliseconds
+        target_duration = duration_minutes * 60 * 1000
+
+        # Get mix profile
+        profile = self.mix_profiles.get(mix_type, self.mix_profiles["sleep"])
+
+        # Add each category of sounds
+        layers = []
+        for category, files in audio_files.items():
+            if not files:
+                continue
+
+            # Create submix for this category
+            category_mix = self._create_category_mix(
+                files, target_duration, profile["crossfade"]
+            )
+
+            # Apply volume adjustment
+            volume_adjust = profile["volume_adjustments"].get(category, 0)
+            if volume_adjust != 0:
+                category_mix = category_mix + volume_adjust
+
+            layers.append(category_mix)
+
+        # Layer onto a silent base mix
+        mix = _overlay_layers(layers, target_duration)
+
+        # Apply effects based on mix type
+        mix = self._apply_mix_effects(mix, profile)
+
+        # Add binaural beats if requested
+        if add_binaural_beats:
+            binaural_segment = self._generate_binaural_beats(
+                duration_ms=target_duration,
+                base_freq=binaural_base_freq,
+                beat_freq=binaural_beat_freq,
+            )
+            if binaural_segment:
+                # Ensure binaural beats are stereo if mix is mono, or convert mix to stereo
+                if mix.channels == 1 and binaural_segment.channels == 2:
+                    mix = mix.set_channels(2)
+                elif mix.channels == 2 and binaural_segment.channels == 1:
+                    # This case should ideally not happen with current binaural generation
+                    # but as a fallback, make binaural stereo by duplicating channel
+                    binaural_segment = AudioSegment.from_mono_audiosegments(
+                        binaural_segment, binaural_segment
+                    )
+
+                # Overlay with a specific volume for binaural beats, e.g., -12dB
+                # The volume is already applied in _generate_binaural_beats,
+                # but could be adjusted further here if needed.
+                mix = mix.overlay(binaural_segment)
+                logger.info("Added binaural beats to the mix.")
+
+        return mix
+
+    def _load_normalized(self, file_path: str) -> AudioSegment:
+        """
+        Load a normalized audio file, reusing the decode until the file changes.
+
+        AudioSegment operations return new segments, so the shared result is
+        safe to use without copying.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            Normalized audio segment
+        """
+        stat = os.stat(file_path)
+        key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        with self._decode_cache_lock:
+            cached = self._decode_cache.pop(key, None)
+            if cached is not None:
+                # Re-insert as the most recently used entry
+                self._decode_cache[key] = cached
+                return cached
+
+        audio = _decode_normalized(str(file_path))
+        size = len(audio.raw_data)
+        if size > DECODE_CACHE_BYTES:
+            return audio
+
+        with self._decode_cache_lock:
+            if key not in self._decode_cache:
+                while self._decode_cache_bytes + size > DECODE_CACHE_BYTES:
+                    # Evict the least recently used entry
+                    evicted = self._decode_cache.pop(next(iter(self._decode_cache)))
+                    self._decode_cache_bytes -= len(evicted.raw_data)
+                self._decode_cache[key] = audio
+                self._decode_cache_bytes += size
+        return audio
+
+    def clear_decode_cache(self) -> None:
+        """Release the decoded sources kept for reuse."""
+        with self._decode_cache_lock:
+            self._decode_cache.clear()
+            self._decode_cache_bytes = 0
+
     def _create_category_mix(
         self, files: List[str], target_duration: int, crossfade_duration: int
     ) -> AudioSegment:
@@ -181,43 +472,147 @@ class MixCreator:
         Returns:
             Mixed audio segment
         """
-        # Load and normalize all files
-        audio_segments = []
-        for file_path in files:
+
+        def _load(file_path: str) -> Optional[AudioSegment]:
             try:
-                audio = AudioSegment.from_file(file_path)
-                audio = normalize(audio)
-                audio_segments.append(audio)
+                return self._load_normalized(file_path)
             except Exception as e:
                 logger.error(f"Error loading {file_path}: {str(e)}")
+                return None
+
+        # Load and normalize all files; decoding runs in ffmpeg subprocesses,
+        # so the files are decoded concurrently
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_DECODE_WORKERS, len(files)))
+        ) as executor:
+            loaded = list(executor.map(_load, files))
+
+        audio_segments = []
+        for file_path, audio in zip(files, loaded, strict=True):
+            if audio is None:
+                continue
+            if len(audio) > 0:
+                audio_segments.append(audio)
+            else:
+                logger.warning(f"Skipping empty audio file {file_path}")
 
         if not audio_segments:
             return AudioSegment.silent(duration=target_duration)
 
-        # Create continuous mix
-        mix = AudioSegment.empty()
+        # Choose the segments of the continuous mix first, tracking the length
+        # the crossfaded joins will produce, then build it in a single pass
+        # rather than copying the growing mix on every append
+        chosen: List[AudioSegment] = []
+        crossfades: List[int] = []
         current_duration = 0
 
+        # Draw the random segments in batches sized from the length a typical
+        # segment adds, rather than making one RNG call per segment
+        mean_length = sum(len(audio) for audio in audio_segments) / len(audio_segments)
+        step = max(mean_length - crossfade_duration, mean_length / 2, 1)
+        picks = _random_picks(audio_segments, math.ceil(target_duration / step) + 4)
+
         while current_duration < target_duration:
             # Select random segment using Python random (pydub AudioSegment isn't numpy-friendly)
-            segment = random.choice(audio_segments)
+            segment = next(picks)
 
             if current_duration == 0:
-                mix = segment
+                chosen = [segment]
+                crossfades = []
+                current_duration = len(segment)
             else:
-                # Ensure crossfade is not longer than either segment to avoid errors
-                effective_crossfade = min(crossfade_duration, len(mix), len(segment))
-                if effective_crossfade <= 0:
-                    mix = mix.append(segment)
-                else:
-                    mix = mix.append(segment, crossfade=effective_crossfade)
+                # Ensure crossfade is not longer than either segment to avoid
+                # errors. A segment no longer than the crossfade fades in over
+                # half its length, so every segment extends the mix.
+                effective_crossfade = min(
+                    crossfade_duration, current_duration, len(segment)
+                )
+                if effective_crossfade >= len(segment):
+                    effective_crossfade = len(segment) // 2
+                chosen.append(segment)
+                crossfades.append(max(effective_crossfade, 0))
+                current_duration += len(segment) - crossfades[-1]
 
-            current_duration = len(mix)
+        # Join only the part within the exact duration
+        return self._join_with_crossfades(chosen, crossfades, target_duration)
 
-        # Trim to exact duration
-        mix = mix[:target_duration]
+    def _join_with_crossfades(
+        self,
+        segments: List[AudioSegment],
+        crossfades: List[int],
+        duration_ms: Optional[float] = None,
+    ) -> AudioSegment:
+        """
+        Join segments end to end, linearly crossfading each join.
 
-        return mix
+        The joined audio is written once into a preallocated sample array;
+        each distinct segment is converted to the common format only once.
+        With a duration, only the frames slicing the join to that many
+        milliseconds would keep are allocated and written.
+
+        Args:
+            segments: Segments in playback order
+            crossfades: Crossfade in milliseconds before each segment after
+                the first
+            duration_ms: Optional duration to trim the joined audio to
+
+        Returns:
+            Joined audio segment
+        """
+        # Common format, as pydub's append would sync to
+        channels = max(segment.channels for segment in segments)
+        frame_rate = max(segment.frame_rate for segment in segments)
+        sample_width = max(segment.sample_width for segment in segments)
+        dtype = SAMPLE_DTYPES[sample_width]
+
+        converted: Dict[int, np.ndarray] = {}
+        frames = []
+        for segment in segments:
+            samples = converted.get(id(segment))
+            if samples is None:
+                synced = (
+                    segment.set_channels(channels)
+                    .set_frame_rate(frame_rate)
+                    .set_sample_width(sample_width)
+                )
+                samples = _frames(synced)
+                converted[id(segment)] = samples
+            frames.append(samples)
+
+        fade_frames = [
+            min(int(crossfade * frame_rate / 1000), len(before), len(after))
+            for crossfade, before, after in zip(
+                crossfades, frames[:-1], frames[1:], strict=True
+            )
+        ]
+        n_frames = sum(len(f) for f in frames) - sum(fade_frames)
+        if duration_ms is not None:
+            # Frame count AudioSegment slicing [:duration_ms] would keep
+            length_ms = round(1000 * n_frames / frame_rate)
+            n_frames = int(min(duration_ms, length_ms) * frame_rate / 1000.0)
+        joined = np.empty((n_frames, channels), dtype=dtype)
+
+        position = 0
+        for fade, samples in zip([0, *fade_frames], frames, strict=True):
+            if position - fade >= n_frames:
+                break
+            if fade:
+                # Fade the tail of the mix out while the new segment fades in
+                overlap = joined[position - fade : position]
+                ramp = (np.arange(fade) / fade)[: len(overlap), np.newaxis]
+                overlap[:] = overlap * (1 - ramp) + samples[: len(overlap)] * ramp
+            tail = samples[fade : fade + max(n_frames - position, 0)]
+            joined[position : position + len(tail)] = tail
+            position += len(samples) - fade
+        # Slicing pads the final rounded millisecond with silence
+        joined[position:] = 0
+
+        return AudioSegment(
+            joined.tobytes(),
+            frame_rate=frame_rate,
+            sample_width=sample_width,
+            channels=channels,
+        )
 
     def _apply_mix_effects(self, mix: AudioSegment, profile: dict) -> AudioSegment:
         """
@@ -237,10 +632,10 @@ class MixCreator:
 
         # Apply frequency filtering based on mix type
         if "low_pass" in profile:
-            mix = mix.low_pass_filter(profile["low_pass"])
+            mix = _low_pass_filter(mix, profile["low_pass"])
         elif "band_pass" in profile:
             low, high = profile["band_pass"]
-            mix = mix.low_pass_filter(high).high_pass_filter(low)
+            mix = _high_pass_filter(_low_pass_filter(mix, high), low)
 
         # Normalize final mix
         mix = normalize(mix)
@@ -269,29 +664,63 @@ class MixCreator:
             An AudioSegment containing the binaural beat, or None on error.
         """
         try:
-            t = np.linspace(
-                0, duration_ms / 1000, int(sample_rate * duration_ms / 1000), False
-            )
+            n_samples = int(sample_rate * duration_ms / 1000)
 
             # Frequencies for left and right channels
             freq_left = base_freq
             freq_right = base_freq + beat_freq
 
-            # Generate sine waves
-            note_left = np.sin(freq_left * 2 * np.pi * t)
-            note_right = np.sin(freq_right * 2 * np.pi * t)
-
-            # Convert to 16-bit PCM
-            # Ensure amplitude is within 16-bit range before conversion
+            # Convert to 16-bit PCM, applying the volume as part of the
+            # amplitude rather than as a separate pass over the samples
             max_amplitude = 2**15 - 1
-            audio_left = (note_left * max_amplitude).astype(np.int16)
-            audio_right = (note_right * max_amplitude).astype(np.int16)
+            amplitude = max_amplitude * db_to_float(volume)
 
             # Create stereo audio segment
-            # For pydub, stereo data is interleaved: L, R, L, R...
-            stereo_signal = np.empty((len(t) * 2,), dtype=np.int16)
-            stereo_signal[0::2] = audio_left  # Left channel
-            stereo_signal[1::2] = audio_right  # Right channel
+            # For pydub, stereo data is interleaved: L, R, L, R..., which is
+            # the memory layout of a C-contiguous (frames, channels) array
+            stereo_signal = np.empty((n_samples, 2), dtype=np.int16, order="C")
+
+            # Render block by block into the interleaved output. Sample i is at
+            # phase i * step; each block rotates float32 sine/cosine tables of
+            # one block's phases by the block's start phase (angle addition).
+            # float32 keeps well above 16-bit precision because the tables only
+            # span one block, whereas float32 phases for a whole 8-hour mix
+            # could not even represent every sample index. Only the tables
+            # call sin/cos, so the per-sample cost is the rotation, which is
+            # bound by memory traffic rather than by trigonometry.
+            block = max(1, min(BINAURAL_BLOCK_SAMPLES, n_samples))
+            tones = []
+            for freq in (freq_left, freq_right):
+                step = 2 * np.pi * freq / sample_rate
+                block_phase = np.arange(block, dtype=np.float64) * step
+                tones.append(
+                    (
+                        step,
+                        np.sin(block_phase).astype(np.float32),
+                        np.cos(block_phase).astype(np.float32),
+                    )
+                )
+            scratch = np.empty(block, dtype=np.float32)
+            rotated = np.empty(block, dtype=np.float32)
+            for start in range(0, n_samples, block):
+                stop = min(start + block, n_samples)
+                count = stop - start
+                tone = scratch[:count]
+                for channel, (step, sin_table, cos_table) in enumerate(tones):
+                    start_phase = (start * step) % (2 * np.pi)
+                    # amplitude * sin(block phase + start phase)
+                    _rotate_tone(
+                        sin_table[:count],
+                        cos_table[:count],
+                        np.float32(amplitude * np.cos(start_phase)),
+                        np.float32(amplitude * np.sin(start_phase)),
+                        out=tone,
+                        scratch=rotated[:count],
+                    )
+                    if amplitude > max_amplitude:
+                        # Saturate positive gains like pydub's apply_gain
+                        np.clip(tone, -max_amplitude - 1, max_amplitude, out=tone)
+                    stereo_signal[start:stop, channel] = tone
 
             binaural_segment = AudioSegment(
                 stereo_signal.tobytes(),
@@ -300,9 +729,6 @@ class MixCreator:
                 channels=2,  # Stereo
             )
 
-            # Apply volume adjustment
-            binaural_segment = binaural_segment + volume  # Apply gain reduction
-
             logger.info(
                 f"Generated binaural beat: base={base_freq}Hz, beat={beat_freq}Hz, duration={duration_ms}ms"
             )
@@ -330,17 +756,11 @@ class MixCreator:
             Audio preview segment
         """
         try:
-            # Create full mix but with shorter duration
-            preview_path = self.create_mix(
+            # Build the full mix chain in memory, but with shorter duration
+            return self._build_mix(
                 audio_files, mix_type=mix_type, duration_minutes=preview_duration / 60
             )
 
-            if preview_path and os.path.exists(preview_path):
-                preview = AudioSegment.from_file(preview_path)
-                # Clean up preview file
-                os.remove(preview_path)
-                return preview
-
         except Exception as e:
             logger.error(f"Error creating preview: {str(e)}")
 
@@ -370,6 +790,7 @@ class MixCreator:
                 output_path,
                 format=format,
                 bitrate=bitrate,
+                parameters=_export_parameters(format),
                 tags={"title": "Mix Preview"},
             )
             return True
@@ -5,13 +5,47 @@ This module provides central automation control for the complete workflow:
 content planning, video generation, metadata assembly, and upload scheduling.
 """
 
+import asyncio
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Finished videos that may wait for upload while run_batch_pipeline
+# produces the next ones
+MAX_PENDING_UPLOADS = 2
+
+# Uploads upload_videos runs at the same time by default
+MAX_CONCURRENT_UPLOADS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class VideoConfig:
+    """How pipeline videos are rendered; immutable, so one can be shared."""
+
+    use_waveform: bool = False
+    background_color: Tuple[int, int, int] = (25, 25, 35)
+
+
+def _file_size(path: Optional[str]) -> Optional[int]:
+    """Size in bytes of a file a step produced, or None if it is missing."""
+    if not path:
+        return None
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def _duration_hours(duration_minutes: int) -> int:
+    """Whole hours for video metadata, rounding half an hour up, at least 1."""
+    return max(1, (duration_minutes + 30) // 60)
+
 
 class AutotubeOrchestrator:
     """
@@ -32,6 +66,7 @@ class AutotubeOrchestrator:
         output_folder: str = "output_mixes",
         video_folder: str = "output_videos",
         client_secrets_file: str = "client_secrets.json",
+        prefetch: bool = False,
     ):
         """
         Initialize the AutotubeOrchestrator.
@@ -41,63 +76,118 @@ class AutotubeOrchestrator:
             output_folder: Directory for processed audio mixes.
             video_folder: Directory for generated videos.
             client_secrets_file: Path to YouTube API client secrets.
+            prefetch: Whether to import and create all components on a
+                background thread, so full pipeline runs don't stall on
+                first use of each one.
         """
         self.input_folder = input_folder
         self.output_folder = output_folder
         self.video_folder = video_folder
         self.client_secrets_file = client_secrets_file
 
-        # Create necessary directories
-        for folder in [input_folder, output_folder, video_folder]:
-            os.makedirs(folder, exist_ok=True)
+        # Directories are created by the first step that uses them, so
+        # orchestrators used only for planning or status don't touch disk
+        self._created_folders = set()
 
         # Initialize components (lazy loading)
         self._sound_processor = None
         self._video_generator = None
         self._youtube_uploader = None
         self._metadata_generator = None
+        # One lock per component, so creating one doesn't block the others
+        self._component_locks = {
+            name: threading.Lock()
+            for name in (
+                "sound_processor",
+                "video_generator",
+                "youtube_uploader",
+                "metadata_generator",
+            )
+        }
+
+        # Folder -> (modification time in ns, entry count) for get_status
+        self._file_counts: Dict[str, Tuple[int, int]] = {}
+
+        self._prefetch_thread = None
+        if prefetch:
+            self._prefetch_thread = threading.Thread(
+                target=self._prefetch_components,
+                name="autotube-prefetch",
+                daemon=True,
+            )
+            self._prefetch_thread.start()
 
         logger.info("AutotubeOrchestrator initialized")
 
+    def _ensure_folder(self, folder: str) -> None:
+        """Create a directory the first time this orchestrator needs it."""
+        if folder not in self._created_folders:
+            os.makedirs(folder, exist_ok=True)
+            self._created_folders.add(folder)
+
+    def _prefetch_components(self) -> None:
+        """Create every component ahead of first use, in pipeline order."""
+        for name in (
+            "metadata_generator",
+            "sound_processor",
+            "video_generator",
+            "youtube_uploader",
+        ):
+            try:
+                getattr(self, name)
+            except Exception as e:
+                # Left unset, so first use retries and reports the error
+                logger.warning(f"Could not prefetch {name}: {e}")
+
     @property
     def sound_processor(self):
         """Lazy-load the SoundProcessor."""
         if self._sound_processor is None:
-            from project_name.core.processor import SoundProcessor
-
-            self._sound_processor = SoundProcessor(
-                input_folder=self.input_folder,
-                output_folder=self.output_folder,
-            )
+            with self._component_locks["sound_processor"]:
+                if self._sound_processor is None:
+                    from project_name.core.processor import SoundProcessor
+
+                    self._sound_processor = SoundProcessor(
+                        input_folder=self.input_folder,
+                        output_folder=self.output_folder,
+                    )
         return self._sound_processor
 
     @property
     def video_generator(self):
         """Lazy-load the VideoGenerator."""
         if self._video_generator is None:
-            from project_name.core.video_generator import VideoGenerator
+            with self._component_locks["video_generator"]:
+                if self._video_generator is None:
+                    from project_name.core.video_generator import VideoGenerator
 
-            self._video_generator = VideoGenerator(output_folder=self.video_folder)
+                    self._video_generator = VideoGenerator(
+                        output_folder=self.video_folder
+                    )
         return self._video_generator
 
     @property
     def youtube_uploader(self):
         """Lazy-load the YouTubeUploader."""
         if self._youtube_uploader is None:
-            from project_name.api.youtube_uploader import YouTubeUploader
+            with self._component_locks["youtube_uploader"]:
+                if self._youtube_uploader is None:
+                    from project_name.api.youtube_uploader import YouTubeUploader
 
-            self._youtube_uploader = YouTubeUploader(
-                client_secrets_file=self.client_secrets_file
-            )
+                    self._youtube_uploader = YouTubeUploader(
+                        client_secrets_file=self.client_secrets_file
+                    )
         return self._youtube_uploader
 
     @property
     def metadata_generator(self):
         """Lazy-load the MetadataGenerator."""
         if self._metadata_generator is None:
-            from project_name.core.metadata_generator import MetadataGenerator
+            with self._component_locks["metadata_generator"]:
+                if self._metadata_generator is None:
+                    from project_name.core.metadata_generator import MetadataGenerator
 
-            self._metadata_generator = MetadataGenerator()
+                    self._metadata_generator = MetadataGenerator()
         return self._metadata_generator
 
     def create_audio_mix(
@@ -115,9 +205,12 @@ class AutotubeOrchestrator:
         Returns:
             Path to the created mix file, or None if failed.
         """
-        logger.info(f"Creating {mix_type} mix ({duration_minutes} minutes)...")
+        logger.info("Creating %s mix (%s minutes)...", mix_type, duration_minutes)
 
         try:
+            self._ensure_folder(self.input_folder)
+            self._ensure_folder(self.output_folder)
+
             # Preprocess any raw audio files
             self.sound_processor.preprocess_audio()
 
@@ -130,8 +223,10 @@ class AutotubeOrchestrator:
                 mix_type=mix_type,
             )
 
-            if mix_path and os.path.exists(mix_path):
-                logger.info(f"Mix created: {mix_path}")
+            # One stat both confirms the mix exists and sizes it for the log
+            size = _file_size(mix_path)
+            if size is not None:
+                logger.info("Mix created: %s (%d bytes)", mix_path, size)
                 return mix_path
             else:
                 logger.error("Mix creation failed")
@@ -168,6 +263,8 @@ class AutotubeOrchestrator:
             return None
 
         try:
+            self._ensure_folder(self.video_folder)
+
             if use_waveform:
                 video_path = self.video_generator.generate_video_with_waveform(
                     audio_path=audio_path,
@@ -179,8 +276,9 @@ class AutotubeOrchestrator:
                     background_color=background_color,
                 )
 
-            if video_path and os.path.exists(video_path):
-                logger.info(f"Video created: {video_path}")
+            size = _file_size(video_path)
+            if size is not None:
+                logger.info("Video created: %s (%d bytes)", video_path, size)
                 return video_path
             else:
                 logger.error("Video creation failed")
@@ -237,7 +335,7 @@ class AutotubeOrchestrator:
         Returns:
             YouTube video ID if successful, None otherwise.
         """
-        logger.info(f"Uploading video: {title}")
+        logger.info("Uploading video: %s", title)
 
         try:
             video_id = self.youtube_uploader.upload_video(
@@ -249,7 +347,7 @@ class AutotubeOrchestrator:
             )
 
             if video_id:
-                logger.info(f"Upload successful! Video ID: {video_id}")
+                logger.info("Upload successful! Video ID: %s", video_id)
                 return video_id
             else:
                 logger.error("Upload failed")
@@ -259,6 +357,35 @@ class AutotubeOrchestrator:
             logger.error(f"Error uploading video: {e}")
             return None
 
+    def upload_videos(
+        self,
+        items: list,
+        max_concurrency: int = MAX_CONCURRENT_UPLOADS,
+    ) -> list:
+        """
+        Upload several videos to YouTube at the same time.
+
+        The uploader authenticates once and all uploads share its session.
+
+        Args:
+            items: Keyword arguments for upload_video, one dict per video.
+            max_concurrency: Maximum number of uploads in flight.
+
+        Returns:
+            YouTube video IDs (None for failed uploads) in the order of items.
+        """
+        if not items:
+            return []
+
+        # Authenticate here so the uploads don't each start an OAuth flow
+        if not self.youtube_uploader.authenticate():
+            logger.error("Upload failed: YouTube authentication failed")
+            return [None] * len(items)
+
+        workers = max(1, min(max_concurrency, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.upload_video(**item), items))
+
     def run_full_pipeline(
         self,
         sound_type: str = "Rain",
@@ -282,7 +409,154 @@ class AutotubeOrchestrator:
         Returns:
             Dictionary with pipeline results.
         """
-        results = {
+        results = self._new_results()
+
+        logger.info("Starting Autotube pipeline...")
+
+        if not self._produce_video(
+            results,
+            sound_type,
+            duration_minutes,
+            mix_type,
+            VideoConfig(use_waveform=use_waveform),
+        ):
+            return results
+
+        # Step 4: Upload to YouTube (optional)
+        if upload and not self._upload_results(results, privacy_status):
+            return results
+
+        results["success"] = True
+        logger.info("Pipeline completed successfully!")
+        return results
+
+    async def run_full_pipeline_async(
+        self,
+        sound_type: str = "Rain",
+        duration_minutes: int = 60,
+        mix_type: str = "sleep",
+        privacy_status: str = "private",
+        use_waveform: bool = False,
+        upload: bool = True,
+    ) -> dict:
+        """
+        Run the complete Autotube pipeline without blocking the event loop.
+
+        Each stage runs in a worker thread, so several pipelines can run
+        concurrently with asyncio.gather.
+
+        Args:
+            sound_type: Type of sound for metadata.
+            duration_minutes: Duration of the mix in minutes.
+            mix_type: Type of mix ("sleep", "focus", "relax").
+            privacy_status: YouTube privacy status.
+            use_waveform: Whether to use waveform visualization.
+            upload: Whether to upload to YouTube.
+
+        Returns:
+            Dictionary with pipeline results.
+        """
+        results = self._new_results()
+
+        logger.info("Starting Autotube pipeline...")
+
+        if not await asyncio.to_thread(
+            self._produce_video,
+            results,
+            sound_type,
+            duration_minutes,
+            mix_type,
+            VideoConfig(use_waveform=use_waveform),
+        ):
+            return results
+
+        # Step 4: Upload to YouTube (optional)
+        if upload and not await asyncio.to_thread(
+            self._upload_results, results, privacy_status
+        ):
+            return results
+
+        results["success"] = True
+        logger.info("Pipeline completed successfully!")
+        return results
+
+    def run_batch_pipeline(
+        self,
+        plans: list,
+        privacy_status: str = "private",
+        video_config: Optional[VideoConfig] = None,
+        upload: bool = True,
+    ) -> list:
+        """
+        Run the pipeline for several content plans, overlapping the stages.
+
+        Videos are produced one after another while finished videos upload
+        on a separate thread, so creating the next (CPU-bound) video
+        overlaps the (network-bound) upload of the previous one. At most
+        MAX_PENDING_UPLOADS finished videos wait for upload at a time.
+
+        Args:
+            plans: Content plan dictionaries, as returned by plan_content.
+            privacy_status: YouTube privacy status.
+            video_config: Rendering settings shared by every video; defaults
+                to a static background video.
+            upload: Whether to upload to YouTube.
+
+        Returns:
+            Pipeline results dictionary for each plan, in order.
+        """
+        if video_config is None:
+            video_config = VideoConfig()
+
+        batch_results = []
+        pending = []
+
+        def finish_upload() -> None:
+            results, future = pending.pop(0)
+            results["success"] = future.result()
+
+        with ThreadPoolExecutor(max_workers=1) as upload_executor:
+            for plan in plans:
+                results = self._new_results()
+                batch_results.append(results)
+                logger.info("Starting Autotube pipeline for %s...", plan["sound_type"])
+
+                if not self._produce_video(
+                    results,
+                    plan["sound_type"],
+                    plan.get("duration_hours", 1) * 60,
+                    plan.get("purpose", "sleep"),
+                    video_config,
+                ):
+                    continue
+
+                if not upload:
+                    results["success"] = True
+                    continue
+
+                pending.append(
+                    (
+                        results,
+                        upload_executor.submit(
+                            self._upload_results, results, privacy_status
+                        ),
+                    )
+                )
+                # Don't let finished videos pile up behind a slow upload
+                while len(pending) > MAX_PENDING_UPLOADS:
+                    finish_upload()
+
+            while pending:
+                finish_upload()
+
+        succeeded = sum(results["success"] for results in batch_results)
+        logger.info("Batch pipeline completed: %d/%d videos", succeeded, len(plans))
+        return batch_results
+
+    @staticmethod
+    def _new_results() -> dict:
+        """Create the results dictionary of a pipeline run."""
+        return {
             "success": False,
             "audio_path": None,
             "video_path": None,
@@ -291,60 +565,97 @@ class AutotubeOrchestrator:
             "errors": [],
         }
 
-        logger.info("Starting Autotube pipeline...")
+    def _produce_video(
+        self,
+        results: dict,
+        sound_type: str,
+        duration_minutes: int,
+        mix_type: str,
+        video_config: VideoConfig,
+    ) -> bool:
+        """
+        Create the audio mix, metadata and video of a pipeline run.
+
+        Args:
+            results: Pipeline results dictionary to fill in.
+            sound_type: Type of sound for metadata.
+            duration_minutes: Duration of the mix in minutes.
+            mix_type: Type of mix ("sleep", "focus", "relax").
+            video_config: Rendering settings for the video.
+
+        Returns:
+            True if the video was created, False otherwise.
+        """
+        duration_hours = _duration_hours(duration_minutes)
+
+        # Steps 1 and 2 are independent: metadata only needs the pipeline
+        # arguments, so it is generated while the audio mix is created
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Step 1: Create audio mix
+            logger.info("Step 1: Creating audio mix...")
+            audio_future = executor.submit(
+                self.create_audio_mix,
+                duration_minutes=duration_minutes,
+                mix_type=mix_type,
+            )
+
+            # Step 2: Generate metadata
+            logger.info("Step 2: Generating metadata...")
+            metadata_future = executor.submit(
+                self.generate_metadata,
+                sound_type=sound_type,
+                duration_hours=duration_hours,
+                purpose=mix_type,
+            )
+
+            audio_path = audio_future.result()
+            metadata = metadata_future.result()
 
-        # Step 1: Create audio mix
-        logger.info("Step 1: Creating audio mix...")
-        audio_path = self.create_audio_mix(
-            duration_minutes=duration_minutes,
-            mix_type=mix_type,
-        )
         if not audio_path:
             results["errors"].append("Failed to create audio mix")
-            return results
+            return False
         results["audio_path"] = audio_path
-
-        # Step 2: Generate metadata
-        logger.info("Step 2: Generating metadata...")
-        # Use fractional hours for more accurate metadata representation
-        duration_hours = max(1, round(duration_minutes / 60))
-        metadata = self.generate_metadata(
-            sound_type=sound_type,
-            duration_hours=duration_hours,
-            purpose=mix_type,
-        )
         results["metadata"] = metadata
 
         # Step 3: Create video
         logger.info("Step 3: Creating video...")
         video_path = self.create_video_from_mix(
             audio_path=audio_path,
-            title_text=metadata["title"] if not use_waveform else None,
-            use_waveform=use_waveform,
+            title_text=metadata["title"] if not video_config.use_waveform else None,
+            use_waveform=video_config.use_waveform,
+            background_color=video_config.background_color,
         )
         if not video_path:
             results["errors"].append("Failed to create video")
-            return results
+            return False
         results["video_path"] = video_path
+        return True
 
-        # Step 4: Upload to YouTube (optional)
-        if upload:
-            logger.info("Step 4: Uploading to YouTube...")
-            video_id = self.upload_video(
-                video_path=video_path,
-                title=metadata["title"],
-                description=metadata["description"],
-                tags=metadata["tags"],
-                privacy_status=privacy_status,
-            )
-            if not video_id:
-                results["errors"].append("Failed to upload video")
-                return results
-            results["video_id"] = video_id
+    def _upload_results(self, results: dict, privacy_status: str) -> bool:
+        """
+        Upload the video of a pipeline run to YouTube.
 
-        results["success"] = True
-        logger.info("Pipeline completed successfully!")
-        return results
+        Args:
+            results: Pipeline results dictionary with the video and metadata.
+            privacy_status: YouTube privacy status.
+
+        Returns:
+            True if the upload succeeded, False otherwise.
+        """
+        logger.info("Step 4: Uploading to YouTube...")
+        metadata = results["metadata"]
+        video_id = self.upload_video(
+            video_path=results["video_path"],
+            title=metadata["title"],
+            description=metadata["description"],
+            tags=metadata["tags"],
+            privacy_status=privacy_status,
+        )
+        if not video_id:
+            results["errors"].append("Failed to upload video")
+            return False
+        results["video_id"] = video_id
+        return True
 
     def plan_content(
         self,
@@ -374,6 +685,16 @@ class AutotubeOrchestrator:
         if start_date is None:
             start_date = datetime.now()
 
+        # Optimal publish time for each distinct purpose, looked up once
+        optimal_times = {
+            purpose: self.metadata_generator.get_optimal_publish_time(purpose).get(
+                "weekday", "20:00"
+            )
+            for purpose in dict.fromkeys(purposes)
+        }
+
+        # Dates are formatted with isoformat, which skips strftime's parser
+        base_date = start_date.date()
         content_plan = []
 
         for i in range(num_videos):
@@ -381,24 +702,20 @@ class AutotubeOrchestrator:
             sound_type = sound_types[i % len(sound_types)]
             purpose = purposes[i % len(purposes)]
 
-            # Schedule videos daily
-            publish_date = start_date + timedelta(days=i)
-
-            # Get optimal publish time
-            optimal_times = self.metadata_generator.get_optimal_publish_time(purpose)
-
             plan_item = {
                 "video_number": i + 1,
                 "sound_type": sound_type,
                 "purpose": purpose,
-                "scheduled_date": publish_date.strftime("%Y-%m-%d"),
-                "optimal_time": optimal_times.get("weekday", "20:00"),
+                # Schedule videos daily
+                "scheduled_date": (base_date + timedelta(days=i)).isoformat(),
+                "optimal_time": optimal_times[purpose],
                 "duration_hours": 8 if purpose == "sleep" else 2,
                 "status": "planned",
             }
 
             content_plan.append(plan_item)
-            logger.info(f"Planned video {i + 1}: {sound_type} {purpose}")
+            # Formatted lazily: skipped entirely when INFO logging is off
+            logger.info("Planned video %d: %s %s", i + 1, sound_type, purpose)
 
         return content_plan
 
@@ -413,15 +730,9 @@ class AutotubeOrchestrator:
             "input_folder": self.input_folder,
             "output_folder": self.output_folder,
             "video_folder": self.video_folder,
-            "input_files": len(os.listdir(self.input_folder))
-            if os.path.exists(self.input_folder)
-            else 0,
-            "output_files": len(os.listdir(self.output_folder))
-            if os.path.exists(self.output_folder)
-            else 0,
-            "video_files": len(os.listdir(self.video_folder))
-            if os.path.exists(self.video_folder)
-            else 0,
+            "input_files": self._count_files(self.input_folder),
+            "output_files": self._count_files(self.output_folder),
+            "video_files": self._count_files(self.video_folder),
             "components": {
                 "sound_processor": self._sound_processor is not None,
                 "video_generator": self._video_generator is not None,
@@ -429,3 +740,29 @@ class AutotubeOrchestrator:
                 "metadata_generator": self._metadata_generator is not None,
             },
         }
+
+    def _count_files(self, folder: str) -> int:
+        """
+        Count the entries in a folder, rescanning only after it changes.
+
+        Adding, removing or renaming an entry updates the folder's
+        modification time, so an unchanged time means an unchanged count.
+
+        Args:
+            folder: Directory to count.
+
+        Returns:
+            Number of entries, or 0 if the folder doesn't exist.
+        """
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+        cached = self._file_counts.get(folder)
+        if cached is None or cached[0] != mtime:
+            # Close the directory handle as soon as the count is done
+            with os.scandir(folder) as entries:
+                cached = (mtime, sum(1 for _ in entries))
+            self._file_counts[folder] = cached
+        return cached[1]
@@ -10,6 +10,9 @@ from pydub.effects import normalize
 
 logger = logging.getLogger(__name__)
 
+# Clips whose extracted features each SoundProcessor keeps for reuse
+FEATURE_CACHE_SIZE = 256
+
 
 class SoundProcessor:
     """
@@ -40,6 +43,7 @@ class SoundProcessor:
         self.sample_rate = sample_rate
         self.bit_rate = bit_rate
         self.channels = 2  # Default to stereo
+        self._feature_cache = {}
 
         # Create necessary directories
         for folder in [input_folder, processed_folder, output_folder]:
@@ -219,12 +223,10 @@ class SoundProcessor:
         for filename in os.listdir(self.processed_folder):
             file_path = os.path.join(self.processed_folder, filename)
             try:
-                y, sr = librosa.load(file_path, sr=self.sample_rate)
-
                 # Extract comprehensive features
-                basic_features = self._extract_audio_features(y, sr)
-                psycho_features = self.extract_psychoacoustic_features(y, sr)
-                temporal_features = self.analyze_temporal_patterns(y, sr)
+                basic_features, psycho_features, temporal_features = (
+                    self._clip_features(file_path)
+                )
 
                 # Combine all features
                 combined_features = {
@@ -262,6 +264,38 @@ class SoundProcessor:
         # return self._extract_audio_features(y, sr)
         return {"dummy_feature": 0.0}
 
+    def _clip_features(
+        self, file_path: str
+    ) -> Tuple[Dict[str, float], Dict[str, float], Dict[str, float]]:
+        """
+        Extract the basic, psychoacoustic and temporal features of a clip.
+
+        Decoding and resampling dominate analysis time, so the features are
+        reused until the file's modification time or size changes.
+
+        Args:
+            file_path: Path to audio file
+
+        Returns:
+            Tuple of basic, psychoacoustic and temporal feature dictionaries
+        """
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_mtime_ns, stat.st_size, self.sample_rate)
+        cached = self._feature_cache.get(key)
+        if cached is None:
+            y, sr = librosa.load(file_path, sr=self.sample_rate)
+            cached = (
+                self._extract_audio_features(y, sr),
+                self.extract_psychoacoustic_features(y, sr),
+                self.analyze_temporal_patterns(y, sr),
+            )
+            if len(self._feature_cache) >= FEATURE_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._feature_cache[next(iter(self._feature_cache))]
+            self._feature_cache[key] = cached
+        # Copies, so callers can't alter the cached features
+        return tuple(dict(features) for features in cached)
+
     def _extract_audio_features(self, y: np.ndarray, sr: int) -> Dict[str, float]:
         """
         Extract audio features for classification.
@@ -477,13 +511,10 @@ class SoundProcessor:
             Dictionary of sleep quality metrics
         """
         try:
-            # Load audio
-            y, sr = librosa.load(file_path, sr=self.sample_rate)
-
             # Extract basic features
-            features = self._extract_audio_features(y, sr)
-            psycho_features = self.extract_psychoacoustic_features(y, sr)
-            temporal_features = self.analyze_temporal_patterns(y, sr)
+            features, psycho_features, temporal_features = self._clip_features(
+                file_path
+            )
 
             # Calculate sleep induction potential
             # Research suggests sounds with these characteristics are best for sleep:
@@ -749,10 +780,9 @@ class SoundProcessor:
             file_path = os.path.join(processed_folder, filename)
             try:
                 # Extract features
-                y, sr = librosa.load(file_path, sr=self.sample_rate)
-                features = self._extract_audio_features(y, sr)
-                psycho_features = self.extract_psychoacoustic_features(y, sr)
-                temporal_features = self.analyze_temporal_patterns(y, sr)
+                features, psycho_features, temporal_features = self._clip_features(
+                    file_path
+                )
 
                 # Combine all features
                 combined_features = {**features, **psycho_features, **temporal_features}
@@ -5,6 +5,8 @@ import time
 from pathlib import Path  # Added missing import
 from typing import Dict
 
+from project_name.utils.json_io import read_json_cached, write_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,6 +84,10 @@ class UserProfile:
         # A/B test results
         self.ab_test_results = {}  # Test ID to preferred variant (A or B)
 
+        # Sequence number of the last event logged to (or replayed from) the
+        # profile's log; saved with the profile so replay skips applied events
+        self.log_seq = 0
+
     def update_from_feedback(
         self, mix_id: str, feedback_score: int, mix_params: Dict
     ) -> None:
@@ -144,7 +150,7 @@ class UserProfile:
         preferred_variant: str,
         variant_a_params: Dict,
         variant_b_params: Dict,
-    ) -> None:
+    ) -> bool:
         """
         Update profile based on A/B test results.
 
@@ -153,10 +159,19 @@ class UserProfile:
             preferred_variant: User's preferred variant ('A' or 'B')
             variant_a_params: Parameters used for variant A
             variant_b_params: Parameters used for variant B
+
+        Returns:
+            True if the profile changed and needs saving
         """
+        before = (
+            self.ab_test_results.get(test_id),
+            dict(self.category_weights),
+            dict(self.eq_preferences),
+            dict(self.volume_preferences),
+        )
+
         # Store result
         self.ab_test_results[test_id] = preferred_variant
-        self.last_updated = time.time()
 
         # Get the preferred and non-preferred parameters
         if preferred_variant == "A":
@@ -200,9 +215,126 @@ class UserProfile:
                     # Move 30% of the way toward the preferred value
                     current = self.volume_preferences[key]
                     self.volume_preferences[key] = current + (value - current) * 0.3
+        changed = before != (
+            self.ab_test_results.get(test_id),
+            self.category_weights,
+            self.eq_preferences,
+            self.volume_preferences,
+        )
+        if changed:
+            self.last_updated = time.time()
+
         logger.info(
             f"Updated profile for {self.name} based on A/B test (preferred: variant {preferred_variant})"
         )
+        return changed
+
+    def _file_stem(self) -> str:
+        """Get the base filename used for this profile's files."""
+        return self.name.lower().replace(" ", "_")
+
+    def _append_log_event(self, event: Dict, folder_path: str) -> Path:
+        """Append an event to the profile's feedback log under a new sequence number."""
+        os.makedirs(folder_path, exist_ok=True)
+        log_path = os.path.join(folder_path, f"{self._file_stem()}.feedback.jsonl")
+
+        self.log_seq += 1
+        line = (json.dumps({"seq": self.log_seq, **event}) + "\n").encode("utf-8")
+
+        # A single write on an O_APPEND descriptor keeps each event intact
+        fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+        return Path(log_path)
+
+    def log_feedback(
+        self,
+        mix_id: str,
+        feedback_score: int,
+        mix_params: Dict,
+        folder_path: str = "user_profiles",
+    ) -> Path:
+        """
+        Append a feedback event to the profile's feedback log.
+
+        This is a cheap alternative to save() for frequent feedback; the log
+        is replayed by load() and removed by the next save().
+
+        Args:
+            mix_id: ID of the mix
+            feedback_score: User feedback score (1-10)
+            mix_params: Parameters used to create the mix
+            folder_path: Folder containing the profile
+
+        Returns:
+            Path to the feedback log
+        """
+        event = {
+            "type": "feedback",
+            "mix_id": mix_id,
+            "feedback_score": feedback_score,
+            "mix_params": mix_params,
+        }
+        return self._append_log_event(event, folder_path)
+
+    def log_ab_test_result(
+        self,
+        test_id: str,
+        preferred_variant: str,
+        variant_a_params: Dict,
+        variant_b_params: Dict,
+        folder_path: str = "user_profiles",
+    ) -> Path:
+        """
+        Append an A/B test result to the profile's feedback log.
+
+        Args:
+            test_id: ID of the A/B test
+            preferred_variant: User's preferred variant ('A' or 'B')
+            variant_a_params: Parameters used for variant A
+            variant_b_params: Parameters used for variant B
+            folder_path: Folder containing the profile
+
+        Returns:
+            Path to the feedback log
+        """
+        event = {
+            "type": "ab_test",
+            "test_id": test_id,
+            "preferred_variant": preferred_variant,
+            "variant_a_params": variant_a_params,
+            "variant_b_params": variant_b_params,
+        }
+        return self._append_log_event(event, folder_path)
+
+    def _replay_feedback_log(self, log_path: str) -> None:
+        """Apply events from a feedback log not yet reflected in this profile."""
+        with open(log_path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+
+                # Events up to log_seq were already saved with the profile
+                seq = event.get("seq", 0)
+                if seq and seq <= self.log_seq:
+                    continue
+
+                if event.get("type") == "ab_test":
+                    self.update_from_ab_test(
+                        event["test_id"],
+                        event["preferred_variant"],
+                        event["variant_a_params"],
+                        event["variant_b_params"],
+                    )
+                else:
+                    self.update_from_feedback(
+                        event["mix_id"], event["feedback_score"], event["mix_params"]
+                    )
+                self.log_seq = max(self.log_seq, seq)
 
     def save(
         self, folder_path: str = "user_profiles"
@@ -219,7 +351,7 @@ class UserProfile:
         os.makedirs(folder_path, exist_ok=True)
 
         # Create filename
-        filename = f"{self.name.lower().replace(' ', '_')}_profile.json"
+        filename = f"{self._file_stem()}_profile.json"
         file_path = os.path.join(folder_path, filename)
 
         # Convert to dict for serialization
@@ -236,11 +368,16 @@ class UserProfile:
             "eq_preferences": self.eq_preferences,
             "mix_feedback": self.mix_feedback,
             "ab_test_results": self.ab_test_results,
+            "log_seq": self.log_seq,
         }
 
         # Save to file
-        with open(file_path, "w") as f:
-            json.dump(profile_data, f, indent=2)
+        write_json(file_path, profile_data)
+
+        # The saved profile now includes all logged feedback
+        log_path = os.path.join(folder_path, f"{self._file_stem()}.feedback.jsonl")
+        if os.path.exists(log_path):
+            os.remove(log_path)
 
         logger.info(f"Saved user profile to {file_path}")
         return Path(file_path)  # Return Path object
@@ -257,30 +394,37 @@ class UserProfile:
             Loaded UserProfile object
         """
         try:
-            with open(file_path, "r") as f:
-                profile_data = json.load(f)
+            # Decoded data is cached until the file changes
+            profile_data = read_json_cached(file_path)
 
             # Create new profile instance
             profile = cls(name=profile_data.get("name", "default"))
 
-            # Load attributes
+            # Load attributes, copying containers so the cached data is not
+            # shared with (and mutated through) the profile
             profile.sleep_issue = profile_data.get("sleep_issue")
             profile.creation_date = profile_data.get("creation_date", time.time())
             profile.last_updated = profile_data.get("last_updated", time.time())
-            profile.category_weights = profile_data.get(
-                "category_weights", profile.category_weights
+            profile.category_weights = dict(
+                profile_data.get("category_weights", profile.category_weights)
             )
-            profile.preferred_sounds = profile_data.get("preferred_sounds", [])
-            profile.avoided_sounds = profile_data.get("avoided_sounds", [])
+            profile.preferred_sounds = list(profile_data.get("preferred_sounds", []))
+            profile.avoided_sounds = list(profile_data.get("avoided_sounds", []))
             profile.preferred_duration = profile_data.get("preferred_duration", 60)
-            profile.volume_preferences = profile_data.get(
-                "volume_preferences", profile.volume_preferences
+            profile.volume_preferences = dict(
+                profile_data.get("volume_preferences", profile.volume_preferences)
             )
-            profile.eq_preferences = profile_data.get(
-                "eq_preferences", profile.eq_preferences
+            profile.eq_preferences = dict(
+                profile_data.get("eq_preferences", profile.eq_preferences)
             )
-            profile.mix_feedback = profile_data.get("mix_feedback", {})
-            profile.ab_test_results = profile_data.get("ab_test_results", {})
+            profile.mix_feedback = dict(profile_data.get("mix_feedback", {}))
+            profile.ab_test_results = dict(profile_data.get("ab_test_results", {}))
+            profile.log_seq = profile_data.get("log_seq", 0)
+
+            # Apply feedback logged since the profile was last saved
+            log_path = str(file_path).replace("_profile.json", ".feedback.jsonl")
+            if log_path != str(file_path) and os.path.exists(log_path):
+                profile._replay_feedback_log(log_path)
 
             logger.info(f"Loaded user profile from {file_path}")
             return profile
@@ -0,0 +1,73 @@
+"""
+JSON file helpers shared by the user profile and A/B test stores.
+
+orjson is used when installed (the "fast-json" extra); otherwise the
+standard library json module is used.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def read_json(file_path: str) -> Any:
+    """
+    Decode a JSON file.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Decoded data
+    """
+    if ORJSON_AVAILABLE:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+
+def write_json(file_path: str, data: Any) -> None:
+    """
+    Write data to a file as indented JSON.
+
+    Args:
+        file_path: Path to the JSON file
+        data: JSON-serializable data
+    """
+    if ORJSON_AVAILABLE:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+@lru_cache(maxsize=4096)
+def _read_json_memoized(file_path: str, mtime_ns: int, size: int) -> Any:
+    """Decode a JSON file, memoized by path, modification time and size."""
+    return read_json(file_path)
+
+
+def read_json_cached(file_path: str) -> Any:
+    """
+    Decode a JSON file, reusing the result until the file changes.
+
+    The returned data is shared between calls; copy it before modifying.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Decoded data
+    """
+    stat = os.stat(file_path)
+    return _read_json_memoized(str(file_path), stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,317 @@
+"""Tests for the deep learning MixLearner."""
+
+import gc
+import os
+import sys
+import weakref
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from project_name.core import deep_learning
+from project_name.core.ab_testing import ABTest
+from project_name.core.deep_learning import MixLearner
+from project_name.core.user_profile import UserProfile
+
+
+@pytest.mark.unit
+class TestMixLearnerLoading:
+    def test_load_profiles_reloads_from_json(self, temp_dir: Path):
+        """Test that profiles load from their JSON files alone."""
+        UserProfile(name="alice", sleep_issue="insomnia").save(str(temp_dir))
+        UserProfile(name="bob", sleep_issue="anxiety").save(str(temp_dir))
+        saved_files = set(os.listdir(temp_dir))
+
+        learner = MixLearner()
+        learner.load_profiles(str(temp_dir))
+        assert set(learner.profiles) == {"alice", "bob"}
+        assert set(os.listdir(temp_dir)) == saved_files
+
+        reloaded_learner = MixLearner()
+        reloaded_learner.load_profiles(str(temp_dir))
+        assert set(reloaded_learner.profiles) == {"alice", "bob"}
+        assert reloaded_learner.profiles["bob"].sleep_issue == "anxiety"
+
+    def test_load_profiles_rescans_when_files_change(self, temp_dir: Path):
+        """Test that a new profile file is picked up on the next load."""
+        UserProfile(name="alice").save(str(temp_dir))
+        MixLearner().load_profiles(str(temp_dir))
+
+        UserProfile(name="carol").save(str(temp_dir))
+
+        learner = MixLearner()
+        learner.load_profiles(str(temp_dir))
+        assert set(learner.profiles) == {"alice", "carol"}
+
+    def test_load_ab_tests_reloads_from_json(self, temp_dir: Path):
+        """Test that A/B tests load from their JSON files alone."""
+        test = ABTest("abtest_alice_1")
+        test.setup_test("volume", -3, 0)
+        test.save(str(temp_dir))
+        saved_files = set(os.listdir(temp_dir))
+
+        learner = MixLearner()
+        learner.load_ab_tests(str(temp_dir))
+        assert [t.test_id for t in learner.ab_tests] == ["abtest_alice_1"]
+        assert set(os.listdir(temp_dir)) == saved_files
+
+        reloaded_learner = MixLearner()
+        reloaded_learner.load_ab_tests(str(temp_dir))
+        assert [t.test_id for t in reloaded_learner.ab_tests] == ["abtest_alice_1"]
+
+
+@pytest.mark.unit
+class TestMixLearnerTrends:
+    def test_analyze_learning_trends_is_cached(self):
+        """Test that trends are reused until profiles change."""
+        learner = MixLearner()
+        learner.profiles["alice"] = UserProfile(name="alice", sleep_issue="insomnia")
+
+        trends = learner.analyze_learning_trends()
+        assert learner.analyze_learning_trends() == trends
+
+        learner.invalidate_trends()
+        learner.profiles["bob"] = UserProfile(name="bob", sleep_issue="anxiety")
+        updated = learner.analyze_learning_trends()
+        assert updated["sleep_issues"] == {"insomnia": 1, "anxiety": 1}
+
+    def test_analyze_learning_trends_returns_copies(self):
+        """Test that modifying returned trends does not corrupt the cache."""
+        learner = MixLearner()
+        learner.profiles["alice"] = UserProfile(name="alice", sleep_issue="insomnia")
+
+        trends = learner.analyze_learning_trends()
+        trends["sleep_issues"]["insomnia"] = 99
+        assert learner.analyze_learning_trends()["sleep_issues"] == {"insomnia": 1}
+
+    def test_analyze_learning_trends_counts_ab_results(self):
+        """Test that A/B preferences are tallied per parameter."""
+        learner = MixLearner()
+        for i, (parameter, result) in enumerate(
+            [
+                ("eq_preferences.low", "A"),
+                ("category_weights.rain", "B"),
+                ("eq_preferences.low", "A"),
+                ("custom_parameter", "B"),
+                ("category_weights.rain", None),
+            ]
+        ):
+            test = ABTest(f"abtest_alice_{i}")
+            test.test_parameter = parameter
+            test.result = result
+            learner.ab_tests.append(test)
+
+        assert learner.analyze_learning_trends()["parameters"] == {
+            "eq_preferences.low": {"a_preferred": 2, "b_preferred": 0},
+            "category_weights.rain": {"a_preferred": 0, "b_preferred": 1},
+            "custom_parameter": {"a_preferred": 0, "b_preferred": 1},
+        }
+
+    def test_record_mix_feedback_invalidates_recommendations(
+        self, temp_dir: Path, monkeypatch
+    ):
+        """Test that feedback invalidates cached recommendations."""
+        learner = MixLearner()
+        learner.profiles["alice"] = UserProfile(name="alice", sleep_issue="insomnia")
+
+        before = learner.get_recommended_parameters_for_sleep_issue("insomnia")
+        before["category_weights"]["rain"] = -1
+        assert (
+            learner.get_recommended_parameters_for_sleep_issue("insomnia")[
+                "category_weights"
+            ]["rain"]
+            == 0.7
+        )
+
+        monkeypatch.chdir(temp_dir)
+        learner.record_mix_feedback(
+            "alice", "mix_1", 9, {"category_weights": {"rain": 0.7}}
+        )
+        after = learner.get_recommended_parameters_for_sleep_issue("insomnia")
+        assert after["category_weights"]["rain"] > 0.7
+        learner.flush_profiles()
+
+    def test_record_mix_feedback_logs_until_flush(self, temp_dir: Path, monkeypatch):
+        """Test that feedback is appended to a log and compacted on flush."""
+        monkeypatch.chdir(temp_dir)
+        learner = MixLearner()
+        learner.get_profile("alice", sleep_issue="insomnia")
+
+        learner.record_mix_feedback("alice", "mix_1", 8, {})
+        learner.record_mix_feedback("alice", "mix_2", 3, {})
+        log_path = temp_dir / "user_profiles" / "alice.feedback.jsonl"
+        assert len(log_path.read_text().splitlines()) == 2
+
+        learner.flush_profiles()
+        assert not log_path.exists()
+        loaded = UserProfile.load(
+            str(temp_dir / "user_profiles" / "alice_profile.json")
+        )
+        assert loaded.mix_feedback == {"mix_1": 8, "mix_2": 3}
+
+    def test_feedback_flush_hook_does_not_keep_learner_alive(
+        self, temp_dir: Path, monkeypatch
+    ):
+        """Test that the exit flush hook holds the learner weakly."""
+        monkeypatch.chdir(temp_dir)
+        learner = MixLearner()
+        learner.record_mix_feedback("alice", "mix_1", 8, {})
+
+        learner_ref = weakref.ref(learner)
+        del learner
+        gc.collect()
+        assert learner_ref() is None
+
+
+@pytest.mark.unit
+class TestMixLearnerABTests:
+    def test_record_ab_test_result_finds_loaded_test(
+        self, temp_dir: Path, monkeypatch
+    ):
+        """Test that results can be recorded for tests loaded from disk."""
+        test = ABTest("abtest_alice_1")
+        test.setup_test("volume", -3, 0)
+        test.save(str(temp_dir))
+
+        learner = MixLearner()
+        learner.load_ab_tests(str(temp_dir))
+
+        monkeypatch.chdir(temp_dir)
+        learner.record_ab_test_result("abtest_alice_1", "B")
+        assert learner.ab_tests[0].result == "B"
+        assert learner.profiles["alice"].ab_test_results == {"abtest_alice_1": "B"}
+
+    def test_record_ab_test_result_logs_until_flush(
+        self, temp_dir: Path, monkeypatch
+    ):
+        """Test that A/B results are appended to the log, not saved."""
+        monkeypatch.chdir(temp_dir)
+        learner = MixLearner()
+        test = learner.create_ab_test("alice")
+        profile_path = temp_dir / "user_profiles" / "alice_profile.json"
+        profile_mtime = profile_path.stat().st_mtime_ns
+
+        learner.record_ab_test_result(test.test_id, "B")
+        log_path = temp_dir / "user_profiles" / "alice.feedback.jsonl"
+        assert len(log_path.read_text().splitlines()) == 1
+        assert profile_path.stat().st_mtime_ns == profile_mtime
+
+        learner.flush_profiles()
+        assert not log_path.exists()
+        loaded = UserProfile.load(str(profile_path))
+        assert loaded.ab_test_results == {test.test_id: "B"}
+
+    def test_record_ab_test_result_unknown_test(self):
+        """Test that unknown test IDs are ignored."""
+        learner = MixLearner()
+        learner.record_ab_test_result("abtest_missing_1", "A")
+        assert learner.profiles == {}
+
+    def test_record_ab_test_result_skips_unchanged_save(
+        self, temp_dir: Path, monkeypatch
+    ):
+        """Test that re-recording the same result does not rewrite files."""
+        monkeypatch.chdir(temp_dir)
+        learner = MixLearner()
+        test = learner.create_ab_test("alice")
+        learner.record_ab_test_result(test.test_id, "A")
+
+        profile_path = temp_dir / "user_profiles" / "alice_profile.json"
+        test_path = temp_dir / "ab_tests" / f"{test.test_id}.json"
+        profile_mtime = profile_path.stat().st_mtime_ns
+        test_mtime = test_path.stat().st_mtime_ns
+
+        learner.record_ab_test_result(test.test_id, "A")
+        assert profile_path.stat().st_mtime_ns == profile_mtime
+        assert test_path.stat().st_mtime_ns == test_mtime
+
+
+@pytest.mark.unit
+class TestMixLearnerOptimize:
+    def test_optimize_mix_parameters_returns_copies(self):
+        """Test that optimized parameters do not alias the profile."""
+        learner = MixLearner()
+        profile = UserProfile(name="alice", sleep_issue="insomnia")
+        learner.profiles["alice"] = profile
+
+        optimized = learner.optimize_mix_parameters("alice", {"duration": 30})
+        assert optimized["duration"] == 30
+        assert optimized["category_weights"] == profile.category_weights
+
+        optimized["category_weights"]["rain"] = 0.0
+        optimized["preferred_sounds"].append("rain.wav")
+        assert profile.category_weights["rain"] == 0.7
+        assert profile.preferred_sounds == []
+
+    def test_optimized_parameters_round_trip_through_feedback(
+        self, temp_dir: Path, monkeypatch
+    ):
+        """Test that optimized parameters can be fed back as mix feedback."""
+        monkeypatch.chdir(temp_dir)
+        learner = MixLearner()
+        learner.get_profile("alice", sleep_issue="insomnia")
+
+        optimized = learner.optimize_mix_parameters("alice")
+        learner.record_mix_feedback("alice", "mix_1", 9, optimized)
+        learner.flush_profiles()
+
+        loaded = UserProfile.load(
+            str(temp_dir / "user_profiles" / "alice_profile.json")
+        )
+        assert loaded.mix_feedback == {"mix_1": 9}
+
+
+@pytest.mark.unit
+class TestTensorRTExport:
+    def test_export_returns_loadable_onnx_path(self, temp_dir: Path, monkeypatch):
+        """Test that the exported model path is one _load_predictor can run."""
+        exported = []
+        fake_tf2onnx = SimpleNamespace(
+            convert=SimpleNamespace(
+                from_keras=lambda model, input_signature, output_path: (
+                    exported.append(output_path)
+                )
+            )
+        )
+        fake_tf = SimpleNamespace(
+            TensorSpec=lambda shape, dtype, name: (shape, dtype, name),
+            float32="float32",
+        )
+        monkeypatch.setitem(sys.modules, "tf2onnx", fake_tf2onnx)
+        monkeypatch.setattr(deep_learning, "tf", fake_tf, raising=False)
+        monkeypatch.setattr(deep_learning, "DEEP_LEARNING_AVAILABLE", True)
+
+        model = SimpleNamespace(input_shape=(None, 41, 1))
+        model_path = deep_learning.export_for_tensorrt(
+            model, str(temp_dir / "model.h5")
+        )
+        assert model_path == str(temp_dir / "model.onnx")
+        assert exported == [model_path]
+
+        session_args = {}
+
+        class FakeSession:
+            def __init__(self, path, providers):
+                session_args.update(path=path, providers=providers)
+
+            def get_inputs(self):
+                return [SimpleNamespace(name="features", shape=[None, 41, 1])]
+
+            def get_providers(self):
+                return ["CPUExecutionProvider"]
+
+            def run(self, outputs, feeds):
+                return [np.zeros((len(feeds["features"]), 6), dtype=np.float32)]
+
+        fake_ort = SimpleNamespace(
+            get_available_providers=lambda: ["CPUExecutionProvider"],
+            InferenceSession=FakeSession,
+        )
+        monkeypatch.setitem(sys.modules, "onnxruntime", fake_ort)
+
+        feature_shape, predict = deep_learning._load_predictor(model_path, 4)
+        assert feature_shape == (41, 1)
+        assert session_args["path"] == model_path
+        assert predict(np.zeros((4, 41, 1), dtype=np.float32)).shape == (4, 6)
@@ -1,5 +1,7 @@
 """Tests for the MetadataGenerator module."""
 
+import random
+
 import pytest
 
 
@@ -19,6 +21,13 @@ class TestMetadataGenerator:
         assert len(generator.TITLE_TEMPLATES) > 0
         assert len(generator.DESCRIPTION_TEMPLATES) > 0
 
+    def test_templates_are_read_only(self, generator):
+        """Test the shared template tables cannot be modified."""
+        with pytest.raises(TypeError):
+            generator.TITLE_TEMPLATES["sleep"] = ["{sound_type}"]
+        with pytest.raises(AttributeError):
+            generator.PURPOSE_TAGS["sleep"].append("custom")
+
     def test_generate_title_sleep(self, generator):
         """Test title generation for sleep videos."""
         title = generator.generate_title(
@@ -61,6 +70,43 @@ class TestMetadataGenerator:
         )
         assert title == "Rain - 6H Custom"
 
+    def test_generate_title_follows_random_seed(self, generator):
+        """Test titles are reproducible with random.seed or a seeded rng."""
+        from project_name.core.metadata_generator import MetadataGenerator
+
+        random.seed(42)
+        first = [generator.generate_title("Rain") for _ in range(5)]
+        random.seed(42)
+        assert [generator.generate_title("Rain") for _ in range(5)] == first
+
+        seeded = [
+            MetadataGenerator(rng=random.Random(7)).generate_title("Rain")
+            for _ in range(2)
+        ]
+        assert seeded[0] == seeded[1]
+
+    def test_generate_titles_batch(self, generator):
+        """Test batch title generation follows each spec in order."""
+        specs = [
+            {"sound_type": "Rain", "duration_hours": 8, "purpose": "sleep"},
+            {"sound_type": "Ocean", "duration_hours": 2, "purpose": "focus"},
+            {"sound_type": "Rain", "custom_template": "{sound_type} {duration}H"},
+            {"sound_type": "Forest", "duration_hours": 24},
+        ]
+
+        titles = generator.generate_titles_batch(specs)
+
+        assert len(titles) == len(specs)
+        assert all(0 < len(title) <= 100 for title in titles)
+        assert titles[1] in {
+            template.format(sound_type="Ocean", duration=2, quality=quality)
+            for template in generator.TITLE_TEMPLATES["focus"]
+            for quality in generator.QUALITY_ADJECTIVES
+        }
+        assert titles[2] == "Rain 8H"
+        assert "24" in titles[3]
+        assert generator.generate_titles_batch([]) == []
+
     def test_generate_description_sleep(self, generator):
         """Test description generation for sleep videos."""
         description = generator.generate_description(
@@ -84,6 +130,49 @@ class TestMetadataGenerator:
         )
         assert additional in description
 
+    @pytest.mark.parametrize("purpose", ["sleep", "focus", "relax"])
+    def test_generate_description_matches_template_format(self, generator, purpose):
+        """Test compiled description templates render like str.format."""
+        description = generator.generate_description(
+            sound_type="Ocean Waves",
+            duration_hours=10,
+            purpose=purpose,
+            additional_info="Recorded at dawn.",
+        )
+        expected = generator.DESCRIPTION_TEMPLATES[purpose].format(
+            sound_type="Ocean Waves",
+            sound_type_lower="ocean waves",
+            duration=10,
+            additional_info="Recorded at dawn.",
+            sound_tag="oceanwaves",
+        )
+        assert description == expected
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "100% {sound_type} {{braces}} for {duration}h",
+            "Only {sound_type}",
+            "No fields, 50% off",
+            "{duration:03d} {sound_type!r}",
+        ],
+    )
+    def test_compiled_template_matches_format(self, template):
+        """Test compiled templates render like str.format."""
+        from project_name.core.metadata_generator import _compile_template
+
+        fields = {"sound_type": "Rain", "duration": 8}
+        assert _compile_template(template)(fields) == template.format(**fields)
+
+    def test_generate_description_custom_template(self, generator):
+        """Test description generation with a custom template."""
+        description = generator.generate_description(
+            sound_type="Rain",
+            duration_hours=3,
+            custom_template="{sound_type_lower} for {duration}h #{sound_tag}",
+        )
+        assert description == "rain for 3h #rain"
+
     def test_generate_tags_sleep(self, generator):
         """Test tag generation for sleep videos."""
         tags = generator.generate_tags(
@@ -118,6 +207,17 @@ class TestMetadataGenerator:
         lower_tags = [t.lower() for t in tags]
         assert len(lower_tags) == len(set(lower_tags))
 
+    def test_generate_tags_keeps_first_spelling(self, generator):
+        """Test that case-insensitive duplicates keep their first spelling."""
+        tags = generator.generate_tags(
+            sound_type="rain",
+            purpose="sleep",
+            additional_tags=["Rain", "MyChannel", "mychannel"],
+        )
+        assert "rain" in tags
+        assert "Rain" not in tags
+        assert tags[-1] == "MyChannel"
+
     def test_generate_complete_metadata(self, generator):
         """Test complete metadata generation."""
         metadata = generator.generate_complete_metadata(
@@ -134,6 +234,35 @@ class TestMetadataGenerator:
         assert len(metadata["description"]) <= 5000
         assert len(metadata["tags"]) <= 30
 
+    def test_generated_at_is_current_timestamp(self, generator):
+        """Test generated_at holds the current time in ISO format."""
+        from datetime import datetime
+
+        first = generator.generate_complete_metadata(sound_type="Rain")
+        second = generator.generate_complete_metadata(sound_type="Rain")
+
+        stamp = datetime.fromisoformat(second["generated_at"])
+        assert abs((datetime.now() - stamp).total_seconds()) < 5
+        assert stamp >= datetime.fromisoformat(first["generated_at"])
+
+    def test_complete_metadata_reuses_description_and_tags(self, generator):
+        """Test repeated arguments reuse the description and tags."""
+        first = generator.generate_complete_metadata(
+            sound_type="Rain", duration_hours=8, purpose="sleep"
+        )
+        first["tags"].append("custom")
+        second = generator.generate_complete_metadata(
+            sound_type="Rain", duration_hours=8, purpose="sleep"
+        )
+        other = generator.generate_complete_metadata(
+            sound_type="Rain", duration_hours=8, purpose="focus"
+        )
+
+        assert second["description"] == first["description"]
+        assert second["tags"] == generator.generate_tags("Rain", "sleep")
+        assert "custom" not in second["tags"]
+        assert other["description"] != first["description"]
+
     def test_generate_scheduled_metadata(self, generator):
         """Test scheduled metadata generation."""
         from datetime import datetime
@@ -166,6 +295,19 @@ class TestMetadataGenerator:
         times = generator.get_optimal_publish_time(purpose="relax")
         assert "18:00" in times["weekday"]  # Evening for relaxation
 
+    def test_get_optimal_publish_time_returns_independent_copy(self, generator):
+        """Test that modifying a result does not leak into later calls."""
+        import json
+
+        times = generator.get_optimal_publish_time(purpose="sleep")
+        times["weekday"] = "23:00"
+        times["best_days"].append("Monday")
+
+        again = generator.get_optimal_publish_time(purpose="sleep")
+        assert again["weekday"] == "20:00"
+        assert again["best_days"] == ["Sunday", "Thursday"]
+        assert json.loads(json.dumps(again)) == again
+
 
 class TestMetadataGeneratorEdgeCases:
     """Test edge cases for MetadataGenerator."""
@@ -4,9 +4,11 @@ import os
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
 import pytest
 from pydub import AudioSegment
 
+from project_name.core import mix_creator as mix_creator_module
 from project_name.core.mix_creator import MixCreator
 
 
@@ -110,6 +112,110 @@ class TestMixCreator:
             abs(len(mix) - target_duration) < crossfade
         )  # Allow small variation due to crossfade
 
+    def test_create_category_mix_skips_unreadable_files(
+        self, mix_creator: MixCreator, temp_dir: Path
+    ):
+        """Test files that fail to decode are skipped, not fatal."""
+        audio_path = temp_dir / "tone.wav"
+        AudioSegment.silent(duration=500).export(audio_path, format="wav")
+        missing = str(temp_dir / "missing.wav")
+
+        mix = mix_creator._create_category_mix(
+            [missing, str(audio_path), missing], 2000, 100
+        )
+
+        assert len(mix) == 2000
+
+    def test_join_with_crossfades(self, mix_creator: MixCreator):
+        """Test joins overlap by the crossfade and ramp between segments."""
+
+        def constant(value: int, duration_ms: int) -> AudioSegment:
+            samples = np.full(duration_ms * 44, value, dtype=np.int16)
+            return AudioSegment(
+                samples.tobytes(), frame_rate=44000, sample_width=2, channels=1
+            )
+
+        joined = mix_creator._join_with_crossfades(
+            [constant(1000, 100), constant(-1000, 100)], [50]
+        )
+
+        samples = np.frombuffer(joined.raw_data, dtype=np.int16)
+        assert len(joined) == 150
+        assert (samples[: 50 * 44] == 1000).all()
+        assert (samples[100 * 44 :] == -1000).all()
+        fade = samples[50 * 44 : 100 * 44]
+        assert (np.diff(fade) <= 0).all()
+        assert fade[0] == 1000
+
+        trimmed = mix_creator._join_with_crossfades(
+            [constant(1000, 100), constant(-1000, 100)], [50], duration_ms=75
+        )
+        assert trimmed.raw_data == joined[:75].raw_data
+
+    def test_load_normalized_reuses_decode(
+        self, mix_creator: MixCreator, temp_dir: Path
+    ):
+        """Test decoded files are reused until the file changes."""
+        audio_path = temp_dir / "cached.wav"
+        AudioSegment.silent(duration=100).export(audio_path, format="wav")
+
+        first = mix_creator._load_normalized(str(audio_path))
+        assert mix_creator._load_normalized(str(audio_path)) is first
+
+        AudioSegment.silent(duration=200).export(audio_path, format="wav")
+        reloaded = mix_creator._load_normalized(str(audio_path))
+        assert reloaded is not first
+        assert len(reloaded) == 200
+
+        mix_creator.clear_decode_cache()
+        assert mix_creator._load_normalized(str(audio_path)) is not reloaded
+
+    def test_load_normalized_bounds_cached_bytes(
+        self, mix_creator: MixCreator, temp_dir: Path, monkeypatch
+    ):
+        """Test the decode cache evicts old clips and skips oversized ones."""
+        short_path = temp_dir / "short.wav"
+        other_path = temp_dir / "other.wav"
+        long_path = temp_dir / "long.wav"
+        AudioSegment.silent(duration=100).export(short_path, format="wav")
+        AudioSegment.silent(duration=100).export(other_path, format="wav")
+        AudioSegment.silent(duration=300).export(long_path, format="wav")
+        clip_bytes = len(AudioSegment.from_file(str(short_path)).raw_data)
+        monkeypatch.setattr(
+            mix_creator_module, "DECODE_CACHE_BYTES", int(clip_bytes * 1.5)
+        )
+
+        short = mix_creator._load_normalized(str(short_path))
+        other = mix_creator._load_normalized(str(other_path))
+        assert mix_creator._load_normalized(str(other_path)) is other
+        assert mix_creator._load_normalized(str(short_path)) is not short
+
+        long = mix_creator._load_normalized(str(long_path))
+        assert mix_creator._load_normalized(str(long_path)) is not long
+        assert mix_creator._decode_cache_bytes <= int(clip_bytes * 1.5)
+
+    def test_load_normalized_skips_loud_files(
+        self, mix_creator: MixCreator, temp_dir: Path
+    ):
+        """Test files peaking near full scale are used as decoded."""
+
+        def tone(peak: int) -> AudioSegment:
+            samples = np.tile(np.array([peak, -peak], dtype=np.int16), 500)
+            return AudioSegment(
+                samples.tobytes(), frame_rate=44000, sample_width=2, channels=1
+            )
+
+        loud_path = temp_dir / "loud.wav"
+        quiet_path = temp_dir / "quiet.wav"
+        tone(32760).export(loud_path, format="wav")
+        tone(1000).export(quiet_path, format="wav")
+
+        loud = mix_creator._load_normalized(str(loud_path))
+        quiet = mix_creator._load_normalized(str(quiet_path))
+
+        assert loud.max == 32760
+        assert quiet.max_dBFS == pytest.approx(-0.1, abs=0.01)
+
     def test_apply_mix_effects(self, mix_creator: MixCreator, mock_audio_file: Path):
         """Test applying effects to mix."""
         # Create a base mix first
@@ -122,6 +228,43 @@ class TestMixCreator:
         assert isinstance(processed, AudioSegment)
         assert len(processed) == len(audio)  # Effects shouldn't change duration
 
+    def test_generate_binaural_beats(self, mix_creator: MixCreator):
+        """Test binaural beats carry one sine tone per channel."""
+        beats = mix_creator._generate_binaural_beats(
+            duration_ms=1000, base_freq=200.0, beat_freq=5.0, volume=0.0
+        )
+
+        assert beats.channels == 2
+        assert len(beats) == 1000
+        samples = np.frombuffer(beats.raw_data, dtype=np.int16).reshape(-1, 2)
+        t = np.arange(len(samples)) / beats.frame_rate
+        expected = np.stack(
+            [np.sin(2 * np.pi * 200.0 * t), np.sin(2 * np.pi * 205.0 * t)], axis=1
+        )
+        np.testing.assert_allclose(samples / 32767, expected, atol=1e-3)
+
+    def test_filters_match_pydub(self):
+        """Test the array filters reproduce pydub's RC filters exactly."""
+        rng = np.random.default_rng(0)
+        noise = rng.integers(-8000, 8000, size=(4410, 2), dtype=np.int16)
+        audio = AudioSegment(
+            noise.tobytes(), frame_rate=44100, sample_width=2, channels=2
+        )
+
+        low = mix_creator_module._low_pass_filter(audio, 4000)
+        high = mix_creator_module._high_pass_filter(audio, 500)
+
+        assert low.raw_data == audio.low_pass_filter(4000).raw_data
+        assert high.raw_data == audio.high_pass_filter(500).raw_data
+
+    def test_export_parameters(self):
+        """Test encoders get a thread count and wav output skips ffmpeg."""
+        assert mix_creator_module._export_parameters("mp3") == [
+            "-threads",
+            str(os.cpu_count() or 1),
+        ]
+        assert mix_creator_module._export_parameters("wav") is None
+
     def test_preview_mix(self, mix_creator: MixCreator, mock_audio_file: Path):
         """Test mix preview generation."""
         audio_files = {
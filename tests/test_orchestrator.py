@@ -3,7 +3,7 @@
 import os
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -38,10 +38,23 @@ class TestAutotubeOrchestrator:
         assert orchestrator._youtube_uploader is None
         assert orchestrator._metadata_generator is None
 
-    def test_directories_created(self, orchestrator, temp_dir):
-        """Test that directories are created on init."""
+    def test_directories_created_on_first_use(self, orchestrator, temp_dir):
+        """Test that directories are created by the steps that use them."""
+        assert not os.path.exists(temp_dir / "input")
+        assert not os.path.exists(temp_dir / "output")
+        assert not os.path.exists(temp_dir / "videos")
+
+        orchestrator._sound_processor = MagicMock()
+        orchestrator._sound_processor.create_mix.return_value = None
+        orchestrator.create_audio_mix()
         assert os.path.exists(temp_dir / "input")
         assert os.path.exists(temp_dir / "output")
+
+        audio_path = temp_dir / "output" / "mix.mp3"
+        audio_path.touch()
+        orchestrator._video_generator = MagicMock()
+        orchestrator._video_generator.generate_video_from_audio.return_value = None
+        orchestrator.create_video_from_mix(str(audio_path))
         assert os.path.exists(temp_dir / "videos")
 
     def test_lazy_loading_metadata_generator(self, orchestrator):
@@ -51,6 +64,24 @@ class TestAutotubeOrchestrator:
         assert generator is not None
         assert orchestrator._metadata_generator is not None
 
+    def test_prefetch_components(self, temp_dir, monkeypatch):
+        """Test components are created in the background when prefetching."""
+        from project_name.core.orchestrator import AutotubeOrchestrator
+
+        # SoundProcessor creates its default folders relative to the cwd
+        monkeypatch.chdir(temp_dir)
+        orchestrator = AutotubeOrchestrator(
+            input_folder=str(temp_dir / "input"),
+            output_folder=str(temp_dir / "output"),
+            video_folder=str(temp_dir / "videos"),
+            prefetch=True,
+        )
+        orchestrator._prefetch_thread.join(timeout=60)
+
+        generator = orchestrator._metadata_generator
+        assert generator is not None
+        assert orchestrator.metadata_generator is generator
+
     def test_generate_metadata(self, orchestrator):
         """Test metadata generation via orchestrator."""
         metadata = orchestrator.generate_metadata(
@@ -71,6 +102,22 @@ class TestAutotubeOrchestrator:
         assert "input_files" in status
         assert "components" in status
 
+    def test_get_status_counts_files(self, orchestrator, temp_dir):
+        """Test file counts follow changes to the folders."""
+        assert orchestrator.get_status()["input_files"] == 0
+
+        (temp_dir / "input").mkdir()
+        (temp_dir / "videos").mkdir()
+        (temp_dir / "input" / "a.wav").touch()
+        (temp_dir / "input" / "b.wav").touch()
+        assert orchestrator.get_status()["input_files"] == 2
+
+        (temp_dir / "input" / "a.wav").unlink()
+        assert orchestrator.get_status()["input_files"] == 1
+
+        os.rmdir(temp_dir / "videos")
+        assert orchestrator.get_status()["video_files"] == 0
+
     def test_plan_content_default(self, orchestrator):
         """Test content planning with defaults."""
         plan = orchestrator.plan_content(num_videos=3)
@@ -106,6 +153,36 @@ class TestAutotubeOrchestrator:
         assert plan[1]["purpose"] == "y"
         assert plan[2]["purpose"] == "z"
 
+    def test_plan_content_schedules_daily(self, orchestrator):
+        """Test videos are scheduled on consecutive days from the start date."""
+        from datetime import datetime
+
+        plan = orchestrator.plan_content(
+            num_videos=3, start_date=datetime(2024, 2, 28, 21, 30)
+        )
+        assert [item["scheduled_date"] for item in plan] == [
+            "2024-02-28",
+            "2024-02-29",
+            "2024-03-01",
+        ]
+
+    def test_plan_content_looks_up_publish_times_once(self, orchestrator):
+        """Test publish times are looked up once per distinct purpose."""
+        from project_name.core.metadata_generator import MetadataGenerator
+
+        generator = MetadataGenerator()
+        lookup = MagicMock(wraps=generator.get_optimal_publish_time)
+        generator.get_optimal_publish_time = lookup
+        orchestrator._metadata_generator = generator
+
+        plan = orchestrator.plan_content(
+            num_videos=30, purposes=["sleep", "focus", "sleep"]
+        )
+
+        assert lookup.call_count == 2
+        assert plan[0]["optimal_time"] == "20:00"
+        assert plan[1]["optimal_time"] == "08:00"
+
 
 class TestAutotubeOrchestratorMocked:
     """Test AutotubeOrchestrator with mocked components."""
@@ -164,43 +241,55 @@ class TestAutotubeOrchestratorMocked:
 
         assert result is None
 
-    @patch("os.path.exists")
-    def test_create_video_from_mix_success(
-        self, mock_exists, mock_orchestrator, temp_dir
-    ):
+    def test_create_video_from_mix_success(self, mock_orchestrator, temp_dir):
         """Test successful video creation."""
-        mock_exists.return_value = True
+        audio_path = temp_dir / "audio.mp3"
+        audio_path.touch()
         video_path = str(temp_dir / "videos" / "test.mp4")
+        Path(video_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(video_path).write_bytes(b"video")
         mock_orchestrator._video_generator.generate_video_from_audio.return_value = (
             video_path
         )
 
         result = mock_orchestrator.create_video_from_mix(
-            audio_path=str(temp_dir / "audio.mp3"),
+            audio_path=str(audio_path),
             title_text="Test",
         )
 
         assert result == video_path
 
-    @patch("os.path.exists")
-    def test_create_video_with_waveform(
-        self, mock_exists, mock_orchestrator, temp_dir
-    ):
+    def test_create_video_with_waveform(self, mock_orchestrator, temp_dir):
         """Test video creation with waveform."""
-        mock_exists.return_value = True
+        audio_path = temp_dir / "audio.mp3"
+        audio_path.touch()
         video_path = str(temp_dir / "videos" / "test_waveform.mp4")
+        Path(video_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(video_path).write_bytes(b"video")
         mock_orchestrator._video_generator.generate_video_with_waveform.return_value = (
             video_path
         )
 
         result = mock_orchestrator.create_video_from_mix(
-            audio_path=str(temp_dir / "audio.mp3"),
+            audio_path=str(audio_path),
             use_waveform=True,
         )
 
         assert result == video_path
         mock_orchestrator._video_generator.generate_video_with_waveform.assert_called()
 
+    def test_create_video_missing_output(self, mock_orchestrator, temp_dir):
+        """Test a reported video path that was never written counts as failure."""
+        audio_path = temp_dir / "audio.mp3"
+        audio_path.touch()
+        mock_orchestrator._video_generator.generate_video_from_audio.return_value = (
+            str(temp_dir / "videos" / "missing.mp4")
+        )
+
+        result = mock_orchestrator.create_video_from_mix(audio_path=str(audio_path))
+
+        assert result is None
+
     def test_upload_video_success(self, mock_orchestrator, temp_dir):
         """Test successful video upload."""
         mock_orchestrator._youtube_uploader.upload_video.return_value = "abc123"
@@ -226,6 +315,40 @@ class TestAutotubeOrchestratorMocked:
 
         assert result is None
 
+    def test_upload_videos(self, mock_orchestrator, temp_dir):
+        """Test batch upload returns video IDs in input order."""
+        uploader = mock_orchestrator._youtube_uploader
+        uploader.upload_video.side_effect = lambda **kwargs: (
+            None if kwargs["title"] == "Second" else kwargs["title"].lower()
+        )
+        items = [
+            {
+                "video_path": str(temp_dir / f"{title}.mp4"),
+                "title": title,
+                "description": "Test Description",
+            }
+            for title in ("First", "Second", "Third")
+        ]
+
+        result = mock_orchestrator.upload_videos(items, max_concurrency=2)
+
+        assert result == ["first", None, "third"]
+        uploader.authenticate.assert_called_once()
+        assert uploader.upload_video.call_count == 3
+        assert mock_orchestrator.upload_videos([]) == []
+
+    def test_upload_videos_authentication_failure(self, mock_orchestrator):
+        """Test batch upload skips uploading when authentication fails."""
+        uploader = mock_orchestrator._youtube_uploader
+        uploader.authenticate.return_value = False
+
+        result = mock_orchestrator.upload_videos(
+            [{"video_path": "a.mp4", "title": "A", "description": ""}] * 2
+        )
+
+        assert result == [None, None]
+        uploader.upload_video.assert_not_called()
+
 
 class TestAutotubeOrchestratorPipeline:
     """Test the full pipeline functionality."""
@@ -236,6 +359,42 @@ class TestAutotubeOrchestratorPipeline:
         with tempfile.TemporaryDirectory() as tmp_dir:
             yield Path(tmp_dir)
 
+    @pytest.fixture
+    def pipeline_orchestrator(self, temp_dir):
+        """Create an orchestrator whose mocked components produce real files."""
+        from project_name.core.orchestrator import AutotubeOrchestrator
+
+        orchestrator = AutotubeOrchestrator(
+            input_folder=str(temp_dir / "input"),
+            output_folder=str(temp_dir / "output"),
+            video_folder=str(temp_dir / "videos"),
+        )
+        orchestrator._sound_processor = MagicMock()
+        orchestrator._video_generator = MagicMock()
+        orchestrator._youtube_uploader = MagicMock()
+
+        audio_path = temp_dir / "output" / "mix.mp3"
+        video_path = temp_dir / "videos" / "video.mp4"
+        for path in (audio_path, video_path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        orchestrator._sound_processor.create_mix.return_value = str(audio_path)
+        orchestrator._video_generator.generate_video_from_audio.return_value = str(
+            video_path
+        )
+
+        return orchestrator
+
+    @pytest.mark.parametrize(
+        "duration_minutes, expected",
+        [(0, 1), (30, 1), (60, 1), (89, 1), (90, 2), (150, 3), (480, 8)],
+    )
+    def test_duration_hours(self, duration_minutes, expected):
+        """Test mix durations round to the nearest hour for metadata."""
+        from project_name.core.orchestrator import _duration_hours
+
+        assert _duration_hours(duration_minutes) == expected
+
     def test_run_full_pipeline_no_upload(self, temp_dir):
         """Test pipeline without upload."""
         from project_name.core.orchestrator import AutotubeOrchestrator
@@ -275,3 +434,79 @@ class TestAutotubeOrchestratorPipeline:
         assert results["video_path"] == video_path
         assert results["video_id"] is None  # No upload
         assert results["metadata"] is not None
+
+    def test_run_full_pipeline_overlaps_mix_and_metadata(self, pipeline_orchestrator):
+        """Test metadata is generated while the audio mix is being created."""
+        import threading
+
+        orchestrator = pipeline_orchestrator
+        orchestrator._metadata_generator = MagicMock()
+        audio_path = orchestrator._sound_processor.create_mix.return_value
+
+        metadata_started = threading.Event()
+
+        def generate_metadata(**kwargs):
+            metadata_started.set()
+            return {"title": "Rain", "description": "", "tags": []}
+
+        def create_mix(**kwargs):
+            # Only succeeds if metadata generation runs concurrently
+            return audio_path if metadata_started.wait(timeout=5) else None
+
+        orchestrator._metadata_generator.generate_complete_metadata.side_effect = (
+            generate_metadata
+        )
+        orchestrator._sound_processor.create_mix.side_effect = create_mix
+
+        results = orchestrator.run_full_pipeline(upload=False)
+
+        assert results["success"]
+        assert results["metadata"]["title"] == "Rain"
+
+    def test_run_batch_pipeline(self, pipeline_orchestrator):
+        """Test batch runs produce and upload every planned video in order."""
+        from project_name.core.orchestrator import VideoConfig
+
+        orchestrator = pipeline_orchestrator
+        orchestrator._youtube_uploader.upload_video.side_effect = [
+            "id1",
+            None,
+            "id3",
+            "id4",
+        ]
+
+        plans = orchestrator.plan_content(num_videos=4)
+        results = orchestrator.run_batch_pipeline(
+            plans, video_config=VideoConfig(background_color=(0, 0, 0))
+        )
+
+        assert [r["video_id"] for r in results] == ["id1", None, "id3", "id4"]
+        assert [r["success"] for r in results] == [True, False, True, True]
+        assert results[1]["errors"] == ["Failed to upload video"]
+        assert orchestrator._sound_processor.create_mix.call_count == 4
+        video_calls = orchestrator._video_generator.generate_video_from_audio
+        assert all(
+            call.kwargs["background_color"] == (0, 0, 0)
+            for call in video_calls.call_args_list
+        )
+
+    def test_run_full_pipeline_async(self, pipeline_orchestrator):
+        """Test concurrent async pipelines each produce and upload a video."""
+        import asyncio
+
+        orchestrator = pipeline_orchestrator
+        orchestrator._youtube_uploader.upload_video.return_value = "abc123"
+
+        async def run_two():
+            return await asyncio.gather(
+                orchestrator.run_full_pipeline_async(sound_type="Rain"),
+                orchestrator.run_full_pipeline_async(
+                    sound_type="Ocean", mix_type="focus"
+                ),
+            )
+
+        rain, ocean = asyncio.run(run_two())
+
+        assert rain["success"] and ocean["success"]
+        assert rain["video_id"] == ocean["video_id"] == "abc123"
+        assert "Ocean" in ocean["metadata"]["title"]
@@ -184,3 +184,36 @@ class TestSoundProcessor:
             processor._apply_bandpass_filter(audio, -100, 5000)  # Invalid low cutoff
         with pytest.raises(ValueError):
             processor.normalize_audio(audio, 20)  # Invalid target dB (too high)
+
+    def test_clip_features_reused(
+        self, processor: SoundProcessor, mock_audio_file: Path, monkeypatch
+    ):
+        """Test a clip is decoded and analyzed once until it changes."""
+        import shutil
+        from unittest.mock import MagicMock
+
+        clip = shutil.copy(mock_audio_file, processor.processed_folder)
+        load = MagicMock(return_value=(np.zeros(4410, dtype=np.float32), 44100))
+        monkeypatch.setattr("project_name.core.processor.librosa.load", load)
+        for name, features in [
+            ("_extract_audio_features", {"spectral_centroid": 500.0}),
+            ("extract_psychoacoustic_features", {"low_energy": 0.5}),
+            ("analyze_temporal_patterns", {"evenness": 0.9}),
+        ]:
+            monkeypatch.setattr(processor, name, MagicMock(return_value=features))
+
+        basic, psycho, temporal = processor._clip_features(clip)
+        basic["spectral_centroid"] = 0.0
+        processor.classify_with_deep_learning()
+
+        assert load.call_count == 1
+        assert processor._clip_features(clip) == (
+            {"spectral_centroid": 500.0},
+            {"low_energy": 0.5},
+            {"evenness": 0.9},
+        )
+
+        # A changed file is decoded again
+        os.utime(clip, ns=(0, 0))
+        processor._clip_features(clip)
+        assert load.call_count == 2
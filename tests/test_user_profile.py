@@ -134,6 +134,72 @@ class TestUserProfile:
         assert loaded.mix_feedback == profile.mix_feedback
         assert loaded.preferred_sounds == profile.preferred_sounds
 
+    def test_log_feedback_replayed_on_load(
+        self, profile: UserProfile, mock_mix_params: Dict, temp_dir: Path
+    ):
+        """Test that logged feedback is applied when the profile is loaded."""
+        save_path = profile.save(str(temp_dir))
+        profile.log_feedback("mix_1", 9, mock_mix_params, str(temp_dir))
+        profile.log_feedback("mix_2", 2, mock_mix_params, str(temp_dir))
+
+        loaded = UserProfile.load(str(save_path))
+        assert loaded.mix_feedback == {"mix_1": 9, "mix_2": 2}
+
+        # Saving compacts the log into the profile file
+        loaded.save(str(temp_dir))
+        assert not (temp_dir / "test_user.feedback.jsonl").exists()
+        assert UserProfile.load(str(save_path)).mix_feedback == loaded.mix_feedback
+
+    def test_log_replay_skips_saved_events(
+        self, profile: UserProfile, mock_mix_params: Dict, temp_dir: Path
+    ):
+        """Test that events already in the saved profile are not reapplied."""
+        for mix_id, score in [("mix_1", 9), ("mix_2", 8)]:
+            profile.update_from_feedback(mix_id, score, mock_mix_params)
+            profile.log_feedback(mix_id, score, mock_mix_params, str(temp_dir))
+        log_path = temp_dir / "test_user.feedback.jsonl"
+        pending_log = log_path.read_bytes()
+
+        # Simulate a crash after the profile was saved but before the log
+        # was removed
+        save_path = profile.save(str(temp_dir))
+        log_path.write_bytes(pending_log)
+
+        loaded = UserProfile.load(str(save_path))
+        assert loaded.category_weights == profile.category_weights
+        assert loaded.log_seq == 2
+
+    def test_log_ab_test_result_replayed_on_load(
+        self, profile: UserProfile, temp_dir: Path
+    ):
+        """Test that logged A/B results are applied when the profile is loaded."""
+        save_path = profile.save(str(temp_dir))
+        profile.log_ab_test_result(
+            "abtest_test_user_1",
+            "A",
+            {"eq_settings": {"low": 3.0}},
+            {"eq_settings": {"low": -3.0}},
+            str(temp_dir),
+        )
+
+        loaded = UserProfile.load(str(save_path))
+        assert loaded.ab_test_results == {"abtest_test_user_1": "A"}
+        assert loaded.eq_preferences["low"] == pytest.approx(0.9)
+
+    def test_load_returns_independent_profiles(
+        self, profile: UserProfile, temp_dir: Path
+    ):
+        """Test that repeated loads do not share mutable state."""
+        save_path = profile.save(str(temp_dir))
+
+        first = UserProfile.load(str(save_path))
+        first.category_weights["rain"] = 0.0
+        first.preferred_sounds.append("thunder.wav")
+
+        second = UserProfile.load(str(save_path))
+        assert second.category_weights["rain"] == profile.category_weights["rain"]
+        assert second.preferred_sounds == []
+
     def test_load_nonexistent(self, temp_dir: Path):
         """Test loading non-existent profile."""
         nonexistent = temp_dir / "nonexistent_profile.json"